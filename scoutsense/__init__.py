@@ -14,7 +14,7 @@ Modules:
 
 Quick Start:
     >>> from scoutsense.utils.data_loader import load_draft_data
-    >>> from scoutsense.utils.feature_engineering import engineer_features
+    >>> from scoutsense.utils.feature_engineering import engineer_features, FeaturePipeline
     >>> from scoutsense.utils.models import DraftPositionPredictor
     >>> 
     >>> df = load_draft_data('data.csv')
@@ -22,24 +22,44 @@ Quick Start:
     >>> predictor = DraftPositionPredictor()
     >>> predictor.train(df_eng)
     >>> prediction = predictor.predict(player_data)
+    >>>
+    >>> # Score new prospects with the statistics learned from history
+    >>> pipeline = FeaturePipeline().fit(df)
+    >>> prospect_features = pipeline.transform(prospect_rows)
+
+Command line (batch-scores a prospect file, or serves the persisted models over HTTP):
+    $ python -m scoutsense score prospects.csv -o predictions.parquet
+    $ python -m scoutsense serve --port 8765
 """
 
 __version__ = "1.0.0"
 __author__ = "ScoutSense Team"
 __license__ = "MIT"
 
-from scoutsense.utils.data_loader import load_draft_data
-from scoutsense.utils.feature_engineering import engineer_features
-from scoutsense.utils.models import (
-    DraftPositionPredictor,
-    PlayerSuccessClassifier,
-    PlayerComparison,
-)
-
-__all__ = [
-    "load_draft_data",
-    "engineer_features",
-    "DraftPositionPredictor",
-    "PlayerSuccessClassifier",
-    "PlayerComparison",
-]
+import importlib
+
+# Public name -> defining module. Submodules (and pandas/scikit-learn behind
+# them) are imported on first attribute access, so `import scoutsense` stays cheap.
+_LAZY_EXPORTS = {
+    "load_draft_data": "scoutsense.utils.data_loader",
+    "engineer_features": "scoutsense.utils.feature_engineering",
+    "FeaturePipeline": "scoutsense.utils.feature_engineering",
+    "DraftPositionPredictor": "scoutsense.utils.models",
+    "PlayerSuccessClassifier": "scoutsense.utils.models",
+    "PlayerComparison": "scoutsense.utils.models",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
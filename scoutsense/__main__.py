@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+ScoutSense command line
+
+Usage:
+    python -m scoutsense score prospects.csv -o predictions.parquet
+    python -m scoutsense score prospects.parquet -o predictions.csv --chunk-size 100000
+    python -m scoutsense serve --port 8765
+"""
+
+import argparse
+import sys
+import time
+
+from scoutsense.utils.models import DEFAULT_ARTIFACT_DIR, DEFAULT_PREDICTOR_ENGINE, PREDICTOR_ENGINES
+from scoutsense.utils.scoring import format_timings, score_file
+from scoutsense.utils.service import DEFAULT_MAX_BATCH_ROWS, DEFAULT_MAX_WAIT_MS, PredictionService, make_server
+
+
+def _score(args):
+    """`score`: batch-score a prospect file with the persisted models"""
+    print("="*80)
+    print(f"SCOUTSENSE: Scoring {args.input}")
+    print("="*80)
+
+    start = time.perf_counter()
+    n_rows, timings = score_file(args.input, args.output, artifact_dir=args.artifacts,
+                                 chunk_size=args.chunk_size, success_threshold=args.success_threshold,
+                                 engine=args.engine, fill_missing=args.fill_missing)
+    elapsed = time.perf_counter() - start
+
+    print(f"\nWrote {n_rows} predictions to {args.output}\n")
+    print(format_timings(n_rows, timings))
+    print(f"\nWall time (including model loading): {elapsed:.2f} s")
+    return 0
+
+
+def _serve(args):
+    """`serve`: load the models once and answer predict/similar requests over HTTP"""
+    print("="*80)
+    print("SCOUTSENSE: Prediction Service")
+    print("="*80)
+
+    service = PredictionService(artifact_dir=args.artifacts, success_threshold=args.success_threshold,
+                                engine=args.engine, fill_missing=args.fill_missing,
+                                max_batch_rows=args.max_batch, max_wait_ms=args.max_wait_ms)
+    server = make_server(service, args.host, args.port)
+    host, port = server.server_address[:2]
+    print(f"\nServing on http://{host}:{port} "
+          f"(micro-batches of up to {args.max_batch} rows, {args.max_wait_ms:g} ms wait)", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nShutting down")
+    finally:
+        server.server_close()
+        service.close()
+    return 0
+
+
+def _add_model_args(parser):
+    """Options selecting which persisted artifacts to load"""
+    parser.add_argument('--artifacts', default=str(DEFAULT_ARTIFACT_DIR), help='Model artifact directory')
+    parser.add_argument('--success-threshold', type=int, default=5, help='Classifier round threshold')
+    parser.add_argument('--engine', choices=list(PREDICTOR_ENGINES), default=DEFAULT_PREDICTOR_ENGINE,
+                        help='Predictor engine whose artifact to load')
+    parser.add_argument('--fill-missing', action='store_true',
+                        help='Fill model feature columns the pipeline does not produce with training '
+                             'medians (logged) instead of failing')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='scoutsense', description="ScoutSense NFL draft models")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    score = commands.add_parser('score', help='Batch-score a CSV/Parquet file of prospects')
+    score.add_argument('input', help='Prospect file (.csv or .parquet) with the raw draft columns')
+    score.add_argument('-o', '--output', required=True, help='Predictions file (.csv or .parquet)')
+    score.add_argument('--chunk-size', type=int, default=50000, help='Rows read and scored at a time')
+    _add_model_args(score)
+    score.set_defaults(handler=_score)
+
+    serve = commands.add_parser('serve', help='Serve predict/similar requests over HTTP')
+    serve.add_argument('--host', default='127.0.0.1', help='Interface to bind')
+    serve.add_argument('--port', type=int, default=8765, help='Port to bind (0 picks a free one)')
+    serve.add_argument('--max-batch', type=int, default=DEFAULT_MAX_BATCH_ROWS,
+                       help='Rows at which a micro-batch is scored (1 disables coalescing)')
+    serve.add_argument('--max-wait-ms', type=float, default=DEFAULT_MAX_WAIT_MS,
+                       help='Longest a request waits for others to join its micro-batch')
+    _add_model_args(serve)
+    serve.set_defaults(handler=_serve)
+
+    args = parser.parse_args(argv)
+    try:
+        return args.handler(args)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"ERROR: {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
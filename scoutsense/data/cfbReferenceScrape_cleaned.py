@@ -5,57 +5,218 @@ Scrapes player statistics from College Football Reference website
 """
 import sys
 import re
+import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
 try:
     import pandas as pd
     import requests
-    import bs4
+    from requests.adapters import HTTPAdapter
+    import lxml.html
 except ImportError:
-    print("Required modules not found. Please install pandas, requests, and bs4.")
+    print("Required modules not found. Please install pandas, requests, bs4, and lxml.")
     sys.exit(1)
 
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.checkpoint import JsonlCheckpoint
+
+# Player stat tables pulled from each player page
+STAT_TABLES = ['defense', 'rushing', 'receiving', 'kick_ret', 'punt_ret']
+
+# Column indices to extract from each stat table
+STAT_COLUMNS = {
+    'receiving': [0, 1, 2, 5, 6, 7, 9, 10, 11, 13],
+    'rushing': [0, 1, 2, 5, 6, 7, 9, 10, 11, 13],
+    'kick_ret': [0, 1, 2, 5, 6, 7, 9, 10, 11, 13],
+    'punt_ret': [0, 1, 2, 5, 6, 7, 9, 10, 11, 13],
+    'defense': [0, 1, 2, 5, 6, 7, 9, 10, 11, 14, 15, 19, 16, 18]
+}
+
+# Work around HTML comments (CFB Reference hides most tables inside them)
+COMMENT_RE = re.compile("<!--|-->")
+
+# Opening or closing <table> tag, for matching a table's own close tag past nested tables
+TABLE_TAG_RE = re.compile(r'<(/?)table\b[^>]*>', re.IGNORECASE)
+
+# Table extraction engines: 'lxml' slices out just the target table and
+# parses it with lxml.html; 'bs4' parses the whole page with BeautifulSoup
+ENGINES = ('lxml', 'bs4')
+DEFAULT_ENGINE = 'lxml'
 
-def pull_table(url, table_id, header=False):
+
+def make_session(pool_size=10):
     """
-    Extract table data from a College Football Reference page.
+    Create a requests.Session whose connection pool can serve pool_size workers.
     
     Args:
-        url: URL of the page to scrape
+        pool_size: Maximum number of pooled keep-alive connections per host
+        
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def fetch_page(url, session=None):
+    """Download a page (over session if given) and return its text"""
+    res = (session or requests).get(url)
+    res.raise_for_status()
+    return res.text
+
+
+def parse_page(html):
+    """Parse a page once (with comments unwrapped) into a BeautifulSoup tree"""
+    # Only the 'bs4' engine needs BeautifulSoup, so it is imported on first use
+    import bs4
+    return bs4.BeautifulSoup(COMMENT_RE.sub("", html), 'lxml')
+
+
+def _apply_header(data, header_list):
+    """Use header_list as column names and drop repeated header rows"""
+    if header_list:
+        data.columns = header_list
+        # Remove duplicate header rows
+        data = data.loc[data[header_list[0]] != header_list[0]]
+    
+    data = data.reset_index(drop=True)
+    return data
+
+
+def _soup_header(table, n_cols):
+    """Text of the first n_cols <th> cells in the table's first header row (or None)"""
+    data_header = table.find_all('thead')
+    if data_header:
+        data_header = data_header[0].find_all("tr")
+        if data_header:
+            data_header = data_header[0].find_all("th")
+            return [data_header[i].getText() for i in range(n_cols)]
+    return None
+
+
+def table_from_soup(soup, table_id, header=False, links=False):
+    """
+    Extract table data from an already-parsed page.
+    
+    Args:
+        soup: BeautifulSoup tree from parse_page
         table_id: HTML id of the table to extract
         header: Whether to use the table's header row as column names
+        links: Extract each row's hyperlinks instead of its cell text
         
     Returns:
         DataFrame with the extracted table data
     """
-    res = requests.get(url)
-    # Work around HTML comments
-    comm = re.compile("<!--|-->")
-    soup = bs4.BeautifulSoup(comm.sub("", res.text), 'lxml')
-    tables = soup.findAll('table', id=table_id)
+    tables = soup.find_all('table', id=table_id)
     
     if not tables:
         return pd.DataFrame()
     
-    data_rows = tables[0].findAll('tr')
-    game_data = [[td.getText() for td in data_rows[i].findAll(['th', 'td'])]
-                 for i in range(len(data_rows))]
+    data_rows = tables[0].find_all('tr')
+    if links:
+        game_data = [[td.get('href') for td in row.find_all(['a'])] for row in data_rows]
+    else:
+        game_data = [[td.getText() for td in row.find_all(['th', 'td'])] for row in data_rows]
+    data = pd.DataFrame(game_data)
+    
+    header_list = _soup_header(tables[0], len(data.columns)) if header else None
+    return _apply_header(data, header_list)
+
+
+def _table_fragment(html, table_id):
+    """
+    Locate <table id="table_id">...</table> in raw HTML and parse only that slice.
+    
+    Works whether or not the table sits inside an HTML comment, so the
+    document-wide comment strip and full-page parse are skipped entirely.
+    The slice runs to the table's own close tag, past any nested tables.
+    """
+    # The id attribute must follow whitespace, so data-id="..." does not match
+    match = re.search(r'<table\b[^>]*?\sid\s*=\s*["\']?' + re.escape(table_id) + r'["\'\s>]', html)
+    if not match:
+        return None
+    end = len(html)
+    depth = 0
+    for tag in TABLE_TAG_RE.finditer(html, match.start()):
+        depth += -1 if tag.group(1) else 1
+        if depth == 0:
+            end = tag.end()
+            break
+    return lxml.html.fragment_fromstring(html[match.start():end])
+
+
+def fast_table(html, table_id, header=False, links=False):
+    """
+    Extract table data straight from raw page HTML using lxml.html/XPath.
+    
+    Same arguments and output as table_from_soup, but takes the page text.
+    """
+    table = _table_fragment(html, table_id)
+    if table is None:
+        return pd.DataFrame()
+    
+    data_rows = table.xpath('.//tr')
+    if links:
+        # One entry per anchor (None without an href), as table_from_soup gives
+        game_data = [[a.get('href') for a in row.xpath('.//a')] for row in data_rows]
+    else:
+        game_data = [[cell.text_content() for cell in row.xpath('.//th|.//td')] for row in data_rows]
     data = pd.DataFrame(game_data)
     
+    header_list = None
     if header:
-        data_header = tables[0].findAll('thead')
-        if data_header:
-            data_header = data_header[0].findAll("tr")
-            if data_header:
-                data_header = data_header[0].findAll("th")
-                header_list = [data_header[i].getText() for i in range(len(data.columns))]
-                data.columns = header_list
-                # Remove duplicate header rows
-                data = data.loc[data[header_list[0]] != header_list[0]]
+        header_cells = table.xpath('(.//thead)[1]/tr[1]/th')
+        if header_cells:
+            header_list = [header_cells[i].text_content() for i in range(len(data.columns))]
+    return _apply_header(data, header_list)
+
+
+def read_tables(html, table_ids, engine=DEFAULT_ENGINE):
+    """
+    Extract several tables from one downloaded page.
     
-    data = data.reset_index(drop=True)
-    return data
+    Args:
+        html: Page text
+        table_ids: Iterable of table ids
+        engine: 'lxml' (targeted extraction) or 'bs4' (single full-page parse)
+        
+    Returns:
+        Dict mapping table id -> DataFrame (empty if the table is missing)
+    """
+    if engine == 'lxml':
+        return {table_id: fast_table(html, table_id) for table_id in table_ids}
+    if engine == 'bs4':
+        soup = parse_page(html)
+        return {table_id: table_from_soup(soup, table_id) for table_id in table_ids}
+    raise ValueError(f"Unknown engine {engine!r} (expected one of {ENGINES})")
+
+
+def pull_table(url, table_id, header=False, session=None, engine=DEFAULT_ENGINE):
+    """
+    Extract table data from a College Football Reference page.
+    
+    Args:
+        url: URL of the page to scrape
+        table_id: HTML id of the table to extract
+        header: Whether to use the table's header row as column names
+        session: Optional requests.Session to reuse pooled connections
+        engine: 'lxml' (targeted extraction) or 'bs4' (full BeautifulSoup parse)
+        
+    Returns:
+        DataFrame with the extracted table data
+    """
+    html = fetch_page(url, session)
+    if engine == 'lxml':
+        return fast_table(html, table_id, header)
+    return table_from_soup(parse_page(html), table_id, header)
 
 
-def pull_links(url, table_id, header=False):
+def pull_links(url, table_id, header=False, session=None, engine=DEFAULT_ENGINE):
     """
     Extract hyperlinks from a table on a College Football Reference page.
     
@@ -63,37 +224,108 @@ def pull_links(url, table_id, header=False):
         url: URL of the page to scrape
         table_id: HTML id of the table to extract
         header: Whether to use the table's header row as column names
+        session: Optional requests.Session to reuse pooled connections
+        engine: 'lxml' (targeted extraction) or 'bs4' (full BeautifulSoup parse)
         
     Returns:
         DataFrame with hyperlinks from the table
     """
-    res = requests.get(url)
-    # Work around HTML comments
-    comm = re.compile("<!--|-->")
-    soup = bs4.BeautifulSoup(comm.sub("", res.text), 'lxml')
-    tables = soup.findAll('table', id=table_id)
+    html = fetch_page(url, session)
+    if engine == 'lxml':
+        return fast_table(html, table_id, header, links=True)
+    return table_from_soup(parse_page(html), table_id, header, links=True)
+
+
+def extract_player_stats(url, tables):
+    """
+    Build one output row for a player from its extracted stat tables.
     
-    if not tables:
-        return pd.DataFrame()
+    For each table in STAT_TABLES the table name is followed by the
+    STAT_COLUMNS values of its career-total row (blank if missing).
     
-    data_rows = tables[0].findAll('tr')
-    game_data = [[td.get('href') for td in data_rows[i].findAll(['a'])]
-                 for i in range(len(data_rows))]
-    data = pd.DataFrame(game_data)
+    Args:
+        url: Player page URL (first value of the row)
+        tables: Dict of table id -> DataFrame, as returned by read_tables
+    """
+    player_list = [url]
     
-    if header:
-        data_header = tables[0].findAll('thead')
-        if data_header:
-            data_header = data_header[0].findAll("tr")
-            if data_header:
-                data_header = data_header[0].findAll("th")
-                header_list = [data_header[i].getText() for i in range(len(data.columns))]
-                data.columns = header_list
-                # Remove duplicate header rows
-                data = data.loc[data[header_list[0]] != header_list[0]]
+    for stat_table in STAT_TABLES:
+        player_list.append(stat_table)
+        columns = STAT_COLUMNS.get(stat_table, [])
+        
+        try:
+            table_data = tables.get(stat_table, pd.DataFrame())
+            if not table_data.empty and len(table_data) > 1:
+                # Extract the last row of stats
+                for col_idx in columns:
+                    if col_idx < len(table_data.columns):
+                        player_list.append(table_data.iloc[len(table_data) - 2, col_idx])
+                    else:
+                        player_list.append('')
+            else:
+                # No data found, add empty values
+                for _ in columns:
+                    player_list.append('')
+        except Exception:
+            # Error reading table, add empty values
+            for _ in columns:
+                player_list.append('')
     
-    data = data.reset_index(drop=True)
-    return data
+    return player_list
+
+
+def _scrape_player(url, session=None, engine=DEFAULT_ENGINE):
+    """scrape_player, also returning whether the page was fetched successfully"""
+    try:
+        tables = read_tables(fetch_page(url, session), STAT_TABLES, engine)
+    except Exception:
+        # Error fetching page, add empty values for every table
+        return extract_player_stats(url, {}), False
+    return extract_player_stats(url, tables), True
+
+
+def scrape_player(url, session=None, engine=DEFAULT_ENGINE):
+    """Fetch a player page once, then pull all STAT_TABLES from it"""
+    return _scrape_player(url, session, engine)[0]
+
+
+def scrape_players(player_urls, max_workers=8, session=None, engine=DEFAULT_ENGINE, checkpoint=None):
+    """
+    Scrape many player pages concurrently over a shared, pooled session.
+    
+    With a checkpoint, players already recorded are skipped and each newly
+    scraped player is appended as soon as it completes, so a crash or rerun
+    only fetches players that are not yet in the checkpoint.
+    
+    Args:
+        player_urls: List of player page URLs
+        max_workers: Number of worker threads
+        session: Optional requests.Session (one sized for max_workers is created otherwise)
+        engine: Table extraction engine (see ENGINES)
+        checkpoint: Optional JsonlCheckpoint keyed by player URL
+        
+    Returns:
+        List of player rows, in the same order as player_urls
+    """
+    max_workers = max(1, max_workers)
+    if session is None:
+        session = make_session(pool_size=max_workers)
+    
+    done = {url: checkpoint.get(url) for url in player_urls if checkpoint is not None and url in checkpoint}
+    pending = [url for url in dict.fromkeys(player_urls) if url not in done]
+    if done:
+        print(f"Resuming: {len(done)} player(s) already in checkpoint, {len(pending)} to scrape")
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(_scrape_player, url, session, engine): url for url in pending}
+        for future in as_completed(futures):
+            url = futures[future]
+            done[url], fetched = future.result()
+            # Failed fetches are left out of the checkpoint so the next run retries them
+            if checkpoint is not None and fetched:
+                checkpoint.add(url, done[url])
+    
+    return [done[url] for url in player_urls]
 
 
 def get_column_values(dataframe, column_name):
@@ -112,48 +344,23 @@ def get_column_values(dataframe, column_name):
 
 # Example usage - Pull individual player statistics
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scrape player stats from College Football Reference")
+    parser.add_argument('--workers', type=int, default=8, help='Concurrent player page fetches')
+    parser.add_argument('--engine', choices=ENGINES, default=DEFAULT_ENGINE, help='Table extraction engine')
+    parser.add_argument('--checkpoint', default='dumpfile.checkpoint.jsonl',
+                        help='JSONL checkpoint of completed players')
+    parser.add_argument('--no-checkpoint', action='store_true', help='Scrape every player from scratch')
+    args = parser.parse_args()
+    checkpoint = None if args.no_checkpoint else JsonlCheckpoint(args.checkpoint)
+    
     try:
         url_list = pd.read_csv('temp_url_list.csv')
         player_urls = get_column_values(url_list, 'cfb_reference')
         
-        stat_list = []
-        stat_tables = ['defense', 'rushing', 'receiving', 'kick_ret', 'punt_ret']
-        
-        # Column indices to extract from each stat table
-        stat_columns = {
-            'receiving': [0, 1, 2, 5, 6, 7, 9, 10, 11, 13],
-            'rushing': [0, 1, 2, 5, 6, 7, 9, 10, 11, 13],
-            'kick_ret': [0, 1, 2, 5, 6, 7, 9, 10, 11, 13],
-            'punt_ret': [0, 1, 2, 5, 6, 7, 9, 10, 11, 13],
-            'defense': [0, 1, 2, 5, 6, 7, 9, 10, 11, 14, 15, 19, 16, 18]
-        }
-        
-        for url in player_urls:
-            player_list = [url]
-            
-            for stat_table in stat_tables:
-                player_list.append(stat_table)
-                columns = stat_columns.get(stat_table, [])
-                
-                try:
-                    table_data = pull_table(url, stat_table)
-                    if not table_data.empty and len(table_data) > 1:
-                        # Extract the last row of stats
-                        for col_idx in columns:
-                            if col_idx < len(table_data.columns):
-                                player_list.append(table_data.iloc[len(table_data) - 2, col_idx])
-                            else:
-                                player_list.append('')
-                    else:
-                        # No data found, add empty values
-                        for _ in columns:
-                            player_list.append('')
-                except Exception:
-                    # Error fetching table, add empty values
-                    for _ in columns:
-                        player_list.append('')
-            
-            stat_list.append(player_list)
+        # One download and one parse per player, across a pooled worker set;
+        # players already in the checkpoint are not fetched again
+        stat_list = scrape_players(player_urls, max_workers=args.workers, engine=args.engine,
+                                   checkpoint=checkpoint)
         
         # Write results to CSV
         header = ('cfb_url,defense,year,school,conf,g,tkl,ast_tkl,tfl,sk,int,int_td,pass_def,ff,fr,fr_td,'
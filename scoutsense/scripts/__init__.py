@@ -5,4 +5,15 @@ ScoutSense Scripts: Demo and example scripts
 __all__ = [
     "demo",
     "examples",
+    "benchmark_scoring",
+    "benchmark_table_parsing",
+    "benchmark_loading",
+    "benchmark_ui_latency",
+    "benchmark_engines",
+    "evaluate_models",
+    "benchmark_neighbors",
+    "benchmark_imports",
+    "benchmark_features",
+    "benchmark_memory",
+    "load_test_service",
 ]
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+ScoutSense Benchmark: Feature engineering at scale
+Time and peak memory of FeaturePipeline fit/transform and engineer_features on
+the draft table scaled up synthetically (resampled rows) to 1M players.
+Peak memory is measured with tracemalloc, which sees NumPy buffers but not
+Arrow-backed string storage.
+"""
+
+import argparse
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+from scoutsense.utils.data_loader import load_draft_data
+from scoutsense.utils.feature_engineering import FeaturePipeline, engineer_features
+
+# Data file path
+DATA_FILE = Path(__file__).parent.parent / 'data' / 'nfl_draft_data.csv'
+
+
+def _scaled_draft_table(n_rows, seed=42):
+    """Raw draft table of n_rows players, resampled from the real one"""
+    df = load_draft_data(str(DATA_FILE))
+    rows = np.random.RandomState(seed).randint(0, len(df), n_rows)
+    return df.iloc[rows].reset_index(drop=True)
+
+
+def _measure(fn):
+    """
+    Run fn() twice: timed on its own, then under tracemalloc (whose
+    per-allocation hooks would otherwise distort the timing).
+    
+    Returns:
+        (seconds, peak MB allocated during the call)
+    """
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark feature engineering on a scaled-up draft table")
+    parser.add_argument('--rows', type=int, default=1_000_000, help='Synthetic rows to engineer')
+    args = parser.parse_args(argv)
+
+    print("="*80)
+    print("SCOUTSENSE: Feature Engineering Benchmark")
+    print("="*80)
+
+    df = _scaled_draft_table(args.rows)
+    print(f"\n{len(df)} rows x {df.shape[1]} raw columns "
+          f"({df.memory_usage(deep=True).sum() / 1e6:.1f} MB in memory)")
+
+    pipeline = FeaturePipeline()
+    stages = [
+        ("FeaturePipeline.fit", lambda: pipeline.fit(df)),
+        ("FeaturePipeline.transform", lambda: pipeline.transform(df)),
+        ("engineer_features", lambda: engineer_features(df)),
+    ]
+
+    print(f"\n{'Stage':<28} {'Seconds':>9} {'Rows/sec':>12} {'Peak MB':>9}")
+    print("-" * 62)
+    for name, fn in stages:
+        secs, peak_mb = _measure(fn)
+        print(f"{name:<28} {secs:>9.2f} {len(df) / secs:>12,.0f} {peak_mb:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+ScoutSense Benchmark: Import time
+Measures the cumulative import time of the package and its modules with
+`python -X importtime` (a fresh interpreter per module) and checks that the
+heavy dependencies stay off the import path of the lightweight entry points.
+Exits non-zero on a regression. pytest enforces the same IMPORT_BUDGETS
+(with headroom for noisy machines) in scoutsense/tests/test_imports.py.
+
+Usage:
+    python -m scoutsense.scripts.benchmark_imports
+    python -m scoutsense.scripts.benchmark_imports --repeats 5 --budget-scale 2.0
+"""
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+# Repository root (so the subprocesses import this checkout of scoutsense)
+REPO_ROOT = Path(__file__).parent.parent.parent
+
+# Third-party packages that only specific code paths need
+HEAVY_MODULES = ['sklearn', 'scipy', 'joblib', 'bs4', 'matplotlib', 'requests', 'lxml']
+
+# module -> (cumulative import budget in ms, heavy modules it must not pull in)
+IMPORT_BUDGETS = {
+    'scoutsense': (50, HEAVY_MODULES + ['pandas', 'numpy']),
+    'scoutsense.utils.data_loader': (900, HEAVY_MODULES),
+    'scoutsense.utils.feature_engineering': (900, HEAVY_MODULES),
+    'scoutsense.utils.models': (900, HEAVY_MODULES),
+    'scoutsense.utils.neighbors': (900, HEAVY_MODULES),
+    # UI startup: Matplotlib is only imported once the Analytics tab is opened
+    'scoutsense.ui.app': (1200, HEAVY_MODULES),
+}
+
+
+def _import_profile(module):
+    """
+    Import module in a fresh interpreter under -X importtime.
+
+    Returns:
+        (cumulative microseconds per top-level package, set of modules loaded)
+    """
+    code = f"import sys, {module}; print('\\n'.join(sys.modules))"
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=REPO_ROOT,
+                          capture_output=True, text=True, check=True)
+    cumulative = {}
+    for line in proc.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumul, name = line[len('import time:'):].split('|')
+        # Nested imports are indented; only count a package where it is first pulled in
+        name = name.rstrip()
+        if name.startswith('  ') and name.strip() != module:
+            continue
+        cumulative[name.strip()] = int(cumul)
+    loaded = set(proc.stdout.split())
+    return cumulative, loaded
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark ScoutSense import time")
+    parser.add_argument('--repeats', type=int, default=3, help='Fresh interpreters per module (best is kept)')
+    parser.add_argument('--budget-scale', type=float, default=1.0,
+                        help='Multiply every time budget (for slow machines)')
+    args = parser.parse_args(argv)
+
+    print("="*80)
+    print("SCOUTSENSE: Import Time Benchmark")
+    print("="*80)
+    print(f"\n{'Module':<40} {'Import (ms)':>12} {'Budget (ms)':>12}  Heavy modules loaded")
+    print("-" * 96)
+
+    failures = []
+    for module, (budget_ms, forbidden) in IMPORT_BUDGETS.items():
+        best_ms = float('inf')
+        for _ in range(args.repeats):
+            cumulative, loaded = _import_profile(module)
+            best_ms = min(best_ms, cumulative.get(module, 0) / 1000)
+        budget_ms *= args.budget_scale
+        leaked = sorted(name for name in forbidden if name in loaded)
+        print(f"{module:<40} {best_ms:>12.1f} {budget_ms:>12.0f}  {', '.join(leaked) or '-'}")
+
+        if best_ms > budget_ms:
+            failures.append(f"{module} took {best_ms:.1f} ms (budget {budget_ms:.0f} ms)")
+        if leaked:
+            failures.append(f"{module} imported {', '.join(leaked)}")
+
+    print()
+    if failures:
+        print("IMPORT REGRESSIONS:")
+        for failure in failures:
+            print(f"  - {failure}")
+        return 1
+    print("All imports within budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
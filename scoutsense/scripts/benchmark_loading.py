@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+ScoutSense Benchmark: CSV loading
+Compares load time and memory footprint of a default pd.read_csv against
+the typed loaders (pyarrow engine, categorical text, int16/float32 numerics)
+"""
+
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from scoutsense.utils.data_loader import load_draft_data, load_madden_ratings
+
+DATA_DIR = Path(__file__).parent.parent / 'data'
+
+# (file, typed loader)
+DATASETS = [
+    ('nfl_draft_combined.csv', load_draft_data),
+    ('MaddenRatings2008_2019.csv', load_madden_ratings),
+]
+
+
+def _best_of(fn, repeats):
+    """Return (result, best wall-clock seconds) over repeats calls"""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def main(repeats=5):
+    print("="*80)
+    print("SCOUTSENSE: CSV Loading Benchmark")
+    print("="*80)
+    print(f"\n{'File':<28} {'Loader':<10} {'Rows':>7} {'Memory (KB)':>12} {'Load (ms)':>10}")
+    print("-" * 72)
+
+    for file_name, typed_loader in DATASETS:
+        path = DATA_DIR / file_name
+        before, before_secs = _best_of(lambda: pd.read_csv(path), repeats)
+        after, after_secs = _best_of(lambda: typed_loader(path), repeats)
+        before_kb = before.memory_usage(deep=True).sum() / 1024
+        after_kb = after.memory_usage(deep=True).sum() / 1024
+
+        print(f"{file_name:<28} {'default':<10} {len(before):>7} {before_kb:>12,.0f} {before_secs * 1000:>10.1f}")
+        print(f"{'':<28} {'typed':<10} {len(after):>7} {after_kb:>12,.0f} {after_secs * 1000:>10.1f}")
+        print(f"{'':<28} memory -{1 - after_kb / before_kb:.0%}, load time x{before_secs / after_secs:.2f}")
+
+
+if __name__ == "__main__":
+    main()
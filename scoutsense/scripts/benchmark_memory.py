@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+ScoutSense Benchmark: Pipeline memory
+Peak memory (tracemalloc) of each stage from raw draft rows to trained models,
+comparing the copying paths (a new frame per step, a filled/scaled copy per
+model) with the in-place pipeline and one shared float32 FeatureMatrix.
+The draft table is scaled up synthetically (resampled rows) to Madden size.
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from scoutsense.scripts.benchmark_features import _scaled_draft_table
+from scoutsense.utils.feature_engineering import FeatureMatrix, FeaturePipeline
+from scoutsense.utils.models import DraftPositionPredictor, PlayerComparison, PlayerSuccessClassifier
+
+
+def _stage(name, fn, results):
+    """Run fn() under tracemalloc, record (name, seconds, peak MB, retained MB) and return its result"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    results.append((name, elapsed, peak / 1e6, retained / 1e6))
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Per-stage peak memory of the ScoutSense pipeline")
+    parser.add_argument('--rows', type=int, default=100_000, help='Synthetic rows to process')
+    args = parser.parse_args(argv)
+
+    print("="*80)
+    print("SCOUTSENSE: Pipeline Memory Benchmark")
+    print("="*80)
+
+    raw = _scaled_draft_table(args.rows)
+    print(f"\n{len(raw)} raw rows ({raw.memory_usage(deep=True).sum() / 1e6:.1f} MB)")
+    pipeline = FeaturePipeline().fit(raw)
+
+    results = []
+    _stage("transform (shallow copy)", lambda: pipeline.transform(raw), results)
+    df = _stage("transform (inplace)", lambda: pipeline.transform(raw.copy(deep=False), inplace=True), results)
+
+    # Per-model copies: each model fills and scales its own float64 copy
+    _stage("predictor.train (own copy)", lambda: DraftPositionPredictor().train(df), results)
+    _stage("classifier.train (own copy)", lambda: PlayerSuccessClassifier().train(df), results)
+    _stage("PlayerComparison (own copy)", lambda: PlayerComparison(df), results)
+
+    # One shared float32 matrix, viewed by every model
+    features = _stage("FeatureMatrix", lambda: FeatureMatrix(df), results)
+    _stage("predictor.train (shared)", lambda: DraftPositionPredictor().train(df, features), results)
+    _stage("classifier.train (shared)", lambda: PlayerSuccessClassifier().train(df, features), results)
+    _stage("PlayerComparison (shared)", lambda: PlayerComparison(df, features=features), results)
+
+    print(f"\n{'Stage':<30} {'Seconds':>9} {'Peak MB':>9} {'Retained MB':>12}")
+    print("-" * 64)
+    for name, secs, peak_mb, retained_mb in results:
+        print(f"{name:<30} {secs:>9.2f} {peak_mb:>9.1f} {retained_mb:>12.1f}")
+    print(f"\nShared feature matrix: {features.values.nbytes / 1e6:.1f} MB "
+          f"({features.values.shape[0]} x {features.values.shape[1]} float32)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+ScoutSense Benchmark: Nearest-neighbor backends
+Recall@k vs query latency of each neighbor index backend, measured against
+brute-force ground truth on a table scaled up from nfl_draft_combined.csv
+(resampled rows with small Gaussian jitter, standing in for decades of
+drafted players plus Madden rosters)
+"""
+
+import time
+from pathlib import Path
+
+import numpy as np
+
+from scoutsense.utils.feature_engineering import load_engineered_features
+from scoutsense.utils.models import PlayerComparison
+from scoutsense.utils.neighbors import NEIGHBOR_BACKENDS
+
+# Data file path
+DATA_FILE = Path(__file__).parent.parent / 'data' / 'nfl_draft_combined.csv'
+
+# (backend, params) configurations benchmarked, exact first
+CONFIGS = [
+    ('brute', {}),
+    ('kd', {}),
+    ('ball', {}),
+    ('lsh', {'n_tables': 4, 'n_projections': 8}),
+    ('lsh', {'n_tables': 8, 'n_projections': 6}),
+    ('lsh', {'n_tables': 16, 'n_projections': 6}),
+    ('lsh', {'n_tables': 32, 'n_projections': 4}),
+]
+
+
+def _scaled_matrix(n_rows, noise=0.05, seed=42):
+    """Scaled feature matrix of n_rows players, resampled from the real table"""
+    df = load_engineered_features(str(DATA_FILE))
+    matrix = PlayerComparison(df)._matrix
+    rng = np.random.RandomState(seed)
+    rows = rng.randint(0, len(matrix), n_rows)
+    jitter = rng.normal(scale=noise, size=(n_rows, matrix.shape[1])).astype(np.float32)
+    return np.ascontiguousarray(matrix[rows] + jitter)
+
+
+def main(n_rows=50000, n_queries=300, k=10):
+    print("="*80)
+    print("SCOUTSENSE: Neighbor Index Benchmark")
+    print("="*80)
+
+    matrix = _scaled_matrix(n_rows)
+    queries = np.random.RandomState(0).choice(n_rows, n_queries, replace=False)
+    print(f"\n{n_rows} rows x {matrix.shape[1]} features, {n_queries} queries, k={k}")
+
+    truth = None
+    print(f"\n{'Backend':<8} {'Params':<38} {'Build s':>8} {'Query ms':>9} {f'Recall@{k}':>10}")
+    print("-" * 78)
+    for backend, params in CONFIGS:
+        start = time.perf_counter()
+        index = NEIGHBOR_BACKENDS[backend](**params).build(matrix)
+        build_secs = time.perf_counter() - start
+
+        start = time.perf_counter()
+        results = [index.query(matrix[q], k)[0] for q in queries]
+        query_ms = (time.perf_counter() - start) / n_queries * 1000
+
+        if truth is None:
+            truth = results
+        recall = np.mean([len(set(r) & set(t)) / len(t) for r, t in zip(results, truth)])
+        print(f"{backend:<8} {str(params):<38} {build_secs:>8.2f} {query_ms:>9.3f} {recall:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
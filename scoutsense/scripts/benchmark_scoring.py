@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+ScoutSense Benchmark: Per-row vs batch scoring
+Compares rows/sec of predict()/predict_proba() called per player against
+predict_batch()/predict_proba_batch() on a whole draft class
+"""
+
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from scoutsense.utils.data_loader import load_draft_data
+from scoutsense.utils.feature_engineering import engineer_features
+from scoutsense.utils.models import DraftPositionPredictor, PlayerSuccessClassifier
+
+# Data file path
+DATA_FILE = Path(__file__).parent.parent / 'data' / 'nfl_draft_data.csv'
+
+# Number of rows scored through the (slow) per-row path
+PER_ROW_SAMPLE = 500
+
+
+def _rows_per_sec(fn, n_rows):
+    """Time fn() and return (seconds, rows/sec)"""
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    return elapsed, n_rows / elapsed if elapsed > 0 else float('inf')
+
+
+def main(batch_rows=50000, chunk_size=10000):
+    print("="*80)
+    print("SCOUTSENSE: Scoring Benchmark")
+    print("="*80)
+
+    df = load_draft_data(str(DATA_FILE))
+    df_engineered = engineer_features(df)
+
+    predictor = DraftPositionPredictor().train(df_engineered)
+    classifier = PlayerSuccessClassifier(success_threshold=5).train(df_engineered)
+
+    # Synthetic draft class: resample real rows up to batch_rows
+    reps = int(np.ceil(batch_rows / len(df_engineered)))
+    big = pd.concat([df_engineered] * reps, ignore_index=True).iloc[:batch_rows]
+    sample = big.iloc[:PER_ROW_SAMPLE]
+
+    results = []
+
+    secs, rps = _rows_per_sec(lambda: [predictor.predict(p) for _, p in sample.iterrows()], len(sample))
+    results.append(("predict (per row)", len(sample), secs, rps))
+    secs, rps = _rows_per_sec(lambda: predictor.predict_batch(big, chunk_size=chunk_size), len(big))
+    results.append(("predict_batch", len(big), secs, rps))
+
+    secs, rps = _rows_per_sec(lambda: [classifier.predict_proba(p) for _, p in sample.iterrows()], len(sample))
+    results.append(("predict_proba (per row)", len(sample), secs, rps))
+    secs, rps = _rows_per_sec(lambda: classifier.predict_proba_batch(big, chunk_size=chunk_size), len(big))
+    results.append(("predict_proba_batch", len(big), secs, rps))
+
+    print(f"\n{'Path':<26} {'Rows':>8} {'Seconds':>10} {'Rows/sec':>12}")
+    print("-" * 60)
+    for name, n, secs, rps in results:
+        print(f"{name:<26} {n:>8} {secs:>10.3f} {rps:>12,.0f}")
+
+    print(f"\nSpeedup (regressor):  {results[1][3] / results[0][3]:.0f}x")
+    print(f"Speedup (classifier): {results[3][3] / results[2][3]:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
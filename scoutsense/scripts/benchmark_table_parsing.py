@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+ScoutSense Benchmark: CFB Reference table extraction
+Times the full-page BeautifulSoup parse against the targeted lxml/XPath
+extractor on saved player pages (that both return the same tables is
+checked by scoutsense/tests/test_cfb_scraper.py)
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# The scraper lives in the data directory (it is not part of the package)
+sys.path.insert(0, str(Path(__file__).parent.parent / 'data'))
+import cfbReferenceScrape_cleaned as cfb
+
+
+def synthetic_player_page(n_seasons=4, filler_kb=300):
+    """
+    Build an HTML page shaped like a CFB Reference player page: lots of
+    navigation/markup we never use, plus stat tables hidden in comments
+    """
+    filler = ''.join(
+        f'<div class="nav"><ul>{"".join(f"<li><a href=/x/{i}_{j}>link {j}</a></li>" for j in range(20))}</ul></div>'
+        for i in range(filler_kb // 2)
+    )
+    tables = []
+    for table_id in cfb.STAT_TABLES:
+        header = ''.join(f'<th>c{c}</th>' for c in range(20))
+        body = ''.join(
+            f'<tr><th><a href="/years/{2015 + y}.html">{2015 + y}</a></th>'
+            + ''.join(f'<td data-stat="s{c}">{y * c}</td>' for c in range(19)) + '</tr>'
+            for y in range(n_seasons)
+        )
+        totals = '<tr><th>Career</th>' + ''.join(f'<td>{c}</td>' for c in range(19)) + '</tr>'
+        tables.append(
+            f'<div id="all_{table_id}"><!--\n<table id="{table_id}"><thead><tr>{header}</tr></thead>'
+            f'<tbody>{body}</tbody><tfoot>{totals}</tfoot></table>\n--></div>'
+        )
+    return f'<html><head><title>Player</title></head><body>{filler}{"".join(tables)}</body></html>'
+
+
+def load_fixtures(fixture_dir, n_synthetic):
+    """Saved *.html pages from fixture_dir, or synthetic pages if none are given"""
+    if fixture_dir:
+        pages = [p.read_text(encoding='utf-8', errors='replace') for p in sorted(Path(fixture_dir).glob('*.html'))]
+        if pages:
+            return pages
+        print(f"No *.html fixtures in {fixture_dir}; using synthetic pages")
+    return [synthetic_player_page() for _ in range(n_synthetic)]
+
+
+def time_engine(pages, engine, repeats):
+    """Best-of-repeats seconds to extract all STAT_TABLES from every page"""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for html in pages:
+            cfb.read_tables(html, cfb.STAT_TABLES, engine)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--fixtures', help='Directory of saved player page *.html files')
+    parser.add_argument('--synthetic', type=int, default=20, help='Synthetic pages if no fixtures')
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    pages = load_fixtures(args.fixtures, args.synthetic)
+    total_kb = sum(len(p) for p in pages) / 1024
+
+    print("="*80)
+    print("SCOUTSENSE: Table Extraction Benchmark")
+    print("="*80)
+    print(f"{len(pages)} pages, {total_kb:,.0f} KB total, {len(cfb.STAT_TABLES)} tables per page")
+
+    timings = {engine: time_engine(pages, engine, args.repeats) for engine in cfb.ENGINES}
+
+    print(f"\n{'Engine':<8} {'Total (s)':>10} {'ms/page':>10}")
+    print("-" * 30)
+    for engine, secs in timings.items():
+        print(f"{engine:<8} {secs:>10.3f} {secs / len(pages) * 1000:>10.2f}")
+    print(f"\nParse-time reduction: {1 - timings['lxml'] / timings['bs4']:.1%} "
+          f"({timings['bs4'] / timings['lxml']:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
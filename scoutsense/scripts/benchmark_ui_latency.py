@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+ScoutSense Benchmark: UI queue latency
+Measures how long a background result waits before the Tk thread handles it,
+for the legacy 200 ms polling loop vs the event-driven queue, and how often
+each mode wakes the Tk thread while idle. Needs a display (or Xvfb).
+"""
+
+import random
+import statistics
+import sys
+import threading
+import time
+import tkinter as tk
+from pathlib import Path
+
+# The UI imports its siblings as top-level "utils.*" modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / 'ui'))
+
+from app import ScoutSenseApp
+
+# Results posted per mode, and the spacing between them (seconds)
+N_MESSAGES = 200
+MAX_GAP = 0.05
+# Idle window over which queue wake-ups are counted (seconds)
+IDLE_SECONDS = 2.0
+
+
+def _measure(queue_poll_ms):
+    """Run one mode and return (latencies in ms, idle wake-ups)"""
+    root = tk.Tk()
+    root.withdraw()
+    app = ScoutSenseApp(root, queue_poll_ms=queue_poll_ms)
+    latencies = []
+    wakeups = [0]
+
+    process_queue = app._process_queue
+
+    def counting_process_queue():
+        wakeups[0] += 1
+        process_queue()
+
+    app._process_queue = counting_process_queue
+
+    def received(sent_at):
+        latencies.append((time.perf_counter() - sent_at) * 1000)
+
+    def producer():
+        rng = random.Random(0)
+        for _ in range(N_MESSAGES):
+            time.sleep(rng.uniform(0, MAX_GAP))
+            app._bg_queue.put(("result", received, time.perf_counter()))
+        # Let the last results land, then count wake-ups while nothing is posted
+        time.sleep(0.5)
+        wakeups[0] = 0
+        time.sleep(IDLE_SECONDS)
+        idle = wakeups[0]
+        root.after(0, lambda: (root.quit(), results.append(idle)))
+
+    results = []
+    threading.Thread(target=producer, daemon=True).start()
+    root.mainloop()
+    app._tasks.shutdown()
+    root.destroy()
+    return latencies, results[0]
+
+
+def main():
+    print("="*80)
+    print("SCOUTSENSE: UI Queue Latency Benchmark")
+    print("="*80)
+
+    try:
+        modes = [("polling (200 ms)", _measure(200)), ("event-driven", _measure(None))]
+    except tk.TclError as e:
+        print(f"\nCannot open a Tk display ({e}); run under a desktop session or Xvfb.")
+        return
+
+    print(f"\n{'Mode':<20} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8} {'idle wake-ups/s':>16}")
+    print("-" * 64)
+    for name, (latencies, idle) in modes:
+        q = statistics.quantiles(latencies, n=20)
+        print(f"{name:<20} {statistics.median(latencies):>8.1f} {q[18]:>8.1f} "
+              f"{max(latencies):>8.1f} {idle / IDLE_SECONDS:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,14 +6,8 @@ Demonstrates draft position prediction, success classification, and player simil
 """
 
 from pathlib import Path
-from scoutsense.utils.data_loader import load_draft_data
-from scoutsense.utils.feature_engineering import engineer_features
-from scoutsense.utils.models import (
-    DraftPositionPredictor, 
-    PlayerSuccessClassifier, 
-    PlayerComparison,
-    demonstrate_models
-)
+from scoutsense.utils.feature_engineering import load_engineered_features
+from scoutsense.utils.models import demonstrate_models
 
 def main():
     # Load and engineer data
@@ -22,30 +16,20 @@ def main():
     print("="*80)
     
     data_file = Path(__file__).parent.parent / 'data' / 'nfl_draft_data.csv'
-    df = load_draft_data(str(data_file))
-    print(f"[LOADED] {len(df)} players from CSV")
-    
-    print("\n[ENGINEERING] Creating 25+ features...")
-    df_engineered = engineer_features(df)
+    # Engineered features are cached on disk, keyed by the CSV's hash
+    print("\n[ENGINEERING] Creating 25+ features (cached after first run)...")
+    df_engineered = load_engineered_features(data_file)
+    print(f"[LOADED] {len(df_engineered)} players from CSV")
     print(f"[COMPLETE] {df_engineered.shape[1]} total features")
     
-    # Run demonstrations
-    demonstrate_models(df_engineered)
+    # Run demonstrations (loads persisted models, training only if missing/stale)
+    predictor, classifier, comparator = demonstrate_models(df_engineered)
     
     # Interactive examples
     print("\n" + "="*80)
     print("INTERACTIVE EXAMPLES")
     print("="*80)
     
-    # Create models
-    predictor = DraftPositionPredictor()
-    predictor.train(df_engineered)
-    
-    classifier = PlayerSuccessClassifier(success_threshold=5)
-    classifier.train(df_engineered)
-    
-    comparator = PlayerComparison(df_engineered)
-    
     # Example 1: Predict draft position for a random player
     print("\n[EXAMPLE 1] Draft Position Prediction")
     print("-" * 80)
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+ScoutSense Model Evaluation
+Cross-validates a model or runs a hyperparameter search and prints a results
+table with fit/predict timings per configuration. Fold results are cached, so
+re-running an interrupted search picks up where it stopped.
+
+Usage:
+    python -m scoutsense.scripts.evaluate_models --model predictor --cv time
+    python -m scoutsense.scripts.evaluate_models --model classifier --search halving --candidates 27
+"""
+
+import argparse
+from pathlib import Path
+
+from scoutsense.utils.evaluation import (CV_SCHEMES, DEFAULT_EVALUATION_CACHE, MODEL_SPECS,
+                                         SEARCH_METHODS, Evaluator, format_results)
+from scoutsense.utils.feature_engineering import load_engineered_features
+
+# Data file path
+DATA_FILE = Path(__file__).parent.parent / 'data' / 'nfl_draft_combined.csv'
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cross-validate ScoutSense models and search hyperparameters")
+    parser.add_argument('--data', default=str(DATA_FILE), help='Draft CSV to evaluate on')
+    parser.add_argument('--model', choices=list(MODEL_SPECS), default='predictor')
+    parser.add_argument('--cv', choices=CV_SCHEMES, default='kfold',
+                        help="'kfold' (shuffled) or 'time' (train on earlier draft years)")
+    parser.add_argument('--folds', type=int, default=5, help='Number of folds / most recent test years')
+    parser.add_argument('--search', choices=SEARCH_METHODS, default=None,
+                        help='Hyperparameter search method (default: cross-validate the defaults only)')
+    parser.add_argument('--candidates', type=int, default=20, help='Configurations sampled by the search')
+    parser.add_argument('--jobs', type=int, default=-1, help='Parallel workers (-1 = all cores)')
+    parser.add_argument('--cache', default=str(DEFAULT_EVALUATION_CACHE), help='Fold-result cache file')
+    parser.add_argument('--no-cache', action='store_true', help='Do not read or write cached fold results')
+    args = parser.parse_args(argv)
+
+    print("="*80)
+    print(f"SCOUTSENSE: Evaluating {args.model} ({args.cv} CV, {args.folds} folds)")
+    print("="*80)
+
+    df = load_engineered_features(args.data)
+    evaluator = Evaluator(df, model=args.model, cv=args.cv, n_splits=args.folds, n_jobs=args.jobs,
+                          cache_path=None if args.no_cache else args.cache)
+
+    if args.search == 'random':
+        table = evaluator.random_search(n_candidates=args.candidates)
+    elif args.search == 'halving':
+        table = evaluator.halving_search(n_candidates=args.candidates)
+    else:
+        folds = evaluator.cross_validate()
+        print(f"\n{'Fold':>4} {evaluator.metric:>10} {'fit s':>7} {'pred ms':>8} {'train':>6} {'test':>6}")
+        print("-" * 48)
+        for row in folds.itertuples():
+            print(f"{row.fold:>4} {row.score:>10.4f} {row.fit_time:>7.2f} {row.predict_time * 1000:>8.2f} "
+                  f"{row.n_train:>6} {row.n_test:>6}")
+        table = evaluator.summarize(folds)
+
+    print()
+    print(format_results(table, evaluator.metric))
+    return table
+
+
+if __name__ == "__main__":
+    main()
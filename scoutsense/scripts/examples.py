@@ -6,13 +6,8 @@ Real-world use cases for the prediction and comparison tools
 """
 
 from pathlib import Path
-from scoutsense.utils.data_loader import load_draft_data
-from scoutsense.utils.feature_engineering import engineer_features
-from scoutsense.utils.models import (
-    DraftPositionPredictor,
-    PlayerSuccessClassifier,
-    PlayerComparison
-)
+from scoutsense.utils.feature_engineering import load_engineered_features
+from scoutsense.utils.models import load_or_train_models
 
 # Data file path
 DATA_FILE = Path(__file__).parent.parent / 'data' / 'nfl_draft_data.csv'
@@ -23,20 +18,19 @@ def example_1_predict_draft_position():
     print("EXAMPLE 1: Draft Position Prediction")
     print("="*80)
     
-    # Load data
-    df = load_draft_data(str(DATA_FILE))
-    df_engineered = engineer_features(df)
+    # Load engineered features (cached on disk after the first run)
+    df_engineered = load_engineered_features(DATA_FILE)
     
-    # Train predictor
-    predictor = DraftPositionPredictor()
-    predictor.train(df_engineered)
+    # Load persisted predictor (trained and saved on first run)
+    predictor, _, _ = load_or_train_models(df_engineered)
     
     # Predict for top 3 overall picks
     print("\nPredicting draft position for top 3 prospects:")
     top_picks = df_engineered.nsmallest(3, 'draft_pick')
     
-    for idx, player in top_picks.iterrows():
-        predicted = predictor.predict(player)
+    predicted_picks = predictor.predict_batch(top_picks)
+    
+    for (idx, player), predicted in zip(top_picks.iterrows(), predicted_picks):
         actual = int(player['draft_pick'])
         error = abs(predicted - actual)
         
@@ -54,23 +48,24 @@ def example_2_success_probability():
     print("EXAMPLE 2: Player Success Classification")
     print("="*80)
     
-    # Load data
-    df = load_draft_data(str(DATA_FILE))
-    df_engineered = engineer_features(df)
+    # Load engineered features (cached on disk after the first run)
+    df_engineered = load_engineered_features(DATA_FILE)
     
-    # Train classifier
-    classifier = PlayerSuccessClassifier(success_threshold=5)
-    classifier.train(df_engineered)
+    # Load persisted classifier (trained and saved on first run)
+    _, classifier, _ = load_or_train_models(df_engineered)
     
     # Show success probability for various draft rounds
     print("\nAverage success probability by draft round:")
     print(f"{'Round':<10} {'Avg Success %':<15} {'Avg Pick':<10}")
     print("-" * 35)
     
+    # Score every player in one batch, then aggregate by round
+    df_engineered['success_prob'] = classifier.predict_proba_batch(df_engineered)
+    
     for round_num in range(1, 8):
         round_players = df_engineered[df_engineered['draft_round'] == round_num]
         if len(round_players) > 0:
-            avg_success = round_players.apply(lambda p: classifier.predict_proba(p), axis=1).mean()
+            avg_success = round_players['success_prob'].mean()
             avg_pick = round_players['draft_pick'].mean()
             print(f"{int(round_num):<10} {avg_success*100:>13.1f}% {int(avg_pick):>10}")
 
@@ -81,12 +76,11 @@ def example_3_find_player_comps():
     print("EXAMPLE 3: Find Player Comps")
     print("="*80)
     
-    # Load data
-    df = load_draft_data(str(DATA_FILE))
-    df_engineered = engineer_features(df)
+    # Load engineered features (cached on disk after the first run)
+    df_engineered = load_engineered_features(DATA_FILE)
     
-    # Create comparison tool
-    comparator = PlayerComparison(df_engineered)
+    # Load persisted comparison tool
+    _, _, comparator = load_or_train_models(df_engineered)
     
     # Example: Find QBs similar to Matthew Stafford
     print("\n[CASE 1] QBs similar to Matthew Stafford")
@@ -105,16 +99,14 @@ def example_4_overvalued_undervalued():
     print("EXAMPLE 4: Identify Overvalued & Undervalued Picks")
     print("="*80)
     
-    # Load data
-    df = load_draft_data(str(DATA_FILE))
-    df_engineered = engineer_features(df)
+    # Load engineered features (cached on disk after the first run)
+    df_engineered = load_engineered_features(DATA_FILE)
     
-    # Train predictor
-    predictor = DraftPositionPredictor()
-    predictor.train(df_engineered)
+    # Load persisted predictor (trained and saved on first run)
+    predictor, _, _ = load_or_train_models(df_engineered)
     
     # Predict for all players
-    df_engineered['predicted_pick'] = df_engineered.apply(lambda p: predictor.predict(p), axis=1)
+    df_engineered['predicted_pick'] = predictor.predict_batch(df_engineered)
     df_engineered['pick_difference'] = df_engineered['predicted_pick'] - df_engineered['draft_pick']
     
     # Overvalued: picked earlier than predicted
@@ -145,11 +137,10 @@ def example_5_position_analysis():
     print("EXAMPLE 5: Compare Top 3 Players of Each Position")
     print("="*80)
     
-    # Load data
-    df = load_draft_data(str(DATA_FILE))
-    df_engineered = engineer_features(df)
+    # Load engineered features (cached on disk after the first run)
+    df_engineered = load_engineered_features(DATA_FILE)
     
-    comparator = PlayerComparison(df_engineered)
+    _, _, comparator = load_or_train_models(df_engineered)
     
     # Get unique positions
     positions = df_engineered['pos'].unique()[:3]
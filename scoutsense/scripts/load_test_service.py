@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+ScoutSense Load Test: Prediction service
+Concurrent clients (one keep-alive connection each) send single-prospect
+/predict requests, mixed with /similar lookups, for a fixed duration and the
+p50/p99 latency and QPS per endpoint are reported. Without --url the service
+is started twice on a free port, with micro-batching off (--max-batch 1) and on.
+"""
+
+import argparse
+import http.client
+import json
+import socket
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from urllib.parse import quote, urlparse
+
+import numpy as np
+import pandas as pd
+
+# Data file path
+DATA_FILE = Path(__file__).parent.parent / 'data' / 'nfl_draft_data.csv'
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def _get_json(conn, path):
+    conn.request('GET', path)
+    response = conn.getresponse()
+    return response.status, json.loads(response.read())
+
+
+def _start_server(port, max_batch, max_wait_ms, timeout=120):
+    """Start `python -m scoutsense serve` and wait until /health answers"""
+    cmd = [sys.executable, '-m', 'scoutsense', 'serve', '--port', str(port),
+           '--max-batch', str(max_batch), '--max-wait-ms', str(max_wait_ms)]
+    proc = subprocess.Popen(cmd, cwd=Path(__file__).parent.parent.parent,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"Service exited with code {proc.returncode}:\n{proc.stderr.read()}")
+        try:
+            conn = http.client.HTTPConnection('127.0.0.1', port, timeout=1)
+            if _get_json(conn, '/health')[0] == 200:
+                conn.close()
+                return proc
+        except OSError:
+            time.sleep(0.2)
+    proc.kill()
+    raise RuntimeError(f"Service did not come up within {timeout} s")
+
+
+def _client(host, port, prospects, names, similar_share, stop_at, seed, latencies, errors):
+    """Send requests on one connection until stop_at, recording (endpoint, seconds) per response"""
+    rng = np.random.RandomState(seed)
+    conn = http.client.HTTPConnection(host, port, timeout=30)
+    headers = {'Content-Type': 'application/json'}
+    while time.monotonic() < stop_at:
+        if rng.rand() < similar_share:
+            endpoint = 'similar'
+            name = names[rng.randint(len(names))]
+            args = ('GET', f'/similar?name={quote(name)}&n=5&position_only=1')
+        else:
+            endpoint = 'predict'
+            body = json.dumps(prospects[rng.randint(len(prospects))])
+            args = ('POST', '/predict', body, headers)
+        start = time.perf_counter()
+        try:
+            conn.request(*args)
+            response = conn.getresponse()
+            response.read()
+        except (OSError, http.client.HTTPException):
+            errors.append(endpoint)
+            conn.close()
+            conn = http.client.HTTPConnection(host, port, timeout=30)
+            continue
+        elapsed = time.perf_counter() - start
+        if response.status == 200:
+            latencies.append((endpoint, elapsed))
+        else:
+            errors.append(endpoint)
+    conn.close()
+
+
+def _run_phase(host, port, prospects, names, concurrency, duration, similar_share):
+    """Drive the service at host:port and return (latencies, errors, elapsed seconds, /stats before, after)"""
+    conn = http.client.HTTPConnection(host, port, timeout=10)
+    before = _get_json(conn, '/stats')[1]
+    latencies, errors = [], []
+    start = time.monotonic()
+    clients = [threading.Thread(target=_client, args=(host, port, prospects, names, similar_share,
+                                                      start + duration, seed, latencies, errors))
+               for seed in range(concurrency)]
+    for thread in clients:
+        thread.start()
+    for thread in clients:
+        thread.join()
+    elapsed = time.monotonic() - start
+    after = _get_json(conn, '/stats')[1]
+    conn.close()
+    return latencies, errors, elapsed, before, after
+
+
+def _report(label, latencies, errors, elapsed, before, after):
+    print(f"\n{label}")
+    print(f"{'Endpoint':<10} {'Requests':>9} {'Errors':>7} {'QPS':>9} {'p50 ms':>9} {'p99 ms':>9}")
+    print("-" * 57)
+    for endpoint in ('predict', 'similar', 'all'):
+        secs = np.array([s for e, s in latencies if endpoint in ('all', e)])
+        n_errors = sum(1 for e in errors if endpoint in ('all', e))
+        if not len(secs):
+            continue
+        p50, p99 = np.percentile(secs, [50, 99]) * 1000
+        print(f"{endpoint:<10} {len(secs):>9} {n_errors:>7} {len(secs) / elapsed:>9.1f} {p50:>9.1f} {p99:>9.1f}")
+    batches = after['batches'] - before['batches']
+    rows = after['rows'] - before['rows']
+    if batches:
+        print(f"Scored {rows} prospects in {batches} batches ({rows / batches:.1f} rows per batch)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load-test the ScoutSense prediction service")
+    parser.add_argument('--url', help='Already-running service (default: start one per phase)')
+    parser.add_argument('--concurrency', type=int, default=16, help='Concurrent client connections')
+    parser.add_argument('--duration', type=float, default=10.0, help='Seconds per phase')
+    parser.add_argument('--similar-share', type=float, default=0.2, help='Fraction of /similar requests')
+    parser.add_argument('--max-wait-ms', type=float, default=5.0, help='Micro-batch wait of the started service')
+    args = parser.parse_args(argv)
+
+    print("="*80)
+    print("SCOUTSENSE: Prediction Service Load Test")
+    print("="*80)
+
+    draft = pd.read_csv(DATA_FILE)
+    prospects = json.loads(draft.drop(columns=['Draft Pick'], errors='ignore').to_json(orient='records'))
+    names = draft['Name'].dropna().unique().tolist()
+    print(f"\n{args.concurrency} clients, {args.duration:g} s per phase, "
+          f"{args.similar_share:.0%} /similar, {len(prospects)} distinct prospects")
+
+    if args.url:
+        url = urlparse(args.url)
+        results = _run_phase(url.hostname, url.port or 80, prospects, names,
+                             args.concurrency, args.duration, args.similar_share)
+        _report(f"Service at {args.url}", *results)
+        return
+
+    phases = [("Unbatched (--max-batch 1)", 1),
+              (f"Micro-batched (--max-batch 256, --max-wait-ms {args.max_wait_ms:g})", 256)]
+    for label, max_batch in phases:
+        port = _free_port()
+        proc = _start_server(port, max_batch, args.max_wait_ms)
+        try:
+            results = _run_phase('127.0.0.1', port, prospects, names,
+                                 args.concurrency, args.duration, args.similar_share)
+        finally:
+            proc.terminate()
+            proc.wait()
+        _report(label, *results)
+
+
+if __name__ == "__main__":
+    main()
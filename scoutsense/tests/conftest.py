@@ -0,0 +1,96 @@
+"""
+Shared fixtures: a slice of the bundled draft table, raw and engineered,
+trained artifacts and a local HTTP stand-in for the scraped sites
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from scoutsense.utils.data_loader import load_draft_data
+from scoutsense.utils.feature_engineering import engineer_features
+
+DATA_FILE = Path(__file__).parent.parent / 'data' / 'nfl_draft_data.csv'
+
+# Pre-engineered multi-year table the UI trains on
+COMBINED_FILE = Path(__file__).parent.parent / 'data' / 'nfl_draft_combined.csv'
+
+# Rows used by model tests: enough for every position, small enough to train in seconds
+SAMPLE_ROWS = 600
+
+
+@pytest.fixture(scope='session')
+def raw_draft_df():
+    return load_draft_data(str(DATA_FILE)).head(SAMPLE_ROWS).reset_index(drop=True)
+
+
+@pytest.fixture(scope='session')
+def draft_df(raw_draft_df):
+    """Engineered features of raw_draft_df (treat as read-only)"""
+    return engineer_features(raw_draft_df)
+
+
+@pytest.fixture(scope='session')
+def artifact_dir(draft_df, tmp_path_factory):
+    """Artifact directory with models and feature pipeline trained on draft_df (treat as read-only)"""
+    from scoutsense.utils.models import load_or_train_models
+    path = tmp_path_factory.mktemp('artifacts')
+    load_or_train_models(draft_df, path, parallel=False)
+    return path
+
+
+@pytest.fixture(scope='session')
+def combined_artifact_dir(tmp_path_factory):
+    """Artifact directory built as the UI builds it, from COMBINED_FILE (treat as read-only)"""
+    from scoutsense.utils.models import load_or_train_models
+    path = tmp_path_factory.mktemp('combined_artifacts')
+    load_or_train_models(load_draft_data(str(COMBINED_FILE)), path, success_threshold=5, neighbor_table=True)
+    return path
+
+
+class StandInServer:
+    """
+    Local HTTP server answering each path from a scripted list of
+    (status, headers, body) responses; the last response repeats
+    """
+
+    def __init__(self):
+        self.routes = {}
+        self.requests = []  # (path, headers) in arrival order
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                stand_in.requests.append((self.path, dict(self.headers)))
+                responses = stand_in.routes.get(self.path, [(404, {}, b'not found')])
+                status, headers, body = responses.pop(0) if len(responses) > 1 else responses[0]
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(0.01,), daemon=True)
+        self._thread.start()
+
+    def paths(self):
+        return [path for path, _ in self.requests]
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def server():
+    stand_in = StandInServer()
+    yield stand_in
+    stand_in.close()
@@ -0,0 +1,87 @@
+"""
+Tests for the CFB Reference scraper's table extraction: the targeted lxml
+engine must return exactly what the full-page BeautifulSoup parse returns
+"""
+
+import pandas as pd
+import pytest
+
+from scoutsense.scripts.benchmark_table_parsing import cfb, synthetic_player_page
+
+# Edge cases around the target table: a data-id decoy, a nested table and
+# anchors without an href, all inside a comment as on the real site
+TRICKY_PAGE = """<html><body>
+<table data-id="rushing"><tr><td>decoy</td></tr></table>
+<div id="all_rushing"><!--
+<table class="stats" id="rushing"><thead><tr><th>Year</th><th>Team</th><th>Yds</th></tr></thead>
+<tbody>
+<tr><th><a href="/years/2015.html">2015</a></th><td><a name="anchor">Georgia</a></td><td>10</td></tr>
+<tr><th>2016</th><td><table id="inner"><tr><td>nested</td></tr></table></td><td>20</td></tr>
+<tr><th>Career</th><td><a href="/schools/georgia.html">Georgia</a> <a>x</a></td><td>30</td></tr>
+</tbody></table>
+--></div>
+<table id="defense"><tr><td>1</td></tr></table>
+</body></html>"""
+
+
+def _both_engines(html, table_id, **kwargs):
+    soup = cfb.parse_page(html)
+    return cfb.table_from_soup(soup, table_id, **kwargs), cfb.fast_table(html, table_id, **kwargs)
+
+
+@pytest.mark.parametrize('kwargs', [{}, {'header': True}, {'links': True}])
+def test_engines_agree_on_synthetic_player_pages(kwargs):
+    html = synthetic_player_page(n_seasons=3, filler_kb=20)
+    for table_id in cfb.STAT_TABLES:
+        slow, fast = _both_engines(html, table_id, **kwargs)
+        assert not fast.empty
+        pd.testing.assert_frame_equal(slow, fast)
+
+
+@pytest.mark.parametrize('kwargs', [{}, {'links': True}])
+def test_engines_agree_on_nested_tables_decoys_and_bare_anchors(kwargs):
+    for table_id in ('rushing', 'inner', 'defense', 'missing'):
+        slow, fast = _both_engines(TRICKY_PAGE, table_id, **kwargs)
+        pd.testing.assert_frame_equal(slow, fast)
+
+
+def test_fast_table_skips_data_id_and_keeps_nested_tables():
+    table = cfb.fast_table(TRICKY_PAGE, 'rushing')
+    assert 'decoy' not in table.to_string()
+    # Header row, three seasons and the nested table's row; the career row is not cut off
+    assert len(table) == 5
+    assert table.iloc[-1, 0] == 'Career'
+
+
+def test_fast_table_keeps_one_link_entry_per_anchor():
+    links = cfb.fast_table(TRICKY_PAGE, 'rushing', links=True)
+    assert links.iloc[1, 0] == '/years/2015.html'
+    assert links.iloc[1, 1] is None
+    assert links.iloc[-1].tolist() == ['/schools/georgia.html', None]
+
+
+def test_read_tables_rejects_unknown_engine():
+    with pytest.raises(ValueError):
+        cfb.read_tables(TRICKY_PAGE, ['rushing'], engine='regex')
+
+
+def test_scrape_players_skips_players_already_in_the_checkpoint(server, tmp_path):
+    page = synthetic_player_page(n_seasons=2, filler_kb=2).encode('utf-8')
+    server.routes['/players/a.html'] = [(200, {}, page)]
+    server.routes['/players/b.html'] = [(200, {}, page)]
+    urls = [server.url + f'/players/{name}.html' for name in ('a', 'b', 'c')]
+    checkpoint_path = tmp_path / 'players.checkpoint.jsonl'
+
+    # c is not published yet: its failed fetch is not checkpointed
+    first = cfb.scrape_players(urls, max_workers=2, checkpoint=cfb.JsonlCheckpoint(checkpoint_path))
+    assert [row[0] for row in first] == urls
+    assert '' not in first[0] and first[0][1:] == first[1][1:]
+    assert set(first[2][1:]) == set(cfb.STAT_TABLES) | {''}  # Only blanks for c
+    assert sorted(server.paths()) == ['/players/a.html', '/players/b.html', '/players/c.html']
+
+    server.routes['/players/c.html'] = [(200, {}, page)]
+    server.requests.clear()
+    second = cfb.scrape_players(urls, max_workers=2, checkpoint=cfb.JsonlCheckpoint(checkpoint_path))
+    assert server.paths() == ['/players/c.html']
+    assert second[:2] == first[:2]
+    assert second[2][1:] == second[0][1:]
@@ -0,0 +1,33 @@
+"""
+Tests for the JSONL scrape checkpoint: durability, reload and torn-line recovery
+"""
+
+import json
+
+from scoutsense.utils.checkpoint import JsonlCheckpoint
+
+
+def test_items_survive_a_reload_and_later_lines_win(tmp_path):
+    checkpoint = JsonlCheckpoint(tmp_path / 'run' / 'progress.jsonl')
+    checkpoint.add('2019', [1, 2])
+    checkpoint.add('2020', {'players': 3})
+    checkpoint.add('2019', [4])
+
+    reloaded = JsonlCheckpoint(tmp_path / 'run' / 'progress.jsonl')
+    assert len(reloaded) == 2
+    assert reloaded.get('2019') == [4]
+    assert reloaded.items() == [('2019', [4]), ('2020', {'players': 3})]
+    assert '2021' not in reloaded
+    assert reloaded.get('2021', 'missing') == 'missing'
+
+
+def test_resume_after_a_torn_last_line(tmp_path):
+    path = tmp_path / 'progress.jsonl'
+    path.write_text(json.dumps({'key': 'a', 'value': 1}) + '\n' + '{"key": "b", "va', encoding='utf-8')
+
+    resumed = JsonlCheckpoint(path)
+    assert resumed.items() == [('a', 1)]
+    # The next record must not be glued onto the torn line
+    resumed.add('b', 2)
+    resumed.add('c', 3)
+    assert JsonlCheckpoint(path).items() == [('a', 1), ('b', 2), ('c', 3)]
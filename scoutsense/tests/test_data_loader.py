@@ -0,0 +1,181 @@
+"""
+Tests for the typed CSV loaders and the draft scraper's fetch path (rate
+limiting, HTML cache, conditional requests, retries and checkpoint resume),
+run against the local http.server stand-in for pro-football-reference.com
+(conftest.StandInServer)
+"""
+
+import time
+import urllib.error
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from scoutsense.tests.conftest import DATA_FILE
+from scoutsense.utils.checkpoint import JsonlCheckpoint
+from scoutsense.utils.data_loader import (HTMLCache, TokenBucket, compact_dtypes, fetch_html, load_draft_data,
+                                          load_madden_ratings, scrape_draft_years)
+
+MADDEN_FILE = Path(__file__).parent.parent / 'data' / 'MaddenRatings2008_2019.csv'
+
+DRAFT_PAGE = """<html><body><table id="drafts"><tbody>
+<tr><td>{pick}</td><td>DET</td><td>Player {year}</td><td>QB</td><td>21</td>
+<td>6-3</td><td>225</td><td>Georgia</td><td>3</td><td>1</td></tr>
+</tbody></table></body></html>"""
+
+
+def test_compact_dtypes_narrows_columns_without_changing_values():
+    df = pd.DataFrame({
+        'small': np.array([1, -5, 300], dtype=np.int64),
+        'large': np.array([1, 70000, -3], dtype=np.int64),
+        'ratio': [0.5, np.nan, 2.25],
+        'flag': [True, False, True],
+        'team': ['DET', 'GB', 'DET'],
+        'name': ['a', 'b', 'c'],
+    })
+    compact = compact_dtypes(df, categorical_cols=('team', 'missing'))
+    assert compact.dtypes.to_dict() == {
+        'small': np.int16, 'large': np.int32, 'ratio': np.float32, 'flag': bool,
+        'team': pd.CategoricalDtype(['DET', 'GB']), 'name': df['name'].dtype,
+    }
+    pd.testing.assert_frame_equal(compact, df, check_dtype=False, check_categorical=False)
+    assert df['small'].dtype == np.int64  # The input frame is left alone
+
+
+def test_compact_dtypes_handles_empty_frames():
+    df = pd.DataFrame({'pick': np.array([], dtype=np.int64)})
+    assert compact_dtypes(df)['pick'].dtype == np.int16
+
+
+def test_load_madden_ratings_is_compact_and_lossless():
+    compact = load_madden_ratings(MADDEN_FILE)
+    full = load_madden_ratings(MADDEN_FILE, compact=False)
+    assert list(compact.columns) == ['first_name', 'last_name', 'position', 'jersey_#', 'overall_rating',
+                                     'team', 'year']
+    assert isinstance(compact['position'].dtype, pd.CategoricalDtype)
+    assert isinstance(compact['team'].dtype, pd.CategoricalDtype)
+    assert compact['overall_rating'].dtype == np.int16
+    assert compact['year'].dtype == np.int16
+    assert compact.memory_usage(deep=True).sum() < full.memory_usage(deep=True).sum()
+    pd.testing.assert_frame_equal(compact, full, check_dtype=False, check_categorical=False)
+
+
+def test_load_draft_data_is_compact_and_lossless():
+    compact = load_draft_data(str(DATA_FILE))
+    full = load_draft_data(str(DATA_FILE), compact=False)
+    for col in ('team', 'pos', 'college'):
+        assert isinstance(compact[col].dtype, pd.CategoricalDtype)
+    assert compact['draft_pick'].dtype == np.int16
+    pd.testing.assert_frame_equal(compact, full, check_dtype=False, check_categorical=False)
+
+
+def test_token_bucket_allows_burst_then_limits_rate():
+    bucket = TokenBucket(rate=50, capacity=3)
+    start = time.monotonic()
+    for _ in range(3):
+        bucket.acquire()
+    assert time.monotonic() - start < 0.05
+    for _ in range(5):
+        bucket.acquire()
+    # 5 more tokens at 50/s take at least ~0.1 s
+    assert time.monotonic() - start >= 0.09
+
+
+def test_token_bucket_rejects_non_positive_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+
+def test_html_cache_round_trip(tmp_path):
+    cache = HTMLCache(tmp_path)
+    assert cache.get('http://example/a') == (None, None)
+    cache.put('http://example/a', b'<html>a</html>', etag='"v1"', last_modified='Mon, 01 Jan 2024 00:00:00 GMT')
+    body, meta = cache.get('http://example/a')
+    assert body == b'<html>a</html>'
+    assert meta['etag'] == '"v1"'
+    assert meta['last_modified'] == 'Mon, 01 Jan 2024 00:00:00 GMT'
+
+
+def test_fetch_html_caches_and_serves_fresh_pages_without_network(server, tmp_path):
+    server.routes['/page'] = [(200, {'ETag': '"v1"'}, b'body v1')]
+    cache = HTMLCache(tmp_path)
+    assert fetch_html(server.url + '/page', cache=cache) == b'body v1'
+    assert fetch_html(server.url + '/page', cache=cache) == b'body v1'
+    assert fetch_html(server.url + '/page', cache=cache, offline=True) == b'body v1'
+    assert server.paths() == ['/page']
+
+
+def test_fetch_html_offline_miss_raises(server, tmp_path):
+    with pytest.raises(LookupError):
+        fetch_html(server.url + '/page', cache=HTMLCache(tmp_path), offline=True)
+    assert server.requests == []
+
+
+def test_fetch_html_reuses_cached_body_on_304(server, tmp_path):
+    last_modified = 'Mon, 01 Jan 2024 00:00:00 GMT'
+    server.routes['/page'] = [(200, {'ETag': '"v1"', 'Last-Modified': last_modified}, b'body v1'),
+                              (304, {}, b'')]
+    cache = HTMLCache(tmp_path)
+    fetch_html(server.url + '/page', cache=cache)
+    fetched_at = cache.get(server.url + '/page')[1]['fetched_at']
+
+    # max_age=0: the cached copy is stale, so it is revalidated with a conditional GET
+    assert fetch_html(server.url + '/page', cache=cache, max_age=0) == b'body v1'
+    _, headers = server.requests[-1]
+    assert headers['If-None-Match'] == '"v1"'
+    assert headers['If-Modified-Since'] == last_modified
+    assert cache.get(server.url + '/page')[1]['fetched_at'] >= fetched_at
+
+
+def test_fetch_html_replaces_cached_body_when_changed(server, tmp_path):
+    server.routes['/page'] = [(200, {'ETag': '"v1"'}, b'body v1'), (200, {'ETag': '"v2"'}, b'body v2')]
+    cache = HTMLCache(tmp_path)
+    fetch_html(server.url + '/page', cache=cache)
+    assert fetch_html(server.url + '/page', cache=cache, max_age=0) == b'body v2'
+    assert cache.get(server.url + '/page')[1]['etag'] == '"v2"'
+
+
+def test_fetch_html_retries_429_and_5xx(server):
+    server.routes['/page'] = [(429, {'Retry-After': '0'}, b''), (503, {}, b''), (200, {}, b'ok')]
+    limiter = TokenBucket(rate=1000, capacity=10)
+    assert fetch_html(server.url + '/page', limiter=limiter, backoff=0.001) == b'ok'
+    assert server.paths() == ['/page'] * 3
+
+
+def test_fetch_html_gives_up_after_retries(server):
+    server.routes['/page'] = [(500, {}, b'')]
+    with pytest.raises(urllib.error.HTTPError) as excinfo:
+        fetch_html(server.url + '/page', retries=2, backoff=0.001)
+    assert excinfo.value.code == 500
+    assert len(server.requests) == 3
+
+
+def test_fetch_html_does_not_retry_client_errors(server):
+    with pytest.raises(urllib.error.HTTPError):
+        fetch_html(server.url + '/missing', backoff=0.001)
+    assert len(server.requests) == 1
+
+
+def test_scrape_draft_years_resumes_from_checkpoint(server, tmp_path):
+    page = lambda year: DRAFT_PAGE.format(year=year, pick=1).encode('utf-8')
+    server.routes['/years/2020/draft.htm'] = [(200, {}, page(2020))]
+    # 2021 is not published yet on the first run
+    template = server.url + '/years/{year}/draft.htm'
+    checkpoint = JsonlCheckpoint(tmp_path / 'draft.checkpoint.jsonl')
+
+    first = scrape_draft_years([2020, 2021], rate=1000, cache_dir=None, url_template=template,
+                               checkpoint=checkpoint)
+    assert [p['Name'] for p in first[2020]] == ['Player 2020']
+    assert first[2021] == []
+
+    server.routes['/years/2021/draft.htm'] = [(200, {}, page(2021))]
+    server.requests.clear()
+    resumed = JsonlCheckpoint(tmp_path / 'draft.checkpoint.jsonl')
+    second = scrape_draft_years([2020, 2021], rate=1000, cache_dir=None, url_template=template,
+                                checkpoint=resumed)
+    # Only the year missing from the checkpoint is fetched again
+    assert server.paths() == ['/years/2021/draft.htm']
+    assert [p['Name'] for p in second[2020]] == ['Player 2020']
+    assert [p['Name'] for p in second[2021]] == ['Player 2021']
@@ -0,0 +1,53 @@
+"""
+Tests for the cross-validation and hyperparameter search harness
+"""
+
+import pytest
+
+from scoutsense.utils.evaluation import Evaluator, _halving_rounds
+from scoutsense.utils.models import DraftPositionPredictor, PlayerSuccessClassifier
+
+
+@pytest.fixture(scope='module')
+def df_with_text(draft_df):
+    """draft_df plus a free-text column no model can fit on"""
+    return draft_df.assign(scout_notes='fast, raw')
+
+
+@pytest.mark.parametrize('model, cls', [('predictor', DraftPositionPredictor),
+                                        ('classifier', PlayerSuccessClassifier)])
+def test_evaluator_scores_the_features_the_model_trains_on(df_with_text, model, cls):
+    evaluator = Evaluator(df_with_text, model=model, n_splits=2, n_jobs=1, cache_path=None)
+    assert evaluator.feature_cols == cls().train(df_with_text).feature_cols
+    assert 'scout_notes' not in evaluator.feature_cols
+    assert 'position' not in evaluator.feature_cols
+
+
+def test_cross_validate_runs_with_categorical_and_text_columns(df_with_text):
+    evaluator = Evaluator(df_with_text, model='predictor', n_splits=2, n_jobs=1, cache_path=None)
+    folds = evaluator.cross_validate({'n_estimators': 10})
+    assert len(folds) == 2
+    assert folds['score'].notna().all()
+
+
+@pytest.mark.parametrize('factor', [2, 3, 4, 5, 10])
+def test_halving_rounds_are_exact_for_powers_of_the_factor(factor):
+    for power in range(1, 8):
+        assert _halving_rounds(factor ** power, factor) == power
+        assert _halving_rounds(factor ** power + 1, factor) == power + 1
+
+
+def test_halving_rounds_edge_cases():
+    assert _halving_rounds(1, 3) == 1
+    assert _halving_rounds(2, 3) == 1
+    with pytest.raises(ValueError):
+        _halving_rounds(9, 1)
+
+
+def test_halving_search_runs_one_round_per_power_of_the_factor(draft_df):
+    evaluator = Evaluator(draft_df, model='predictor', n_splits=2, n_jobs=1, cache_path=None)
+    space = {'n_estimators': [5, 10, 15], 'max_depth': [2, 3, 4]}
+    table = evaluator.halving_search(n_candidates=9, space=space, factor=3, min_train=50)
+    assert table['round'].unique().tolist() == [2]
+    # 9 candidates -> 3 survivors scored in the final round
+    assert len(table) == 3
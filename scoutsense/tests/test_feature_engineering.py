@@ -0,0 +1,225 @@
+"""
+Tests for feature engineering: the vectorized pipeline against golden frames
+from the row-wise implementation, FeaturePipeline on single, unseen and
+incomplete rows, the on-disk feature cache, and the shared float32 FeatureMatrix
+(parity with each model's own median-fill + StandardScaler path, and models
+trained from it)
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from scoutsense.utils import feature_engineering
+from scoutsense.utils.feature_engineering import (FeatureMatrix, FeaturePipeline, engineer_features,
+                                                  feature_cache_path, load_engineered_features)
+
+from scoutsense.tests.conftest import DATA_FILE
+from scoutsense.utils.models import (DraftPositionPredictor, PlayerComparison, PlayerSuccessClassifier,
+                                     _feature_columns)
+
+
+# Golden frames written by the row-wise (pre-vectorization) engineer_features.
+# The input is a spread of real draft rows plus hand-made edge rows (team
+# 'XXX'): mixed-case and padded codes, NaN/unknown positions, NaN age, height,
+# meets and draft pick, zero college years, picks past round 7, unseen colleges
+GOLDEN_DIR = Path(__file__).parent / 'data'
+
+
+@pytest.fixture(scope='module')
+def golden_input():
+    return pd.read_csv(GOLDEN_DIR / 'golden_features_input.csv')
+
+
+def _assert_matches_golden(engineered, golden_file):
+    # position/position_tier are categoricals now; the golden CSV holds their values
+    engineered = engineered.astype({'position': object, 'position_tier': object})
+    golden = pd.read_csv(GOLDEN_DIR / golden_file)
+    pd.testing.assert_frame_equal(engineered.reset_index(drop=True), golden, check_dtype=False)
+
+
+def test_engineer_features_matches_row_wise_golden(golden_input):
+    _assert_matches_golden(engineer_features(golden_input), 'golden_features.csv')
+
+
+def test_transform_of_unseen_rows_matches_row_wise_golden(golden_input):
+    held_out = golden_input['team'] == 'XXX'
+    pipeline = FeaturePipeline().fit(golden_input[~held_out])
+    _assert_matches_golden(pipeline.transform(golden_input[held_out]), 'golden_features_heldout.csv')
+
+
+@pytest.fixture(scope='module')
+def pipeline(raw_draft_df):
+    return FeaturePipeline().fit(raw_draft_df)
+
+
+def test_pipeline_output_matches_engineer_features(raw_draft_df, draft_df, pipeline):
+    pd.testing.assert_frame_equal(pipeline.transform(raw_draft_df), draft_df)
+
+
+def test_pipeline_does_not_modify_its_input(raw_draft_df, pipeline):
+    before = raw_draft_df.copy()
+    pipeline.transform(raw_draft_df)
+    pd.testing.assert_frame_equal(raw_draft_df, before)
+
+
+def test_single_row_transform_matches_bulk_transform(raw_draft_df, pipeline):
+    bulk = pipeline.transform(raw_draft_df)
+    for i in (0, 1, len(raw_draft_df) - 1):
+        row = pipeline.transform(raw_draft_df.iloc[[i]])
+        # a one-row frame has fewer categories; the values must agree
+        pd.testing.assert_frame_equal(row, bulk.iloc[[i]], check_categorical=False)
+
+
+def test_transform_handles_unseen_categories(raw_draft_df, pipeline):
+    rows = raw_draft_df.head(3).astype({'pos': object, 'college': object})
+    rows['pos'] = ['ZZ', np.nan, ' qb ']
+    rows['college'] = -1
+    out = pipeline.transform(rows)
+
+    numeric = out[pipeline.feature_columns]
+    assert not numeric.isna().any().any()
+    assert list(out.columns[-len(pipeline.tier_columns):]) == pipeline.tier_columns
+    assert out['position_tier'].astype(str).tolist() == ['OTHER', 'OTHER', 'SKILL']
+    # unseen values fall back to the training medians
+    assert (out['position_avg_pick'].iloc[:2] == pipeline.fill_values['position_avg_pick']).all()
+    assert (out['college_frequency'] == pipeline.fill_values['college_frequency']).all()
+
+
+def test_transform_fills_missing_input_columns(raw_draft_df, pipeline):
+    prospect = raw_draft_df.head(1).drop(columns=['draft_pick', 'meets'])
+    out = pipeline.transform(prospect)
+
+    assert not out[pipeline.feature_columns].isna().any().any()
+    assert out['draft_pick'].iloc[0] == pipeline.fill_values['draft_pick']
+    assert out['meets_numeric'].iloc[0] == pipeline.fill_values['meets_numeric']
+    assert 'draft_pick' not in prospect.columns
+
+
+def test_transform_requires_fit():
+    with pytest.raises(ValueError):
+        FeaturePipeline().transform(pd.DataFrame({'pos': ['QB']}))
+
+
+@pytest.fixture
+def draft_csv(tmp_path):
+    """A small copy of the bundled draft CSV that tests may edit"""
+    path = tmp_path / 'draft.csv'
+    lines = DATA_FILE.read_text().splitlines(keepends=True)
+    path.write_text(''.join(lines[:201]))
+    return path
+
+
+def test_cache_hit_matches_fresh_features(draft_csv, tmp_path, monkeypatch):
+    cache_dir = tmp_path / 'cache'
+    fresh = load_engineered_features(draft_csv, use_cache=False)
+    first = load_engineered_features(draft_csv, cache_dir)
+    assert feature_cache_path(draft_csv, cache_dir).exists()
+
+    # A hit reads the Parquet file without recomputing
+    def fail(*args, **kwargs):
+        raise AssertionError("feature cache was not used")
+    monkeypatch.setattr(feature_engineering, 'engineer_features', fail)
+    hit = load_engineered_features(draft_csv, cache_dir)
+
+    pd.testing.assert_frame_equal(first, fresh)
+    pd.testing.assert_frame_equal(hit, fresh)
+
+
+def test_editing_the_input_misses_the_cache(draft_csv, tmp_path):
+    cache_dir = tmp_path / 'cache'
+    before = load_engineered_features(draft_csv, cache_dir)
+    old_key = feature_cache_path(draft_csv, cache_dir)
+
+    lines = draft_csv.read_text().splitlines(keepends=True)
+    draft_csv.write_text(''.join(lines[:101]))
+    after = load_engineered_features(draft_csv, cache_dir)
+
+    assert feature_cache_path(draft_csv, cache_dir) != old_key
+    assert len(before) == 200 and len(after) == 100
+    pd.testing.assert_frame_equal(after, load_engineered_features(draft_csv, use_cache=False))
+
+
+def test_pipeline_version_bump_misses_the_cache(draft_csv, tmp_path, monkeypatch):
+    cache_dir = tmp_path / 'cache'
+    load_engineered_features(draft_csv, cache_dir)
+    old_key = feature_cache_path(draft_csv, cache_dir)
+
+    monkeypatch.setattr(feature_engineering, 'FEATURE_PIPELINE_VERSION',
+                        feature_engineering.FEATURE_PIPELINE_VERSION + 1)
+    new_key = feature_cache_path(draft_csv, cache_dir)
+    assert new_key != old_key and not new_key.exists()
+    load_engineered_features(draft_csv, cache_dir)
+    assert new_key.exists()
+
+
+def test_unreadable_cache_is_recomputed(draft_csv, tmp_path):
+    cache_dir = tmp_path / 'cache'
+    cache_file = feature_cache_path(draft_csv, cache_dir)
+    cache_file.parent.mkdir()
+    cache_file.write_bytes(b'not parquet')
+
+    features = load_engineered_features(draft_csv, cache_dir)
+    pd.testing.assert_frame_equal(features, load_engineered_features(draft_csv, use_cache=False))
+    pd.testing.assert_frame_equal(load_engineered_features(draft_csv, cache_dir), features)
+
+
+@pytest.fixture(scope='module')
+def features(draft_df):
+    return FeatureMatrix(draft_df)
+
+
+@pytest.mark.parametrize('cls', [DraftPositionPredictor, PlayerSuccessClassifier, PlayerComparison])
+def test_model_inputs_match_per_model_scaling(draft_df, features, cls):
+    from sklearn.preprocessing import StandardScaler
+
+    columns, view, fill_values, scaler = features.model_inputs(draft_df, cls.EXCLUDE_COLS)
+    own = draft_df[columns].astype(np.float64)
+    expected_fill = own.median()
+    expected = StandardScaler().fit(own.fillna(expected_fill))
+
+    # Same feature set the model would select itself
+    assert sorted(columns) == sorted(_feature_columns(draft_df, cls.EXCLUDE_COLS))
+    np.testing.assert_allclose(fill_values.fillna(0), expected_fill.fillna(0), rtol=1e-5, atol=1e-4)
+    np.testing.assert_allclose(scaler.mean_, expected.mean_, rtol=1e-4, atol=1e-3)
+    np.testing.assert_allclose(scaler.scale_, expected.scale_, rtol=1e-4)
+    np.testing.assert_allclose(view, expected.transform(own.fillna(expected_fill)), atol=1e-3)
+    # Scoring new rows with the shared scaler reproduces the training matrix
+    np.testing.assert_allclose(scaler.transform(own.fillna(fill_values)), view, atol=1e-3)
+
+
+def test_model_inputs_are_views_of_the_shared_matrix(draft_df, features):
+    for cls in (DraftPositionPredictor, PlayerSuccessClassifier, PlayerComparison):
+        _, view, _, _ = features.model_inputs(draft_df, cls.EXCLUDE_COLS)
+        assert view.dtype == np.float32
+        assert np.shares_memory(view, features.values)
+
+
+def test_model_inputs_reject_a_different_frame(draft_df, features):
+    with pytest.raises(ValueError):
+        features.model_inputs(draft_df.iloc[1:], DraftPositionPredictor.EXCLUDE_COLS)
+
+
+def test_shared_training_matches_own_copy_training(draft_df, features):
+    shared = PlayerSuccessClassifier().train(draft_df, features)
+    own = PlayerSuccessClassifier().train(draft_df)
+    assert sorted(shared.feature_cols) == sorted(own.feature_cols)
+    # float32 vs float64 inputs may move a split threshold, but not the answers overall
+    diff = np.abs(shared.predict_proba_batch(draft_df) - own.predict_proba_batch(draft_df))
+    assert np.mean(diff) < 0.02
+
+    predictor_shared = DraftPositionPredictor().train(draft_df, features)
+    predictor_own = DraftPositionPredictor().train(draft_df)
+    picks = np.abs(predictor_shared.predict_batch(draft_df) - predictor_own.predict_batch(draft_df))
+    assert np.median(picks) <= 1
+
+
+def test_shared_comparator_finds_the_same_players(draft_df, features):
+    shared = PlayerComparison(draft_df, features=features)
+    own = PlayerComparison(draft_df)
+    for idx in draft_df.index[:25]:
+        expected = own.find_similar_players(idx, 5, position_only=True, verbose=False)
+        result = shared.find_similar_players(idx, 5, position_only=True, verbose=False)
+        np.testing.assert_allclose(result['similarity_score'], expected['similarity_score'], atol=1e-3)
@@ -0,0 +1,41 @@
+"""
+Import-time regression tests: the lightweight entry points must not pull in
+heavy dependencies, and stay within a (loose) startup budget. Each import
+runs in a fresh interpreter, as a user's would.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import scoutsense
+from scoutsense.scripts.benchmark_imports import IMPORT_BUDGETS, REPO_ROOT, _import_profile
+
+# Headroom over the benchmark's budgets: shared CI machines are noisy, and a
+# lazy-import regression costs far more than this (seconds, not milliseconds)
+BUDGET_SCALE = float(os.environ.get('SCOUTSENSE_IMPORT_BUDGET_SCALE', 3.0))
+
+
+@pytest.mark.parametrize('module', list(IMPORT_BUDGETS))
+def test_import_is_light_and_within_budget(module):
+    budget_ms, forbidden = IMPORT_BUDGETS[module]
+    cumulative, loaded = _import_profile(module)
+    assert sorted(name for name in forbidden if name in loaded) == []
+    # Best of two, so one scheduling hiccup does not fail the run
+    best_ms = min(cumulative.get(module, 0), _import_profile(module)[0].get(module, 0)) / 1000
+    assert best_ms <= budget_ms * BUDGET_SCALE
+
+
+def test_bare_package_import_loads_no_third_party_packages():
+    code = "import sys, scoutsense; assert 'pandas' not in sys.modules and 'numpy' not in sys.modules"
+    subprocess.run([sys.executable, '-c', code], cwd=REPO_ROOT, check=True)
+
+
+def test_lazy_exports_resolve_on_first_access():
+    assert set(scoutsense.__all__) <= set(dir(scoutsense))
+    from scoutsense.utils.feature_engineering import FeaturePipeline
+    assert scoutsense.FeaturePipeline is FeaturePipeline
+    with pytest.raises(AttributeError):
+        scoutsense.NotAnExport
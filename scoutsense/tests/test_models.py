@@ -0,0 +1,276 @@
+"""
+Tests for model training, persistence and lookup in scoutsense.utils.models
+"""
+
+import numpy as np
+import pytest
+
+from scoutsense.utils.feature_engineering import FeatureMatrix
+
+from scoutsense.utils.models import (NEIGHBOR_TABLE_DIR, DraftPositionPredictor, PlayerComparison,
+                                     PlayerSuccessClassifier, _extend_hash, load_or_train_models)
+from scoutsense.utils.tasks import TaskCancelled
+
+
+def test_cancelled_training_writes_no_artifacts(draft_df, tmp_path):
+    calls = []
+
+    def cancel_after_first_model_is_trained():
+        calls.append(1)
+        # 1st call: before the predictor; 2nd: after it is trained, before it is saved
+        if len(calls) == 2:
+            raise TaskCancelled('train')
+
+    with pytest.raises(TaskCancelled):
+        load_or_train_models(draft_df, tmp_path, parallel=False, cancel_check=cancel_after_first_model_is_trained)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_classifier_fits_on_all_cores_but_scores_single_threaded(draft_df, tmp_path):
+    parallel_fit = PlayerSuccessClassifier(n_jobs=-1).train(draft_df)
+    serial_fit = PlayerSuccessClassifier().train(draft_df)
+    assert parallel_fit.model.n_jobs is None
+    np.testing.assert_array_equal(parallel_fit.predict_proba_batch(draft_df),
+                                  serial_fit.predict_proba_batch(draft_df))
+
+    loaded = PlayerSuccessClassifier.load(parallel_fit.save(tmp_path / 'classifier.joblib'))
+    assert loaded.model.n_jobs is None
+
+
+@pytest.fixture(scope='module')
+def history_and_new_class(draft_df):
+    """draft_df split into the training history and a later draft class"""
+    return draft_df.iloc[:400], draft_df.iloc[400:]
+
+
+def test_predictor_partial_update_adds_iterations(history_and_new_class):
+    history, new_class = history_and_new_class
+    predictor = DraftPositionPredictor(engine='gbr').train(history)
+    before, old_hash, old_cols = predictor._n_iterations(), predictor.data_hash, list(predictor.feature_cols)
+
+    predictor.partial_update(new_class, n_estimators=15)
+    assert predictor._n_iterations() == before + 15
+    assert predictor.feature_cols == old_cols
+    assert predictor.data_hash == _extend_hash(old_hash, new_class)
+    assert predictor.model.warm_start is False
+    assert len(predictor.predict_batch(new_class)) == len(new_class)
+
+
+def test_predictor_partial_update_rejects_hist_engine(history_and_new_class):
+    history, new_class = history_and_new_class
+    predictor = DraftPositionPredictor(engine='hist').train(history)
+    with pytest.raises(ValueError):
+        predictor.partial_update(new_class)
+
+
+def test_partial_update_requires_a_trained_model(history_and_new_class):
+    _, new_class = history_and_new_class
+    with pytest.raises(ValueError):
+        DraftPositionPredictor().partial_update(new_class)
+    with pytest.raises(ValueError):
+        PlayerSuccessClassifier().partial_update(new_class)
+
+
+def test_classifier_partial_update_keeps_at_most_the_budget(history_and_new_class):
+    history, new_class = history_and_new_class
+    classifier = PlayerSuccessClassifier().train(history)
+    before, old_hash = len(classifier.model.estimators_), classifier.data_hash
+
+    classifier.partial_update(new_class, n_estimators=30)
+    after = len(classifier.model.estimators_)
+    assert before <= after <= before + 30
+    # Trimmed to the best size found, with the estimator's own count in step
+    assert classifier.model.n_estimators == after
+    assert classifier.model.warm_start is False
+    assert classifier.data_hash == _extend_hash(old_hash, new_class)
+
+
+def test_classifier_partial_update_needs_both_classes(history_and_new_class):
+    history, new_class = history_and_new_class
+    classifier = PlayerSuccessClassifier().train(history)
+    early_picks = new_class[new_class['draft_round'] <= classifier.success_threshold]
+    with pytest.raises(ValueError):
+        classifier.partial_update(early_picks)
+
+
+@pytest.mark.parametrize('backend', ['kd', 'ball'])
+def test_comparator_with_exact_index_matches_the_scan(draft_df, backend):
+    scan = PlayerComparison(draft_df)
+    indexed = PlayerComparison(draft_df, neighbors=backend)
+    for idx in draft_df.index[:25]:
+        for position_only in (False, True):
+            expected = scan.find_similar_players(idx, 5, position_only, verbose=False)
+            result = indexed.find_similar_players(idx, 5, position_only, verbose=False)
+            np.testing.assert_allclose(result['similarity_score'], expected['similarity_score'], rtol=1e-5)
+
+
+def test_comparator_neighbor_table_matches_the_scan(draft_df, tmp_path):
+    scan = PlayerComparison(draft_df)
+    tabled = PlayerComparison(draft_df)
+    tabled.precompute_neighbors(k=10, path=tmp_path / NEIGHBOR_TABLE_DIR)
+    for idx in draft_df.index[:50]:
+        expected = scan.find_similar_players(idx, 5, position_only=True, verbose=False)
+        result = tabled.find_similar_players(idx, 5, position_only=True, verbose=False)
+        np.testing.assert_allclose(result['similarity_score'], expected['similarity_score'], rtol=1e-5)
+
+
+def test_neighbor_table_reload_is_guarded_by_the_data_hash(draft_df, tmp_path):
+    path = tmp_path / NEIGHBOR_TABLE_DIR
+    PlayerComparison(draft_df).precompute_neighbors(k=5, path=path)
+    assert PlayerComparison(draft_df).load_neighbor_table(path)
+
+    other = PlayerComparison(draft_df.iloc[:-1])
+    assert not other.load_neighbor_table(path)
+    assert other.neighbor_table is None
+    assert not PlayerComparison(draft_df).load_neighbor_table(tmp_path / 'missing')
+
+
+def test_neighbor_table_is_only_built_on_request(draft_df, tmp_path):
+    *_, comparator = load_or_train_models(draft_df, tmp_path, parallel=False)
+    assert comparator.neighbor_table is None
+    assert not (tmp_path / NEIGHBOR_TABLE_DIR).exists()
+
+    *_, comparator = load_or_train_models(draft_df, tmp_path, parallel=False, neighbor_table=True)
+    assert comparator.neighbor_table is not None
+    assert (tmp_path / NEIGHBOR_TABLE_DIR).is_dir()
+
+
+def test_parallel_and_sequential_training_build_the_same_models(draft_df, tmp_path):
+    sequential = load_or_train_models(draft_df, tmp_path / 'sequential', parallel=False)
+    parallel = load_or_train_models(draft_df, tmp_path / 'parallel', parallel=True)
+    np.testing.assert_array_equal(parallel[0].predict_batch(draft_df), sequential[0].predict_batch(draft_df))
+    np.testing.assert_array_equal(parallel[1].predict_proba_batch(draft_df),
+                                  sequential[1].predict_proba_batch(draft_df))
+    np.testing.assert_array_equal(parallel[2]._matrix, sequential[2]._matrix)
+
+
+@pytest.fixture(scope='module')
+def df_with_gaps(draft_df):
+    """draft_df with every fifth bmi and scout_grade missing"""
+    df = draft_df.copy()
+    df.loc[df.index[::5], ['bmi', 'scout_grade']] = np.nan
+    return df
+
+
+def test_hist_engine_fits_the_same_unfilled_rows_it_scores(df_with_gaps):
+    own = DraftPositionPredictor(engine='hist').train(df_with_gaps)
+    shared = DraftPositionPredictor(engine='hist').train(df_with_gaps, FeatureMatrix(df_with_gaps))
+    np.testing.assert_array_equal(shared.predict_batch(df_with_gaps), own.predict_batch(df_with_gaps))
+
+
+def test_hist_engine_ranks_features_by_permutation_importance(df_with_gaps, tmp_path):
+    predictor = DraftPositionPredictor(engine='hist').train(df_with_gaps, FeatureMatrix(df_with_gaps))
+    assert not hasattr(predictor.model, 'feature_importances_')
+    top = predictor.feature_importance(top_n=5)
+    assert len(top) == 5
+    assert set(top) <= set(predictor.feature_cols)
+    assert list(top.values()) == sorted(top.values(), reverse=True)
+
+    loaded = DraftPositionPredictor.load(predictor.save(tmp_path / 'predictor.joblib'))
+    assert loaded.feature_importance(top_n=5) == top
+
+
+@pytest.fixture(scope='module')
+def trained_models(draft_df, artifact_dir):
+    """(predictor, classifier, comparator) loaded from the shared artifacts"""
+    return load_or_train_models(draft_df, artifact_dir, parallel=False)
+
+
+def test_predict_batch_matches_per_row_predict(draft_df, trained_models):
+    predictor, classifier, _ = trained_models
+    rows = draft_df.head(40)
+    picks = predictor.predict_batch(rows)
+    probas = classifier.predict_proba_batch(rows)
+
+    assert picks.shape == probas.shape == (len(rows),)
+    for (_, row), pick, proba in zip(rows.iterrows(), picks, probas):
+        assert predictor.predict(row) == pick
+        assert predictor.predict(row.to_dict()) == pick
+        assert classifier.predict_proba(row) == pytest.approx(proba, abs=1e-12)
+    # Chunking only bounds memory
+    np.testing.assert_array_equal(predictor.predict_batch(rows, chunk_size=7), picks)
+    np.testing.assert_array_equal(classifier.predict_proba_batch(rows, chunk_size=7), probas)
+
+
+def test_batch_scoring_of_no_rows(draft_df, trained_models):
+    predictor, classifier, _ = trained_models
+    assert len(predictor.predict_batch(draft_df.iloc[:0])) == 0
+    assert len(classifier.predict_proba_batch(draft_df.iloc[:0])) == 0
+
+
+def test_scoring_requires_a_trained_model(draft_df):
+    with pytest.raises(ValueError):
+        DraftPositionPredictor().predict_batch(draft_df)
+    with pytest.raises(ValueError):
+        PlayerSuccessClassifier().predict_proba(draft_df.iloc[0])
+
+
+def test_predictor_and_classifier_round_trip(draft_df, trained_models, tmp_path):
+    predictor, classifier, _ = trained_models
+    loaded_predictor = DraftPositionPredictor.load(predictor.save(tmp_path / 'predictor.joblib'))
+    loaded_classifier = PlayerSuccessClassifier.load(classifier.save(tmp_path / 'classifier.joblib'))
+
+    assert loaded_predictor.feature_cols == predictor.feature_cols
+    assert loaded_predictor.data_hash == predictor.data_hash
+    assert loaded_predictor.metrics == predictor.metrics
+    assert loaded_predictor.feature_importance() == predictor.feature_importance()
+    np.testing.assert_array_equal(loaded_predictor.predict_batch(draft_df), predictor.predict_batch(draft_df))
+
+    assert loaded_classifier.feature_cols == classifier.feature_cols
+    assert loaded_classifier.data_hash == classifier.data_hash
+    np.testing.assert_array_equal(loaded_classifier.predict_proba_batch(draft_df),
+                                  classifier.predict_proba_batch(draft_df))
+
+
+def test_comparator_round_trip(trained_models, tmp_path):
+    _, _, comparator = trained_models
+    loaded = PlayerComparison.load(comparator.save(tmp_path / 'comparator.joblib'))
+
+    assert loaded.feature_cols == comparator.feature_cols
+    assert loaded.data_hash == comparator.data_hash
+    np.testing.assert_array_equal(loaded._matrix, comparator._matrix)
+    for idx in comparator.df.index[:10]:
+        for position_only in (False, True):
+            expected = comparator.find_similar_players(idx, 5, position_only, verbose=False)
+            result = loaded.find_similar_players(idx, 5, position_only, verbose=False)
+            assert list(result.index) == list(expected.index)
+            np.testing.assert_array_equal(result['similarity_score'], expected['similarity_score'])
+    name = comparator.df['name'].iloc[0]
+    assert loaded.index.find(name) == comparator.index.find(name)
+
+
+def test_load_rejects_an_artifact_of_another_model(trained_models, tmp_path):
+    predictor, _, _ = trained_models
+    path = predictor.save(tmp_path / 'predictor.joblib')
+    with pytest.raises(ValueError):
+        PlayerSuccessClassifier.load(path)
+    with pytest.raises(ValueError):
+        PlayerComparison.load(path)
+
+
+def _brute_force_similar(comparator, idx, n_similar, position_only):
+    """The original per-pair loop: scipy euclidean to every other row, fully sorted"""
+    from scipy.spatial.distance import euclidean
+    scaled = comparator.df_scaled[comparator.feature_cols].to_numpy(dtype=np.float64)
+    positions = comparator.df['pos'].to_numpy()
+    row_pos = comparator.df.index.get_loc(idx)
+    distances = []
+    for other in range(len(scaled)):
+        if other == row_pos or (position_only and positions[other] != positions[row_pos]):
+            continue
+        distances.append((comparator.df.index[other], euclidean(scaled[row_pos], scaled[other])))
+    distances.sort(key=lambda pair: pair[1])
+    return distances[:n_similar]
+
+
+@pytest.mark.parametrize('position_only', [False, True])
+def test_find_similar_players_matches_brute_force(draft_df, position_only):
+    comparator = PlayerComparison(draft_df)
+    for idx in draft_df.index[::60]:
+        expected = _brute_force_similar(comparator, idx, 5, position_only)
+        result = comparator.find_similar_players(idx, 5, position_only, verbose=False)
+
+        assert idx not in result.index
+        assert list(result.index) == [other for other, _ in expected]
+        np.testing.assert_allclose(result['similarity_score'], [1 / (1 + dist) for _, dist in expected],
+                                   rtol=1e-5)
@@ -0,0 +1,127 @@
+"""
+Tests for the nearest-neighbor backends and the precomputed neighbor table,
+checked against a brute-force scan
+"""
+
+import numpy as np
+import pytest
+
+from scoutsense.utils.neighbors import (NEIGHBOR_BACKENDS, BruteForceIndex, GroupedNeighborIndex, LSHIndex,
+                                        NeighborTable, TreeIndex)
+
+
+@pytest.fixture(scope='module')
+def clustered():
+    """3000 rows in 20 Gaussian clusters, with a group label per row"""
+    rng = np.random.RandomState(0)
+    centers = rng.normal(size=(20, 12)) * 4
+    labels = rng.randint(0, 20, 3000)
+    matrix = (centers[labels] + rng.normal(size=(3000, 12))).astype(np.float32)
+    groups = np.array(['QB', 'WR', 'CB'])[rng.randint(0, 3, 3000)]
+    return matrix, groups
+
+
+@pytest.fixture(scope='module')
+def queries(clustered):
+    return np.random.RandomState(1).randint(0, len(clustered[0]), 100)
+
+
+@pytest.mark.parametrize('backend', ['kd', 'ball'])
+def test_tree_backends_match_brute_force(clustered, queries, backend):
+    matrix, _ = clustered
+    brute = BruteForceIndex().build(matrix)
+    index = NEIGHBOR_BACKENDS[backend]().build(matrix)
+    for q in queries:
+        brute_rows, brute_dists = brute.query(matrix[q], 10)
+        rows, dists = index.query(matrix[q], 10)
+        np.testing.assert_allclose(dists, brute_dists, rtol=1e-5, atol=1e-5)
+        assert set(rows) == set(brute_rows)
+
+
+def test_lsh_recall_against_brute_force(clustered, queries):
+    matrix, _ = clustered
+    brute = BruteForceIndex().build(matrix)
+    lsh = LSHIndex().build(matrix)
+    recalls = []
+    for q in queries:
+        brute_rows, _ = brute.query(matrix[q], 10)
+        rows, dists = lsh.query(matrix[q], 10)
+        # Approximate candidates, but exact distances, closest first
+        np.testing.assert_allclose(dists, np.linalg.norm(matrix[rows] - matrix[q], axis=1), rtol=1e-5)
+        assert np.all(np.diff(dists) >= 0)
+        recalls.append(len(set(rows) & set(brute_rows)) / 10)
+    assert np.mean(recalls) >= 0.85
+
+
+def test_lsh_falls_back_to_a_scan_when_buckets_are_too_small(clustered):
+    matrix, _ = clustered
+    lsh = LSHIndex().build(matrix)
+    rows, _ = lsh.query(matrix[0], len(matrix))
+    assert len(rows) == len(matrix)
+
+
+@pytest.mark.parametrize('backend', sorted(NEIGHBOR_BACKENDS))
+def test_grouped_index_only_returns_the_query_group(clustered, queries, backend):
+    matrix, groups = clustered
+    index = GroupedNeighborIndex(backend).build(matrix, groups)
+    for q in queries[:20]:
+        rows, _ = index.query(matrix[q], 5, group=groups[q])
+        assert len(rows) == 5
+        assert set(groups[rows]) == {groups[q]}
+    rows, dists = index.query(matrix[0], 5, group='K')
+    assert len(rows) == len(dists) == 0
+
+
+def test_grouped_index_save_load_round_trip(clustered, queries, tmp_path):
+    matrix, groups = clustered
+    index = GroupedNeighborIndex('kd').build(matrix, groups)
+    loaded = GroupedNeighborIndex.load(index.save(tmp_path / 'index.joblib'))
+    for q in queries[:10]:
+        for group in (None, groups[q]):
+            np.testing.assert_array_equal(loaded.query(matrix[q], 5, group)[0], index.query(matrix[q], 5, group)[0])
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        GroupedNeighborIndex('annoy')
+    with pytest.raises(ValueError):
+        TreeIndex('cover')
+
+
+def _group_scan(matrix, groups, row, k):
+    """Brute-force k nearest same-group rows of row, excluding row itself"""
+    members = np.flatnonzero((groups == groups[row]) & (np.arange(len(matrix)) != row))
+    return BruteForceIndex().build(matrix[members]).query(matrix[row], k)[1]
+
+
+def test_neighbor_table_matches_a_same_group_scan(clustered):
+    matrix, groups = clustered
+    # A chunk size that does not divide the groups exercises the block edges
+    table = NeighborTable.compute(matrix, groups, k=8, chunk_size=97)
+    for row in range(0, len(matrix), 37):
+        rows, dists = table.lookup(row, 8)
+        np.testing.assert_allclose(dists, _group_scan(matrix, groups, row, 8), rtol=1e-5, atol=1e-5)
+        assert row not in rows
+        assert set(groups[rows]) == {groups[row]}
+
+
+def test_neighbor_table_pads_small_groups(clustered):
+    matrix, groups = clustered
+    groups = groups.copy()
+    groups[:3] = 'K'  # Three kickers: two neighbors each
+    groups[3] = None  # No position: no neighbors
+    table = NeighborTable.compute(matrix, groups, k=5)
+    assert list(table.rows[0, 2:]) == [-1, -1, -1]
+    assert np.isinf(table.dists[0, 2:]).all()
+    assert len(table.lookup(0, 5)[0]) == 2
+    assert len(table.lookup(3, 5)[0]) == 0
+
+
+def test_neighbor_table_save_load_is_memory_mapped(clustered, tmp_path):
+    matrix, groups = clustered
+    table = NeighborTable.compute(matrix, groups, k=4, data_hash='abc')
+    loaded = NeighborTable.load(table.save(tmp_path / 'neighbors'))
+    assert isinstance(loaded.rows, np.memmap)
+    assert loaded.data_hash == 'abc'
+    np.testing.assert_array_equal(loaded.rows, table.rows)
+    np.testing.assert_array_equal(loaded.dists, table.dists)
@@ -0,0 +1,73 @@
+"""
+Tests for PlayerIndex: exact, prefix and fuzzy name lookup
+"""
+
+import pandas as pd
+import pytest
+
+from scoutsense.utils.player_index import PlayerIndex, normalize_name
+
+
+@pytest.fixture(scope='module')
+def index():
+    names = pd.Series(['Matthew Stafford', 'Johnny Knox', "D'Andre Swift", 'D.J. Smith',
+                       'Tom Brandstater', 'Aaron Smith', 'José Núñez', 'Johnny Knox', None],
+                      index=[10, 11, 12, 13, 14, 15, 16, 17, 18])
+    return PlayerIndex(names)
+
+
+def test_normalize_name():
+    assert normalize_name("  D'Andre   Swift ") == 'dandre swift'
+    assert normalize_name('José Núñez') == 'jose nunez'
+    assert normalize_name(None) == ''
+
+
+def test_exact_lookup_ignores_case_accents_and_punctuation(index):
+    assert index.exact('matthew stafford') == [10]
+    assert index.exact('DAndre Swift') == [12]
+    assert index.exact('Jose Nunez') == [16]
+    assert index.exact('Johnny Knox') == [11, 17]
+    assert index.exact('Matthew') == []
+
+
+def test_prefix_lookup_matches_full_names_then_tokens(index):
+    assert index.prefix('matthew sta') == [10]
+    assert index.prefix('stafford') == [10]
+    assert index.prefix('smi') == [13, 15]
+    assert index.prefix('d') == [12, 13]
+    assert index.prefix('s', limit=2) == [10, 12]
+    assert index.prefix('') == []
+
+
+def test_fuzzy_lookup_ranks_typos_by_similarity(index):
+    labels = [label for label, _ in index.fuzzy('Mathew Staford')]
+    assert labels[0] == 10
+    scores = [score for _, score in index.fuzzy('Johnny Knoxx')]
+    assert scores == sorted(scores, reverse=True)
+    assert index.fuzzy('zzzz qqqq') == []
+
+
+def test_search_ranks_exact_then_prefix_then_fuzzy(index):
+    assert index.search('Aaron Smith')[0] == 15
+    assert index.search('smith')[:2] == [13, 15]
+    assert index.search('Mathew Staford') == [10]
+
+
+def test_find_takes_exact_or_unique_prefix_matches_only(index):
+    assert index.find('MATTHEW STAFFORD') == 10
+    assert index.find('Johnny Knox') == 11  # Duplicate names: the first row
+    assert index.find('stafford') == 10
+    assert index.find('brandst') == 14
+
+
+def test_find_rejects_ambiguous_and_fuzzy_matches(index):
+    assert index.find('smith') is None  # Two Smiths
+    assert index.find('Bob Smith') is None
+    assert index.find('Johnny Nobody') is None
+    assert index.find('Tom Brady') is None
+    assert index.find('Mathew Staford') is None
+    assert index.find('') is None
+
+
+def test_names_returns_display_names(index):
+    assert index.names([12, 16]) == ["D'Andre Swift", 'José Núñez']
@@ -0,0 +1,102 @@
+"""
+Tests for batch scoring with the persisted models and feature pipeline
+"""
+
+import shutil
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from scoutsense.tests.conftest import COMBINED_FILE, DATA_FILE
+from scoutsense.utils.data_loader import load_draft_data
+from scoutsense.utils.feature_engineering import FeaturePipeline
+from scoutsense.utils.models import PIPELINE_FILE, load_or_train_models
+from scoutsense.utils.scoring import (SCORING_STAGES, _with_model_columns, load_feature_pipeline,
+                                      load_scoring_models, score_file)
+
+
+@pytest.fixture(scope='module')
+def models(artifact_dir):
+    return load_scoring_models(artifact_dir)
+
+
+@pytest.fixture
+def prospects_csv(tmp_path):
+    path = tmp_path / 'prospects.csv'
+    pd.read_csv(DATA_FILE).head(120).to_csv(path, index=False)
+    return path
+
+
+def test_training_saves_a_pipeline_tagged_with_the_models_data_hash(artifact_dir, models):
+    pipeline = load_feature_pipeline(artifact_dir, models)
+    assert pipeline.data_hash is not None
+    assert all(model.data_hash == pipeline.data_hash for model in models)
+
+
+def test_score_file_matches_the_in_memory_models(artifact_dir, models, prospects_csv, tmp_path):
+    output = tmp_path / 'predictions.parquet'
+    n_rows, timings = score_file(prospects_csv, output, artifact_dir, chunk_size=50)
+    assert n_rows == 120
+    assert set(timings) == set(SCORING_STAGES)
+
+    scored = pd.read_parquet(output)
+    predictor, classifier = models
+    features = load_feature_pipeline(artifact_dir, models).transform(load_draft_data(str(prospects_csv)))
+    np.testing.assert_array_equal(scored['predicted_pick'], predictor.predict_batch(features))
+    np.testing.assert_allclose(scored['success_probability'], classifier.predict_proba_batch(features))
+
+
+def test_models_trained_on_a_pre_engineered_table_score_raw_rows(combined_artifact_dir, prospects_csv, tmp_path):
+    # The combined CSV carries numeric columns (draft_year, pos_tier_line, ...)
+    # the pipeline does not output; the models must not depend on them
+    pipeline = load_feature_pipeline(combined_artifact_dir, load_scoring_models(combined_artifact_dir))
+    assert 'draft_year' in load_draft_data(str(COMBINED_FILE)).columns
+    for model in load_scoring_models(combined_artifact_dir):
+        assert set(model.feature_cols) <= set(pipeline.feature_columns)
+
+    n_rows, _ = score_file(prospects_csv, tmp_path / 'predictions.csv', combined_artifact_dir)
+    scored = pd.read_csv(tmp_path / 'predictions.csv')
+    assert n_rows == len(scored) == 120
+    assert scored['success_probability'].between(0, 1).all()
+
+
+def test_retraining_on_other_data_refits_the_pipeline(draft_df, tmp_path):
+    load_or_train_models(draft_df.iloc[:300], tmp_path, parallel=False)
+    first = FeaturePipeline.load(tmp_path / PIPELINE_FILE)
+    load_or_train_models(draft_df.iloc[300:], tmp_path, parallel=False)
+    models = load_scoring_models(tmp_path)
+    second = load_feature_pipeline(tmp_path, models)
+    assert second.data_hash != first.data_hash
+
+
+def test_missing_pipeline_is_an_error(artifact_dir, models, tmp_path):
+    shutil.copytree(artifact_dir, tmp_path, dirs_exist_ok=True)
+    (tmp_path / PIPELINE_FILE).unlink()
+    with pytest.raises(FileNotFoundError):
+        load_feature_pipeline(tmp_path, models)
+
+
+def test_pipeline_fit_on_other_data_is_refused(artifact_dir, models, raw_draft_df, prospects_csv, tmp_path):
+    shutil.copytree(artifact_dir, tmp_path / 'artifacts')
+    other = FeaturePipeline().fit(raw_draft_df.head(300))
+    other.data_hash = 'other'
+    other.save(tmp_path / 'artifacts' / PIPELINE_FILE)
+    with pytest.raises(ValueError, match='DraftPositionPredictor, PlayerSuccessClassifier'):
+        load_feature_pipeline(tmp_path / 'artifacts', models)
+    with pytest.raises(ValueError):
+        score_file(prospects_csv, tmp_path / 'predictions.csv', tmp_path / 'artifacts')
+
+
+def test_missing_model_columns_are_an_error(artifact_dir, models, raw_draft_df):
+    features = load_feature_pipeline(artifact_dir, models).transform(raw_draft_df.head(5))
+    with pytest.raises(ValueError, match='scout_grade, position_avg_pick'):
+        _with_model_columns(features.drop(columns=['scout_grade', 'position_avg_pick']), models)
+
+
+def test_missing_model_columns_can_be_filled_on_request(artifact_dir, models, raw_draft_df, capsys):
+    predictor, _ = models
+    features = load_feature_pipeline(artifact_dir, models).transform(raw_draft_df.head(5))
+    filled = _with_model_columns(features.drop(columns=['scout_grade']), models, fill_missing=True)
+    assert (filled['scout_grade'] == predictor.fill_values['scout_grade']).all()
+    assert 'scout_grade' in capsys.readouterr().out
@@ -0,0 +1,173 @@
+"""
+Tests for the prediction service: MicroBatcher coalescing and the HTTP endpoints
+"""
+
+import http.client
+import json
+import threading
+from urllib.parse import quote
+
+import pytest
+
+from scoutsense.utils.models import PlayerComparison
+from scoutsense.utils.service import MAX_SIMILAR, MicroBatcher, PredictionService, make_server
+
+
+def _doubling_batcher(max_batch_rows, max_wait_ms=200):
+    """MicroBatcher doubling each record, and the list of batches it was called with"""
+    calls = []
+
+    def score_batch(records):
+        calls.append(list(records))
+        if 'bad' in records:
+            raise ValueError('bad record')
+        return [record * 2 for record in records]
+
+    return MicroBatcher(score_batch, max_batch_rows, max_wait_ms), calls
+
+
+def test_concurrent_requests_share_a_batch_and_get_their_own_slice():
+    batcher, calls = _doubling_batcher(max_batch_rows=100)
+    futures = [batcher.submit([1, 2]), batcher.submit([3]), batcher.submit([4, 5, 6])]
+    assert [future.result(5) for future in futures] == [[2, 4], [6], [8, 10, 12]]
+    assert calls == [[1, 2, 3, 4, 5, 6]]
+    batcher.close()
+    assert batcher.stats()['requests'] == 3
+    assert batcher.stats()['batches'] == 1
+    assert batcher.stats()['mean_batch_rows'] == 6
+
+
+def test_batch_is_scored_once_it_reaches_max_batch_rows():
+    batcher, calls = _doubling_batcher(max_batch_rows=4)
+    futures = [batcher.submit([i, i]) for i in range(3)]
+    assert [future.result(5) for future in futures] == [[0, 0], [2, 2], [4, 4]]
+    assert calls == [[0, 0, 1, 1], [2, 2]]
+    batcher.close()
+
+
+def test_failed_batch_falls_back_to_scoring_each_request_alone():
+    batcher, calls = _doubling_batcher(max_batch_rows=100)
+    good, bad, other = batcher.submit([1]), batcher.submit([2, 'bad']), batcher.submit([3])
+    assert good.result(5) == [2]
+    assert other.result(5) == [6]
+    with pytest.raises(ValueError):
+        bad.result(5)
+    assert calls == [[1, 2, 'bad', 3], [1], [2, 'bad'], [3]]
+    batcher.close()
+
+
+def test_close_scores_requests_already_queued():
+    batcher, calls = _doubling_batcher(max_batch_rows=1, max_wait_ms=0)
+    futures = [batcher.submit([i]) for i in range(5)]
+    batcher.close()
+    assert all(future.done() for future in futures)
+    assert [future.result() for future in futures] == [[0], [2], [4], [6], [8]]
+    assert len(calls) == 5
+
+
+@pytest.fixture(scope='module')
+def service(artifact_dir):
+    service = PredictionService(artifact_dir)
+    yield service
+    service.close()
+
+
+@pytest.fixture(scope='module')
+def combined_service(combined_artifact_dir):
+    service = PredictionService(combined_artifact_dir)
+    yield service
+    service.close()
+
+
+def _client(service):
+    """Serve service on a free port; yields request(method, path, body) -> (status, JSON)"""
+    server = make_server(service, port=0)
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    conn = http.client.HTTPConnection(*server.server_address[:2], timeout=10)
+
+    def request(method, path, body=None):
+        conn.request(method, path, body=json.dumps(body) if body is not None else None)
+        response = conn.getresponse()
+        return response.status, json.loads(response.read())
+
+    yield request
+    conn.close()
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(service):
+    yield from _client(service)
+
+
+@pytest.fixture
+def combined_client(combined_service):
+    yield from _client(combined_service)
+
+
+def test_predict_endpoint_scores_one_or_many_prospects(client, raw_draft_df):
+    prospects = json.loads(raw_draft_df.head(3).to_json(orient='records'))
+    status, single = client('POST', '/predict', prospects[0])
+    assert status == 200 and len(single) == 1
+    status, many = client('POST', '/predict', prospects)
+    assert status == 200 and len(many) == 3
+    assert many[0] == single[0]
+    assert client('POST', '/predict', [1, 2])[0] == 400
+
+
+def test_predict_endpoint_with_models_trained_as_the_ui_trains_them(combined_client, raw_draft_df):
+    prospects = json.loads(raw_draft_df.head(5).to_json(orient='records'))
+    status, predictions = combined_client('POST', '/predict', prospects)
+    assert status == 200
+    assert len(predictions) == 5
+    assert all(0 <= p['success_probability'] <= 1 for p in predictions)
+
+
+def test_similar_endpoint(client, raw_draft_df):
+    name = quote(raw_draft_df.loc[0, 'name'])
+    status, players = client('GET', f'/similar?name={name}&n=3&position_only=1')
+    assert status == 200
+    assert len(players) == 3
+    assert {player['pos'] for player in players} == {raw_draft_df.loc[0, 'pos']}
+    assert client('GET', '/similar?name=Nobody%20Atall')[0] == 404
+
+
+def test_similar_does_not_fall_back_to_a_fuzzy_match(client, raw_draft_df):
+    name = raw_draft_df.loc[0, 'name']
+    status, body = client('GET', f'/similar?name={quote(name[:-1] + "x")}')
+    assert status == 404
+    assert 'not found' in body['error']
+    # Upper-cased, the exact name still resolves
+    assert client('GET', f'/similar?name={quote(name.upper())}&n=2')[0] == 200
+
+
+@pytest.mark.parametrize('n', ['0', '-3', str(MAX_SIMILAR + 1), 'five'])
+def test_similar_rejects_bad_n(client, raw_draft_df, n):
+    status, body = client('GET', f"/similar?name={quote(raw_draft_df.loc[0, 'name'])}&n={n}")
+    assert status == 400
+    assert "'n'" in body['error']
+
+
+def test_similar_returns_an_empty_list_for_a_player_without_comps(service, client, draft_df):
+    # A comparator where a single kicker is left at the K position
+    kickers = draft_df.index[draft_df['pos'] == 'K']
+    comparator, service.comparator = service.comparator, PlayerComparison(draft_df.drop(kickers[1:]))
+    try:
+        name = quote(draft_df.loc[kickers[0], 'name'])
+        assert client('GET', f'/similar?name={name}&position_only=1') == (200, [])
+    finally:
+        service.comparator = comparator
+
+
+def test_similar_failure_is_a_json_500(service, client, monkeypatch):
+    def broken(*args, **kwargs):
+        raise RuntimeError('index corrupted')
+
+    monkeypatch.setattr(service, 'similar', broken)
+    status, body = client('GET', '/similar?name=Anyone')
+    assert status == 500
+    assert 'index corrupted' in body['error']
+    # The connection survives the error
+    assert client('GET', '/health') == (200, {'status': 'ok'})
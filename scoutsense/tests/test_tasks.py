@@ -0,0 +1,165 @@
+"""
+Tests for the UI's background TaskExecutor: result delivery, coalescing,
+cancellation callbacks and batched queue notification
+"""
+
+import threading
+
+import pytest
+
+from scoutsense.utils.tasks import NotifyingQueue, TaskCancelled, TaskExecutor
+
+
+def _next_message(results, timeout=5):
+    typ, callback, value = results.get(timeout=timeout)
+    return typ, callback, value
+
+
+def _blocking_task(started, release, value):
+    """Task that signals started, then waits for release, checking for cancellation"""
+    def task(ctx):
+        started.set()
+        while not release.wait(0.01):
+            ctx.check()
+        return value
+    return task
+
+
+@pytest.fixture
+def executor():
+    results = NotifyingQueue()
+    tasks = TaskExecutor(results, max_workers=2)
+    yield tasks, results
+    tasks.shutdown()
+
+
+def test_result_is_delivered_through_the_queue(executor):
+    tasks, results = executor
+    on_done = lambda value: None
+    tasks.submit("load", lambda ctx: 42, on_done=on_done)
+    assert _next_message(results) == ("result", on_done, 42)
+
+
+def test_error_is_delivered_to_on_error(executor):
+    tasks, results = executor
+    on_error = lambda e: None
+
+    def task(ctx):
+        raise ValueError("bad file")
+
+    tasks.submit("load", task, on_error=on_error)
+    typ, callback, error = _next_message(results)
+    assert (typ, callback) == ("task_error", on_error)
+    assert isinstance(error, ValueError)
+
+
+def test_repeated_submissions_coalesce_into_the_latest(executor):
+    tasks, results = executor
+    started, release = threading.Event(), threading.Event()
+    ran = []
+    tasks.submit("predict", _blocking_task(started, release, "first"))
+    assert started.wait(5)
+    for value in ("second", "third", "latest"):
+        tasks.submit("predict", lambda ctx, value=value: ran.append(value) or value)
+    release.set()
+
+    # The running task is superseded (its result dropped) and only the last pending one runs
+    assert _next_message(results)[2] == "latest"
+    assert ran == ["latest"]
+    assert results.empty()
+
+
+def test_superseded_task_gets_no_cancel_callback(executor):
+    tasks, results = executor
+    started, release = threading.Event(), threading.Event()
+    on_cancel = lambda e: None
+    tasks.submit("train", _blocking_task(started, release, "old"), on_cancel=on_cancel)
+    assert started.wait(5)
+    tasks.submit("train", lambda ctx: "new")
+    assert _next_message(results) == ("result", None, "new")
+    assert results.empty()
+
+
+def test_cancel_calls_on_cancel_and_drops_the_result(executor):
+    tasks, results = executor
+    started, release = threading.Event(), threading.Event()
+    on_done, on_cancel = (lambda value: None), (lambda e: None)
+    tasks.submit("train", _blocking_task(started, release, "models"), on_done=on_done, on_cancel=on_cancel)
+    assert started.wait(5)
+    tasks.cancel("train")
+
+    typ, callback, error = _next_message(results)
+    assert (typ, callback) == ("task_cancelled", on_cancel)
+    assert isinstance(error, TaskCancelled)
+    assert results.empty()
+    assert not tasks.is_running("train")
+
+
+def test_cancel_of_a_task_that_ignores_it_still_calls_on_cancel(executor):
+    tasks, results = executor
+    started, release = threading.Event(), threading.Event()
+    on_cancel = lambda e: None
+
+    def uninterruptible(ctx):
+        started.set()
+        release.wait(5)
+        return "stale"
+
+    tasks.submit("train", uninterruptible, on_cancel=on_cancel)
+    assert started.wait(5)
+    tasks.cancel("train")
+    release.set()
+    assert _next_message(results)[:2] == ("task_cancelled", on_cancel)
+
+
+def test_cancel_drops_pending_submission(executor):
+    tasks, results = executor
+    started, release = threading.Event(), threading.Event()
+    ran = []
+    tasks.submit("similar", _blocking_task(started, release, None))
+    assert started.wait(5)
+    tasks.submit("similar", lambda ctx: ran.append("pending"))
+    tasks.cancel("similar")
+    release.set()
+    tasks.submit("similar", lambda ctx: "after")
+    assert _next_message(results)[2] == "after"
+    assert ran == []
+
+
+def test_progress_is_ignored_once_cancelled(executor):
+    tasks, results = executor
+    cancelled = threading.Event()
+
+    def task(ctx):
+        ctx.progress(10, "working")
+        ctx.cancel()
+        ctx.progress(50, "ignored")
+        cancelled.set()
+
+    tasks.submit("load", task)
+    assert cancelled.wait(5)
+    assert results.get(timeout=5) == ("status", "working")
+    assert results.get(timeout=5) == ("progress", 10)
+    while tasks.is_running("load"):
+        threading.Event().wait(0.01)
+    # Cancelled (without an on_cancel): nothing else is delivered
+    assert results.empty()
+
+
+def test_notifying_queue_notifies_once_per_batch():
+    calls = []
+    messages = NotifyingQueue(notify=lambda: calls.append(1))
+    for i in range(5):
+        messages.put(("progress", i))
+    assert len(calls) == 1
+    assert messages.drain() == [("progress", i) for i in range(5)]
+    messages.put(("status", "again"))
+    assert len(calls) == 2
+
+
+def test_notifying_queue_drain_respects_max_items():
+    messages = NotifyingQueue()
+    for i in range(5):
+        messages.put(i)
+    assert messages.drain(2) == [0, 1]
+    assert messages.drain() == [2, 3, 4]
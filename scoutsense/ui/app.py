@@ -6,55 +6,64 @@ ScoutSense UI - Tkinter-based GUI for NFL Draft Prediction and Player Comparison
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import pandas as pd
 from pathlib import Path
 import sys
 import os
 import glob
 import argparse
-import threading
-import queue
-import time
-
-# Matplotlib (optional embedding) - used for Analytics charts
-try:
-    import matplotlib
-    from matplotlib.figure import Figure
-    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-    MATPLOTLIB_AVAILABLE = True
-except Exception:
-    Figure = None
-    FigureCanvasTkAgg = None
-    MATPLOTLIB_AVAILABLE = False
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from utils.models import (
-    DraftPositionPredictor,
-    PlayerSuccessClassifier,
-    PlayerComparison
-)
+from utils.data_loader import load_draft_data
+from utils.models import load_or_train_models
+from utils.player_index import PlayerIndex
+from utils.tasks import NotifyingQueue, TaskExecutor
 
-# Try to use ttkbootstrap for a modern theme if available, otherwise fall back to ttk themes
-try:
-    import ttkbootstrap as ttkb
-    TB_AVAILABLE = True
-except Exception:
-    ttkb = None
-    TB_AVAILABLE = False
+
+def _load_matplotlib():
+    """
+    Import the Matplotlib pieces used for Analytics charts (optional embedding).
+    Deferred until the Analytics tab is first shown, keeping it off the startup path.
+    
+    Returns:
+        (Figure, FigureCanvasTkAgg), or None if Matplotlib is not installed
+    """
+    try:
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+    except Exception:
+        return None
+    return Figure, FigureCanvasTkAgg
+
+
+# Type-ahead player combos: at most this many matches are rendered, and the
+# index is queried only after typing pauses for this long
+AUTOCOMPLETE_LIMIT = 25
+AUTOCOMPLETE_DEBOUNCE_MS = 150
+
+# Background messages wake the Tk loop through this virtual event; each wake-up
+# handles at most QUEUE_BATCH_SIZE messages before yielding so Tk can redraw
+QUEUE_EVENT = "<<ScoutSenseQueue>>"
+QUEUE_BATCH_SIZE = 100
+
+# Keys that navigate a combobox rather than edit its text
+_NAVIGATION_KEYS = {"Up", "Down", "Left", "Right", "Return", "KP_Enter", "Escape", "Tab",
+                    "Shift_L", "Shift_R", "Control_L", "Control_R", "Alt_L", "Alt_R"}
 
 
 class ScoutSenseApp:
     """Main Tkinter application for ScoutSense"""
     
-    def __init__(self, root, initial_data_path=None, auto_train=False):
+    def __init__(self, root, initial_data_path=None, auto_train=False, queue_poll_ms=None):
         self.root = root
         self.root.title("ScoutSense - NFL Draft Prediction & Comparison")
         self.root.geometry("1000x700")
         
         # Initialize data and models
         self.df = None
+        self.player_index = None
+        self._autocomplete_jobs = {}
         self.predictor = None
         self.classifier = None
         self.comparator = None
@@ -62,22 +71,29 @@ class ScoutSenseApp:
         # Setup UI
         self.setup_ui()
         # Background queue for cross-thread UI updates
-        self._bg_queue = queue.Queue()
-        # Start queue processor
-        self._process_queue()
+        self._bg_queue = NotifyingQueue()
+        # Worker pool for loading, training and inference; results come back via the queue
+        self._tasks = TaskExecutor(self._bg_queue)
+        # Start queue processor: event-driven when Tcl can take events from worker
+        # threads, otherwise (or when asked, for benchmarking) poll every queue_poll_ms
+        threaded_tcl = bool(self.root.tk.call('info', 'exists', 'tcl_platform(threaded)'))
+        self._queue_poll_ms = queue_poll_ms or (None if threaded_tcl else 200)
+        if self._queue_poll_ms is None:
+            self.root.bind(QUEUE_EVENT, lambda event: self._process_queue())
+            self._bg_queue.notify = self._notify_queue
+        # Drain anything posted before mainloop starts (and start polling, if polling)
+        self.root.after_idle(self._process_queue)
         # Attempt to load initial data if provided
         self._auto_train_on_startup = bool(auto_train)
         if initial_data_path:
             try:
-                self.load_data_from_path(initial_data_path)
+                # If auto-train requested, training starts once the data has loaded
+                self.load_data_from_path(
+                    initial_data_path,
+                    on_loaded=self.train_models if self._auto_train_on_startup else None)
             except Exception:
                 # Don't block UI startup if initial load fails
                 pass
-            else:
-                # If auto-train requested, schedule training after mainloop starts
-                if self._auto_train_on_startup:
-                    # schedule shortly after startup so the UI initializes cleanly
-                    self.root.after(100, lambda: self.train_models())
         
     def setup_ui(self):
         """Setup the main UI layout"""
@@ -98,6 +114,7 @@ class ScoutSenseApp:
         self.notebook.add(self.tab_predictor, text="Draft Predictor")
         self.notebook.add(self.tab_comparison, text="Player Comparison")
         self.notebook.add(self.tab_analytics, text="Analytics")
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
         # Create a persistent bottom status bar with progress
         status_bar = ttk.Frame(self.root)
@@ -108,17 +125,18 @@ class ScoutSenseApp:
         self.progress = ttk.Progressbar(status_bar, orient="horizontal", mode="determinate", maximum=100)
         self.progress.pack(side="right", padx=8, pady=4)
 
-        # Apply theme if ttkbootstrap is available
-        if TB_AVAILABLE:
-            try:
+        # Use ttkbootstrap for a modern theme if available, otherwise fall back to ttk themes
+        try:
+            import ttkbootstrap as ttkb
+        except Exception:
+            ttkb = None
+        try:
+            if ttkb is not None:
                 ttkb.Style(theme="litera")
-            except Exception:
-                pass
-        else:
-            try:
+            else:
                 ttk.Style().theme_use("clam")
-            except Exception:
-                pass
+        except Exception:
+            pass
 
         # Setup each tab
         self.setup_home_tab()
@@ -233,6 +251,7 @@ Getting Started:
         self.player_var = tk.StringVar()
         self.player_combo = ttk.Combobox(select_frame, textvariable=self.player_var, width=30, state="normal")
         self.player_combo.pack(side="left", padx=5)
+        self._setup_autocomplete(self.player_combo)
         
         ttk.Button(select_frame, text="Predict", command=self.predict_draft_position).pack(side="left", padx=5)
         
@@ -258,6 +277,7 @@ Getting Started:
         self.compare_player_var = tk.StringVar()
         self.compare_player_combo = ttk.Combobox(options_frame, textvariable=self.compare_player_var, width=30, state="normal")
         self.compare_player_combo.pack(side="left", padx=5)
+        self._setup_autocomplete(self.compare_player_combo)
         
         ttk.Label(options_frame, text="Similar Players:").pack(side="left", padx=5)
         
@@ -297,20 +317,36 @@ Getting Started:
         # Left: textual results
         self.analytics_results = self._create_results_text_widget(results_frame)
 
-        # Right: Matplotlib chart area (if available)
-        if MATPLOTLIB_AVAILABLE:
-            chart_frame = ttk.Frame(results_frame)
-            chart_frame.pack(fill="both", expand=True, pady=6)
-            # Create a Figure for plotting
-            self.chart_fig = Figure(figsize=(6, 3), dpi=100)
-            self.chart_ax = self.chart_fig.add_subplot(111)
-            self.chart_canvas = FigureCanvasTkAgg(self.chart_fig, master=chart_frame)
-            self.chart_canvas.get_tk_widget().pack(fill="both", expand=True)
-        else:
-            # If matplotlib isn't available, leave space but don't crash
-            self.chart_fig = None
-            self.chart_ax = None
-            self.chart_canvas = None
+        # Right: Matplotlib chart area, filled in by _ensure_chart on first view
+        self.chart_frame = ttk.Frame(results_frame)
+        self.chart_frame.pack(fill="both", expand=True, pady=6)
+        self.chart_fig = None
+        self.chart_ax = None
+        self.chart_canvas = None
+        self._chart_checked = False
+
+    def _on_tab_changed(self, event=None):
+        """Build the Analytics chart the first time its tab is selected"""
+        if self.notebook.select() == str(self.tab_analytics):
+            self._ensure_chart()
+
+    def _ensure_chart(self):
+        """
+        Create the embedded Matplotlib chart (importing Matplotlib) on first call.
+        
+        Returns:
+            True if the chart is available
+        """
+        if not self._chart_checked:
+            self._chart_checked = True
+            matplotlib_parts = _load_matplotlib()
+            if matplotlib_parts is not None:
+                Figure, FigureCanvasTkAgg = matplotlib_parts
+                self.chart_fig = Figure(figsize=(6, 3), dpi=100)
+                self.chart_ax = self.chart_fig.add_subplot(111)
+                self.chart_canvas = FigureCanvasTkAgg(self.chart_fig, master=self.chart_frame)
+                self.chart_canvas.get_tk_widget().pack(fill="both", expand=True)
+        return self.chart_ax is not None
         
     def load_data(self):
         """Load data file"""
@@ -320,94 +356,144 @@ Getting Started:
         )
         
         if file_path:
-            try:
-                self._load_data_internal(file_path)
+            def loaded():
                 messagebox.showinfo("Success", f"Data loaded successfully!\nRows: {len(self.df)}")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to load data:\n{str(e)}")
+            self._start_load(file_path, on_loaded=loaded)
 
-    def load_data_from_path(self, file_path):
+    def load_data_from_path(self, file_path, on_loaded=None):
         """Load data from a given file path (used at startup)."""
         if not file_path:
             raise ValueError("No file path provided")
         file_path = str(file_path)
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"Data file not found: {file_path}")
-        self._load_data_internal(file_path)
-    
-    def _load_data_internal(self, file_path):
-        """Internal method to load CSV data and update UI"""
-        self.df = pd.read_csv(file_path)
+        self._start_load(file_path, on_loaded=on_loaded)
+
+    def _start_load(self, file_path, on_loaded=None):
+        """Load file_path in the background; on_loaded runs on the main thread afterwards"""
+        # Models trained on the previous table are about to go stale
+        self._tasks.cancel("train")
+        self.bottom_status_var.set(f"Loading {Path(file_path).name}...")
+
+        def done(result):
+            self._apply_loaded_data(file_path, *result)
+            if on_loaded is not None:
+                on_loaded()
+
+        def failed(e):
+            self.bottom_status_var.set("Error")
+            messagebox.showerror("Error", f"Failed to load data:\n{str(e)}")
+
+        self._tasks.submit("load", lambda ctx: self._load_data_internal(ctx, file_path),
+                           on_done=done, on_error=failed)
+
+    def _load_data_internal(self, ctx, file_path):
+        """Background worker: read the CSV and build its name index"""
+        ctx.progress(status=f"Reading {Path(file_path).name}...")
+        df = load_draft_data(file_path)
+        ctx.check()
+        ctx.progress(status="Indexing player names...")
+        # Name index built once per load; shared with the comparator after training
+        index = PlayerIndex(df['name'])
+        return df, index
+
+    def _apply_loaded_data(self, file_path, df, index):
+        """Install a freshly loaded table and update the UI (main thread)"""
+        self.df = df
+        self.player_index = index
         self.status_label.config(
             text=f"Loaded: {Path(file_path).name} ({len(self.df)} rows)",
             foreground="green"
         )
+        self.bottom_status_var.set("Ready")
         self.update_player_combos()
-                
+
     def train_models(self):
         """Train all models"""
         if self.df is None:
             messagebox.showwarning("Warning", "Please load data first")
             return
-        # Run training in a background thread and update UI via queue
+        # Run training on the worker pool and update UI via queue
         self._toggle_buttons(False)
         self.progress['value'] = 0
         self.bottom_status_var.set("Starting training...")
-        thread = threading.Thread(target=self._train_models_thread, daemon=True)
-        thread.start()
-
-    def _train_models_thread(self):
+        df, index = self.df, self.player_index
+
+        def done(models):
+            self.predictor, self.classifier, self.comparator = models
+            self.progress['value'] = 100
+            self.bottom_status_var.set("Models trained successfully!")
+            messagebox.showinfo("Success", "Models trained successfully!")
+            self._toggle_buttons(True)
+
+        def failed(e):
+            self.bottom_status_var.set("Error")
+            messagebox.showerror("Error", f"Training failed:\n{str(e)}")
+            self._toggle_buttons(True)
+
+        def cancelled(e):
+            # A new table was loaded mid-training: models of the old one are stale
+            self.predictor = self.classifier = self.comparator = None
+            self.progress['value'] = 0
+            self.bottom_status_var.set("Training cancelled")
+            self._toggle_buttons(True)
+
+        self._tasks.submit("train", lambda ctx: self._train_models_thread(ctx, df, index),
+                           on_done=done, on_error=failed, on_cancel=cancelled)
+
+    def _train_models_thread(self, ctx, df, index):
         """Background worker that trains models and reports progress back to the main thread via queue."""
-        try:
-            # Draft predictor
-            self._bg_queue.put(("status", "Training Draft Position Predictor..."))
-            self.predictor = DraftPositionPredictor()
-            self.predictor.train(self.df)
-            self._bg_queue.put(("progress", 50))
-
-            # Success classifier
-            self._bg_queue.put(("status", "Training Player Success Classifier..."))
-            self.classifier = PlayerSuccessClassifier(success_threshold=5)
-            self.classifier.train(self.df)
-            self._bg_queue.put(("progress", 85))
-
-            # Comparator (fast)
-            self._bg_queue.put(("status", "Building player comparator..."))
-            self.comparator = PlayerComparison(self.df)
-            self._bg_queue.put(("progress", 95))
-
-            # Done
-            self._bg_queue.put(("progress", 100))
-            self._bg_queue.put(("done", "Models trained successfully!"))
-        except Exception as e:
-            self._bg_queue.put(("error", str(e)))
+        # Load persisted artifacts for this data, training only what is missing or stale
+        def report(status, percent):
+            ctx.progress(percent, status)
+
+        predictor, classifier, comparator = load_or_train_models(
+            df, success_threshold=5, progress=report, cancel_check=ctx.check, neighbor_table=True)
+        comparator.index = index
+        return predictor, classifier, comparator
+
+    def _notify_queue(self):
+        """Wake the Tk loop from a worker thread (called by the queue once per batch)"""
+        self.root.event_generate(QUEUE_EVENT, when="tail")
 
     def _process_queue(self):
         """Process UI update messages from background threads."""
+        # Only the latest status/progress before each result is worth drawing
+        pending = {}
+
+        def flush():
+            if "status" in pending:
+                self.bottom_status_var.set(pending.pop("status"))
+            if "progress" in pending:
+                try:
+                    self.progress['value'] = int(pending.pop("progress"))
+                except Exception:
+                    pass
+
         try:
-            while not self._bg_queue.empty():
-                msg = self._bg_queue.get_nowait()
+            for msg in self._bg_queue.drain(QUEUE_BATCH_SIZE):
                 typ = msg[0]
-                if typ == "status":
-                    self.bottom_status_var.set(msg[1])
-                elif typ == "progress":
-                    try:
-                        self.progress['value'] = int(msg[1])
-                    except Exception:
-                        pass
-                elif typ == "done":
-                    self.bottom_status_var.set(msg[1])
-                    messagebox.showinfo("Success", msg[1])
-                    self._toggle_buttons(True)
-                elif typ == "error":
-                    self.bottom_status_var.set("Error")
-                    messagebox.showerror("Error", f"Training failed:\n{msg[1]}")
-                    self._toggle_buttons(True)
+                if typ in ("status", "progress"):
+                    pending[typ] = msg[1]
+                elif typ in ("result", "task_error", "task_cancelled"):
+                    # Finished background task: hand its result/exception to the callback
+                    flush()
+                    callback = msg[1]
+                    if callback is not None:
+                        try:
+                            callback(msg[2])
+                        except Exception as e:
+                            messagebox.showerror("Error", str(e))
+            flush()
         except Exception:
             pass
         finally:
-            # schedule next check
-            self.root.after(200, self._process_queue)
+            if self._queue_poll_ms is not None:
+                # schedule next check
+                self.root.after(self._queue_poll_ms, self._process_queue)
+            elif not self._bg_queue.empty():
+                # Batch limit hit: let Tk redraw, then continue
+                self.root.after_idle(self._process_queue)
     
     def _toggle_buttons(self, enabled):
         """Enable or disable all buttons in the app"""
@@ -417,14 +503,39 @@ Getting Started:
                 widget.config(state=state)
             
     def update_player_combos(self):
-        """Update player combo boxes with available players"""
-        if self.df is None:
+        """Seed player combo boxes with the first few players; typing narrows them via the index"""
+        if self.df is None or self.player_index is None:
             return
             
         if 'name' in self.df.columns:
-            player_list = self.df['name'].tolist()
+            player_list = self.df['name'].head(AUTOCOMPLETE_LIMIT).tolist()
             self.player_combo['values'] = player_list
             self.compare_player_combo['values'] = player_list
+
+    def _setup_autocomplete(self, combo):
+        """Filter combo's dropdown from the player index as the user types (debounced)"""
+        def on_key(event):
+            if event.keysym in _NAVIGATION_KEYS:
+                return
+            pending = self._autocomplete_jobs.pop(combo, None)
+            if pending is not None:
+                self.root.after_cancel(pending)
+            self._autocomplete_jobs[combo] = self.root.after(
+                AUTOCOMPLETE_DEBOUNCE_MS, lambda: self._refresh_autocomplete(combo))
+
+        combo.bind("<KeyRelease>", on_key)
+
+    def _refresh_autocomplete(self, combo):
+        """Replace combo's dropdown values with the top index matches for its current text"""
+        self._autocomplete_jobs.pop(combo, None)
+        if self.player_index is None:
+            return
+        text = combo.get().strip()
+        if text:
+            matches = self.player_index.names(self.player_index.search(text, limit=AUTOCOMPLETE_LIMIT))
+        else:
+            matches = self.df['name'].head(AUTOCOMPLETE_LIMIT).tolist()
+        combo['values'] = matches
     
     def _create_results_text_widget(self, parent):
         """Create a text widget with scrollbar (reusable component)"""
@@ -454,15 +565,36 @@ Getting Started:
         if not player_name:
             messagebox.showwarning("Warning", "Please select a player")
             return
-            
-        try:
-            player_data = self.df[self.df['name'] == player_name].iloc[0]
-            
-            pred_pick = self.predictor.predict(player_data)
-            success_prob = self.classifier.predict_proba(player_data)
-            actual_pick = int(player_data.get('draft_pick', 'N/A'))
-            
-            result = f"""
+
+        def done(result):
+            if result is None:
+                messagebox.showwarning("Warning", f"No player matching '{player_name}'")
+            else:
+                self._display_results(self.predictor_results, result)
+
+        def failed(e):
+            messagebox.showerror("Error", f"Prediction failed:\n{str(e)}")
+
+        df, index, predictor, classifier = self.df, self.player_index, self.predictor, self.classifier
+        self._tasks.submit(
+            "predict",
+            lambda ctx: self._predict_draft_position_task(ctx, player_name, df, index, predictor, classifier),
+            on_done=done, on_error=failed)
+
+    def _predict_draft_position_task(self, ctx, player_name, df, index, predictor, classifier):
+        """Background worker: look up player_name and format its prediction (None if not found)"""
+        player_idx = index.find(player_name)
+        if player_idx is None:
+            return None
+        player_data = df.loc[player_idx]
+        player_name = player_data['name']
+
+        pred_pick = predictor.predict(player_data)
+        ctx.check()
+        success_prob = classifier.predict_proba(player_data)
+        actual_pick = int(player_data.get('draft_pick', 'N/A'))
+
+        return f"""
 DRAFT POSITION PREDICTION
 {'='*50}
 
@@ -483,11 +615,6 @@ Interpretation:
 - Success is defined as being drafted in rounds 1-5
             """
             
-            self._display_results(self.predictor_results, result)
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Prediction failed:\n{str(e)}")
-            
     def find_similar_players(self):
         """Find similar players"""
         if self.comparator is None:
@@ -501,14 +628,22 @@ Interpretation:
             
         try:
             n_similar = int(self.similar_count_var.get())
-            similar = self.comparator.find_similar_players(player_name, n_similar=n_similar, position_only=True)
-            
-            result = "No similar players found" if similar.empty else "SIMILAR PLAYERS\n" + "="*70 + "\n\n" + similar[['name', 'pos', 'draft_pick', 'college', 'similarity_score']].to_string()
-            
-            self._display_results(self.comparison_results, result)
-            
-        except Exception as e:
+        except ValueError as e:
             messagebox.showerror("Error", f"Comparison failed:\n{str(e)}")
+            return
+
+        comparator = self.comparator
+
+        def task(ctx):
+            similar = comparator.find_similar_players(player_name, n_similar=n_similar, position_only=True)
+            return "No similar players found" if similar.empty else "SIMILAR PLAYERS\n" + "="*70 + "\n\n" + similar[['name', 'pos', 'draft_pick', 'college', 'similarity_score']].to_string()
+
+        def failed(e):
+            messagebox.showerror("Error", f"Comparison failed:\n{str(e)}")
+
+        self._tasks.submit("similar", task,
+                           on_done=lambda result: self._display_results(self.comparison_results, result),
+                           on_error=failed)
             
     def show_analytics(self):
         """Show feature importance and analytics"""
@@ -518,18 +653,35 @@ Interpretation:
             
         try:
             n_features = int(self.top_features_var.get())
-            importances = self.predictor.feature_importance(top_n=n_features)
+        except ValueError as e:
+            messagebox.showerror("Error", f"Analytics failed:\n{str(e)}")
+            return
+
+        predictor = self.predictor
+
+        def task(ctx):
+            importances = predictor.feature_importance(top_n=n_features)
             # Text summary
             result = "FEATURE IMPORTANCE ANALYSIS\n" + "="*70 + "\n\nTop factors affecting draft position:\n\n"
             for i, (feat, imp) in enumerate(importances.items(), 1):
                 result += f"{i:2}. {feat:<30} {imp:.4f}\n"
+            return importances, result
 
+        def failed(e):
+            messagebox.showerror("Error", f"Analytics failed:\n{str(e)}")
+
+        self._tasks.submit("analytics", task, on_done=self._show_analytics_result, on_error=failed)
+
+    def _show_analytics_result(self, analysis):
+        """Render a finished analytics task (main thread)"""
+        importances, result = analysis
+        try:
             self._display_results(self.analytics_results, result)
 
             # Plot bar chart if available
-            if MATPLOTLIB_AVAILABLE and self.chart_ax is not None:
+            if self._ensure_chart():
                 self._plot_feature_importance(importances)
-            elif not MATPLOTLIB_AVAILABLE:
+            else:
                 # small hint if plotting not available
                 self.bottom_status_var.set("Matplotlib not available — install matplotlib to enable charts")
             
@@ -629,6 +781,7 @@ def main():
     root = tk.Tk()
     app = ScoutSenseApp(root, initial_data_path=startup_data, auto_train=auto_train)
     root.mainloop()
+    app._tasks.shutdown()
 
 
 if __name__ == "__main__":
@@ -9,4 +9,11 @@ __all__ = [
     "data_loader",
     "feature_engineering",
     "models",
+    "checkpoint",
+    "player_index",
+    "tasks",
+    "evaluation",
+    "neighbors",
+    "scoring",
+    "service",
 ]
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Durable Scrape Checkpoints
+Append-only JSONL store of completed scrape results so interrupted runs resume
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+
+
+class JsonlCheckpoint:
+    """
+    Append-only JSONL checkpoint of completed work items.
+
+    Each line is {"key": ..., "value": ...}. Lines are flushed and fsynced as
+    they are written, so a crash loses at most the item in flight; a torn
+    final line is ignored on reload. Later lines for a key win.
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path: Checkpoint file (created on first add)
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._items = {}
+        self._needs_newline = False  # File ends in a torn line: start the next record on its own line
+        self._load()
+
+    def _load(self):
+        """Read completed items from an existing checkpoint file"""
+        if not self.path.exists():
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                self._needs_newline = not line.endswith('\n')
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # Partial line from an interrupted write
+                    continue
+                self._items[record['key']] = record['value']
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def __len__(self):
+        return len(self._items)
+
+    def get(self, key, default=None):
+        """Stored value for key, or default if it hasn't completed"""
+        return self._items.get(key, default)
+
+    def items(self):
+        """(key, value) pairs in completion order"""
+        return list(self._items.items())
+
+    def add(self, key, value):
+        """Durably record that key completed with value (thread-safe)"""
+        line = json.dumps({'key': key, 'value': value}) + '\n'
+        with self._lock:
+            if self._needs_newline:
+                line = '\n' + line
+                self._needs_newline = False
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+            self._items[key] = value
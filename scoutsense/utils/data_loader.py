@@ -6,22 +6,171 @@ Loads and processes NFL draft data from pro-football-reference.com
 """
 
 import urllib.request
-from bs4 import BeautifulSoup
+import urllib.error
+import argparse
 import csv
+import hashlib
+import json
+import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+import numpy as np
 import pandas as pd
+from .checkpoint import JsonlCheckpoint
 
-def scrape_draft_year(year):
+DRAFT_URL_TEMPLATE = "https://www.pro-football-reference.com/years/{year}/draft.htm"
+
+# Default location of the on-disk HTML cache
+DEFAULT_HTML_CACHE_DIR = Path(__file__).parent.parent / 'cache' / 'html'
+
+# Responses worth retrying: rate limited or a transient server error
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+class TokenBucket:
+    """Thread-safe token-bucket rate limiter (rate tokens/sec, bursts up to capacity)"""
+    
+    def __init__(self, rate=1.0, capacity=1):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self._tokens = float(capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a token is available, then consume it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class HTMLCache:
+    """On-disk cache of fetched pages plus their ETag/Last-Modified validators"""
+    
+    def __init__(self, cache_dir=DEFAULT_HTML_CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+    
+    def _paths(self, url):
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{key}.html", self.cache_dir / f"{key}.json"
+    
+    def get(self, url):
+        """Return (body bytes, metadata dict) for url, or (None, None) if not cached"""
+        body_path, meta_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text(encoding='utf-8'))
+            return body_path.read_bytes(), meta
+        except (OSError, ValueError):
+            return None, None
+    
+    def put(self, url, body, etag=None, last_modified=None):
+        """Store body and validators for url (atomically replacing any old entry)"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        body_path, meta_path = self._paths(url)
+        meta = {'url': url, 'etag': etag, 'last_modified': last_modified, 'fetched_at': time.time()}
+        for path, data in ((body_path, body), (meta_path, json.dumps(meta).encode('utf-8'))):
+            tmp = path.with_suffix(path.suffix + '.tmp')
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+    
+    def touch(self, url):
+        """Mark a cached entry as freshly validated (after a 304 response)"""
+        body, meta = self.get(url)
+        if body is not None:
+            self.put(url, body, meta.get('etag'), meta.get('last_modified'))
+
+
+def _retry_delay(error, attempt, backoff):
+    """Seconds to wait before retrying error: its Retry-After if given, else exponential backoff"""
+    retry_after = error.headers.get('Retry-After') if error.headers is not None else None
+    try:
+        return max(0.0, float(retry_after))
+    except (TypeError, ValueError):
+        return backoff * 2 ** attempt
+
+
+def fetch_html(url, cache=None, limiter=None, max_age=None, offline=False, timeout=10, retries=3, backoff=1.0):
+    """
+    Fetch a page, serving from / revalidating against an optional HTMLCache.
+    
+    429 and 5xx responses are retried up to retries times, waiting the
+    server's Retry-After or backoff * 2**attempt seconds in between.
+    
+    Args:
+        url: Page URL
+        cache: HTMLCache instance (None disables caching)
+        limiter: TokenBucket applied to network requests only (cache hits are free)
+        max_age: Seconds a cached page is served without revalidation
+                 (None = cached pages never expire)
+        offline: If True, only serve from the cache and never touch the network
+        timeout: Socket timeout in seconds
+        retries: Retries after a 429/5xx response before giving up
+        backoff: Base delay in seconds of the exponential backoff
+    
+    Returns:
+        Page body as bytes
+    """
+    body, meta = cache.get(url) if cache is not None else (None, None)
+    if body is not None:
+        fresh = max_age is None or time.time() - meta.get('fetched_at', 0) < max_age
+        if fresh or offline:
+            return body
+    elif offline:
+        raise LookupError(f"{url} is not in the HTML cache (offline mode)")
+    
+    headers = {'User-Agent': 'Mozilla/5.0'}
+    if body is not None:
+        # Conditional request: the server answers 304 if our copy is current
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+    
+    req = urllib.request.Request(url, headers=headers)
+    for attempt in range(retries + 1):
+        if limiter is not None:
+            limiter.acquire()
+        try:
+            with urllib.request.urlopen(req, timeout=timeout) as resp:
+                new_body = resp.read()
+                etag = resp.headers.get('ETag')
+                last_modified = resp.headers.get('Last-Modified')
+            break
+        except urllib.error.HTTPError as e:
+            if e.code == 304 and body is not None:
+                cache.touch(url)
+                return body
+            if e.code not in RETRY_STATUS_CODES or attempt == retries:
+                raise
+            time.sleep(_retry_delay(e, attempt, backoff))
+    
+    if cache is not None:
+        cache.put(url, new_body, etag, last_modified)
+    return new_body
+
+
+def scrape_draft_year(year, cache=None, limiter=None, max_age=None, offline=False,
+                      url_template=DRAFT_URL_TEMPLATE):
     """Scrape draft data for a given year from Pro Football Reference"""
-    url = f"https://www.pro-football-reference.com/years/{year}/draft.htm"
+    url = url_template.format(year=year)
     players = []
     
     print(f"Fetching draft data for {year} from {url}")
+    from bs4 import BeautifulSoup
     
     try:
-        req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
-        resp = urllib.request.urlopen(req, timeout=10)
-        html = resp.read()
+        html = fetch_html(url, cache=cache, limiter=limiter, max_age=max_age, offline=offline)
         soup = BeautifulSoup(html, "html.parser")
     except Exception as e:
         print(f"ERROR: Failed to fetch {url}: {e}")
@@ -68,33 +217,215 @@ def scrape_draft_year(year):
     
     return players
 
-def load_draft_data(csv_file='nfl_draft_data.csv'):
-    """Load NFL draft data from CSV file and return as DataFrame"""
-    df = pd.read_csv(csv_file)
+def scrape_draft_years(years, max_workers=4, rate=1.0, burst=1, cache_dir=DEFAULT_HTML_CACHE_DIR,
+                       max_age=None, offline=False, url_template=DRAFT_URL_TEMPLATE, checkpoint=None):
+    """
+    Scrape several draft years concurrently with a shared rate limit and HTML cache.
+    
+    With a checkpoint, years already recorded are not fetched again and each
+    newly scraped year is appended as soon as it completes, so an interrupted
+    run resumes where it stopped and a refresh only fetches new years.
+    
+    Args:
+        years: Iterable of draft years
+        max_workers: Number of worker threads fetching pages
+        rate: Maximum network requests per second across all workers
+        burst: Token-bucket capacity (requests allowed back-to-back)
+        cache_dir: HTML cache directory (None disables caching)
+        max_age: Seconds before a cached page is revalidated (None = never)
+        offline: Serve only from the cache
+        url_template: URL pattern with a {year} field (override to test locally)
+        checkpoint: Optional JsonlCheckpoint keyed by year
+    
+    Returns:
+        Dict mapping year -> list of player dicts, in year order
+    """
+    years = list(years)
+    done = {year: checkpoint.get(year) for year in years if checkpoint is not None and year in checkpoint}
+    pending = [year for year in years if year not in done]
+    if done:
+        print(f"Resuming: {len(done)} year(s) already in checkpoint, {len(pending)} to scrape")
+    cache = HTMLCache(cache_dir) if cache_dir is not None else None
+    limiter = TokenBucket(rate=rate, capacity=burst)
+    
+    def scrape(year):
+        return scrape_draft_year(year, cache=cache, limiter=limiter, max_age=max_age,
+                                 offline=offline, url_template=url_template)
+    
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        futures = {pool.submit(scrape, year): year for year in pending}
+        for future in as_completed(futures):
+            year = futures[future]
+            done[year] = future.result()
+            # Only checkpoint years that produced data so failures are retried next run
+            if checkpoint is not None and done[year]:
+                checkpoint.add(year, done[year])
+    return {year: done[year] for year in years}
+
+# Low-cardinality text columns stored as pandas categoricals
+DRAFT_CATEGORICAL_COLS = ('team', 'pos', 'college', 'position', 'position_tier')
+MADDEN_CATEGORICAL_COLS = ('position', 'team')
+
+
+def _read_csv(csv_file):
+    """Parse a CSV with the multi-threaded pyarrow engine, falling back to the C engine"""
+    try:
+        return pd.read_csv(csv_file, engine='pyarrow')
+    except ImportError:
+        return pd.read_csv(csv_file)
+
+
+def _normalize_columns(df):
+    """Lower-case, strip and underscore column names ('Draft Pick' -> 'draft_pick')"""
     df.columns = df.columns.str.strip().str.lower().str.replace(' ', '_')
+    return df
+
+
+def compact_dtypes(df, categorical_cols=()):
+    """
+    Shrink a DataFrame's memory footprint.
+    
+    - categorical_cols present in df become 'category'
+    - integer columns become int16 (int32 if the values don't fit)
+    - float columns become float32
+    
+    Args:
+        df: DataFrame to convert
+        categorical_cols: Names of text columns to store as categoricals
+    
+    Returns:
+        DataFrame with compact dtypes
+    """
+    int16 = np.iinfo(np.int16)
+    dtypes = {}
+    for col, dtype in df.dtypes.items():
+        if col in categorical_cols:
+            dtypes[col] = 'category'
+        elif pd.api.types.is_bool_dtype(dtype):
+            continue
+        elif pd.api.types.is_integer_dtype(dtype):
+            values = df[col]
+            fits = values.empty or (values.min() >= int16.min and values.max() <= int16.max)
+            dtypes[col] = np.int16 if fits else np.int32
+        elif pd.api.types.is_float_dtype(dtype):
+            dtypes[col] = np.float32
+    
+    # One astype call for all columns rather than one block rebuild per column
+    return df.astype(dtypes)
+
+
+def load_draft_data(csv_file='nfl_draft_data.csv', compact=True):
+    """
+    Load NFL draft data from CSV file and return as DataFrame
+    
+    Args:
+        csv_file: Raw (nfl_draft_data.csv) or engineered (nfl_draft_combined.csv) draft CSV
+        compact: Use categorical team/pos/college and int16/float32 numerics
+    """
+    df = _normalize_columns(_read_csv(csv_file))
     df['draft_pick'] = pd.to_numeric(df['draft_pick'], errors='coerce')
     df['age'] = pd.to_numeric(df['age'], errors='coerce')
+    if compact:
+        df = compact_dtypes(df, DRAFT_CATEGORICAL_COLS)
+    return df
+
+
+def iter_draft_chunks(path, chunk_size=50000):
+    """
+    Stream a draft or prospect file (CSV or Parquet) in chunks
+    
+    Each chunk gets the same column normalization and numeric coercion as
+    load_draft_data, so it can go straight into FeaturePipeline.transform.
+    
+    Args:
+        path: .csv or .parquet file
+        chunk_size: Maximum rows per chunk
+        
+    Yields:
+        DataFrames of up to chunk_size rows, in file order
+    """
+    path = Path(path)
+    if path.suffix.lower() in ('.parquet', '.pq'):
+        import pyarrow.parquet as pq
+        chunks = (batch.to_pandas() for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size))
+    else:
+        chunks = pd.read_csv(path, chunksize=chunk_size)
+    
+    for chunk in chunks:
+        yield normalize_draft_columns(chunk)
+
+
+def normalize_draft_columns(df):
+    """
+    Normalize column names and coerce draft_pick/age to numbers (where present),
+    as load_draft_data does, for rows that don't come from a CSV file
+    
+    Args:
+        df: DataFrame of raw draft/prospect rows (modified in place)
+        
+    Returns:
+        df
+    """
+    df = _normalize_columns(df)
+    for col in ('draft_pick', 'age'):
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors='coerce')
     return df
 
-def main():
+
+def load_madden_ratings(csv_file, compact=True):
+    """
+    Load Madden player ratings (e.g. MaddenRatings2008_2019.csv) as a DataFrame
+    
+    Args:
+        csv_file: Madden ratings CSV
+        compact: Use categorical position/team and int16/float32 numerics
+    """
+    df = _normalize_columns(_read_csv(csv_file))
+    if compact:
+        df = compact_dtypes(df, MADDEN_CATEGORICAL_COLS)
+    return df
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Scrape NFL draft data from Pro Football Reference")
     # Scrape multiple years (2009-2023 as examples)
-    # Modify the range as needed
-    start_year = 2009
-    end_year = 2023  # Change this to scrape more/fewer years
+    parser.add_argument('--start-year', type=int, default=2009)
+    parser.add_argument('--end-year', type=int, default=2023)
+    parser.add_argument('--workers', type=int, default=4, help='Concurrent fetch threads')
+    # Be polite: 1 request/sec across all workers by default
+    parser.add_argument('--rate', type=float, default=1.0, help='Max requests per second')
+    parser.add_argument('--cache-dir', default=str(DEFAULT_HTML_CACHE_DIR), help='HTML cache directory')
+    parser.add_argument('--no-cache', action='store_true', help='Disable the HTML cache')
+    parser.add_argument('--max-age', type=float, default=None,
+                        help='Revalidate cached pages older than this many seconds')
+    parser.add_argument('--offline', action='store_true', help='Serve pages only from the cache')
+    parser.add_argument('--output', default='nfl_draft_data.csv')
+    parser.add_argument('--checkpoint', default=None,
+                        help='JSONL checkpoint of completed years (default: <output>.checkpoint.jsonl)')
+    parser.add_argument('--no-checkpoint', action='store_true', help='Scrape every year from scratch')
+    args = parser.parse_args(argv)
     
-    all_players = []
+    checkpoint = None
+    if not args.no_checkpoint:
+        checkpoint = JsonlCheckpoint(args.checkpoint or f"{args.output}.checkpoint.jsonl")
+    
+    by_year = scrape_draft_years(
+        range(args.start_year, args.end_year + 1),
+        max_workers=args.workers,
+        rate=args.rate,
+        cache_dir=None if args.no_cache else args.cache_dir,
+        max_age=args.max_age,
+        offline=args.offline,
+        checkpoint=checkpoint,
+    )
     
-    for year in range(start_year, end_year + 1):
-        print(f"\n--- Scraping {year} Draft ---")
-        players = scrape_draft_year(year)
+    all_players = []
+    for year, players in by_year.items():
         if players:
             print(f"Successfully scraped {len(players)} players from {year} draft")
             all_players.extend(players)
         else:
             print(f"No data found for {year} draft")
-        
-        # Be polite: wait between requests
-        time.sleep(1)
     
     if not all_players:
         print("\nNo players were scraped. Exiting.")
@@ -107,7 +438,7 @@ def main():
         print(f"\nFirst player: {all_players[0]}")
     
     # Write to CSV
-    csv_file = 'nfl_draft_data.csv'
+    csv_file = args.output
     print(f"\nWriting {len(all_players)} players to {csv_file}")
     
     try:
@@ -0,0 +1,322 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Model Evaluation & Hyperparameter Search
+K-fold and time-aware cross-validation, randomized and successive-halving search
+run over all cores with joblib, with fold results cached so searches resume
+"""
+
+import hashlib
+import json
+import math
+import time
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from scipy.stats import loguniform, randint, uniform
+from sklearn.ensemble import RandomForestClassifier, GradientBoostingRegressor, HistGradientBoostingRegressor
+from sklearn.impute import SimpleImputer
+from sklearn.metrics import mean_squared_error, accuracy_score
+from sklearn.model_selection import KFold, StratifiedKFold, ParameterSampler
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+
+from .checkpoint import JsonlCheckpoint
+from .feature_engineering import DEFAULT_CACHE_DIR
+from .models import DraftPositionPredictor, PlayerSuccessClassifier, _feature_columns, hash_training_data
+
+# Bump when fold results are computed differently (invalidates cached folds)
+EVALUATION_VERSION = 1
+
+# Default fold-result cache shared by all searches (keys include the data hash)
+DEFAULT_EVALUATION_CACHE = DEFAULT_CACHE_DIR / 'evaluation.jsonl'
+
+CV_SCHEMES = ('kfold', 'time')
+SEARCH_METHODS = ('random', 'halving')
+
+# What can be evaluated: model name -> estimator defaults, features, target,
+# metric (and whether higher is better) and the default search space
+MODEL_SPECS = {
+    'predictor': {
+        'estimator': lambda: GradientBoostingRegressor(n_estimators=100, learning_rate=0.1,
+                                                       max_depth=5, random_state=42),
+        'exclude_cols': DraftPositionPredictor.EXCLUDE_COLS,
+        'target': lambda df, threshold: df['draft_pick'].to_numpy(dtype=float),
+        'metric': 'rmse',
+        'space': {
+            'n_estimators': randint(50, 300),
+            'learning_rate': loguniform(0.02, 0.3),
+            'max_depth': [3, 4, 5, 6],
+            'subsample': uniform(0.6, 0.4),
+        },
+    },
+    'predictor_hist': {
+        'estimator': lambda: HistGradientBoostingRegressor(max_iter=100, learning_rate=0.1, max_depth=5,
+                                                           early_stopping=False, random_state=42),
+        'exclude_cols': DraftPositionPredictor.EXCLUDE_COLS,
+        'target': lambda df, threshold: df['draft_pick'].to_numpy(dtype=float),
+        'metric': 'rmse',
+        'handles_nan': True,
+        'space': {
+            'max_iter': randint(50, 400),
+            'learning_rate': loguniform(0.02, 0.3),
+            'max_depth': [3, 5, 8, None],
+            'max_leaf_nodes': [15, 31, 63],
+            'l2_regularization': loguniform(1e-4, 1.0),
+        },
+    },
+    'classifier': {
+        'estimator': lambda: RandomForestClassifier(n_estimators=100, max_depth=10, random_state=42),
+        'exclude_cols': PlayerSuccessClassifier.EXCLUDE_COLS,
+        'target': lambda df, threshold: (df['draft_round'] <= threshold).astype(int).to_numpy(),
+        'metric': 'accuracy',
+        'space': {
+            'n_estimators': randint(50, 300),
+            'max_depth': [6, 10, 14, None],
+            'min_samples_leaf': [1, 2, 5, 10],
+            'max_features': ['sqrt', 0.5, 1.0],
+        },
+    },
+}
+
+# Metric name -> (scorer(y_true, y_pred), higher is better)
+METRICS = {
+    'rmse': (lambda y, pred: float(np.sqrt(mean_squared_error(y, pred))), False),
+    'accuracy': (lambda y, pred: float(accuracy_score(y, pred)), True),
+}
+
+
+def _model_spec(model):
+    if model not in MODEL_SPECS:
+        raise ValueError(f"Unknown model '{model}' (choose from {', '.join(MODEL_SPECS)})")
+    return MODEL_SPECS[model]
+
+
+def _plain(params):
+    """Params with numpy scalars converted to Python values (for JSON keys and display)"""
+    return {k: (v.item() if hasattr(v, 'item') else v) for k, v in sorted(params.items())}
+
+
+def make_estimator(model, params=None):
+    """
+    Unfitted pipeline for model with params applied to its final estimator
+    (median imputation and scaling mirror what the model classes do in train)
+    """
+    spec = _model_spec(model)
+    estimator = spec['estimator']().set_params(**(params or {}))
+    if spec.get('handles_nan'):
+        return make_pipeline(StandardScaler(), estimator)
+    return make_pipeline(SimpleImputer(strategy='median'), StandardScaler(), estimator)
+
+
+def time_splits(years, n_splits=5):
+    """
+    Forward-chaining splits by draft year: each of the last n_splits years is
+    scored by a model trained on every earlier year
+
+    Yields:
+        (train_positions, test_positions) arrays
+    """
+    years = np.asarray(years)
+    for year in np.unique(years)[-n_splits:]:
+        train = np.flatnonzero(years < year)
+        if len(train):
+            yield train, np.flatnonzero(years == year)
+
+
+def make_splits(df, y, cv='kfold', n_splits=5, classification=False):
+    """List of (train_positions, test_positions) for a CV scheme in CV_SCHEMES"""
+    if cv == 'time':
+        return list(time_splits(df['draft_year'], n_splits))
+    if cv == 'kfold':
+        splitter = (StratifiedKFold if classification else KFold)(n_splits=n_splits, shuffle=True, random_state=42)
+        return list(splitter.split(np.zeros(len(y)), y))
+    raise ValueError(f"Unknown cv '{cv}' (choose from {', '.join(CV_SCHEMES)})")
+
+
+def _evaluate_fold(model, params, X, y, train, test, n_train):
+    """Fit on (up to n_train of) train, score on test; runs in a joblib worker"""
+    if n_train is not None and n_train < len(train):
+        train = np.random.RandomState(42).choice(train, n_train, replace=False)
+    estimator = make_estimator(model, params)
+    start = time.perf_counter()
+    estimator.fit(X[train], y[train])
+    fit_time = time.perf_counter() - start
+    start = time.perf_counter()
+    pred = estimator.predict(X[test])
+    predict_time = time.perf_counter() - start
+    scorer, _ = METRICS[_model_spec(model)['metric']]
+    return {
+        'score': scorer(y[test], pred),
+        'fit_time': fit_time,
+        'predict_time': predict_time,
+        'n_train': int(len(train)),
+        'n_test': int(len(test)),
+    }
+
+
+class Evaluator:
+    """
+    Runs cross-validated evaluations of one model on one table.
+
+    Every (params, fold, training size) evaluation is keyed by a hash of
+    those settings plus the data hash and stored in a JSONL cache as soon as
+    it finishes, so an interrupted search re-run with the same settings only
+    computes the folds that are missing.
+    """
+
+    def __init__(self, df, model='predictor', cv='kfold', n_splits=5, success_threshold=5,
+                 n_jobs=-1, cache_path=DEFAULT_EVALUATION_CACHE):
+        """
+        Args:
+            df: DataFrame with engineered features
+            model: Key of MODEL_SPECS
+            cv: 'kfold' (shuffled; stratified for the classifier) or 'time' (by draft_year)
+            n_splits: Number of folds (for 'time', the number of most recent test years)
+            success_threshold: Round threshold defining success for the classifier
+            n_jobs: joblib workers (-1 = all cores)
+            cache_path: JSONL fold-result cache, or None to keep results in memory only
+        """
+        spec = _model_spec(model)
+        self.model = model
+        self.cv = cv
+        self.n_splits = n_splits
+        self.n_jobs = n_jobs
+        self.metric = spec['metric']
+        self.higher_is_better = METRICS[self.metric][1]
+        # The numeric selection the models themselves train on
+        self.feature_cols = _feature_columns(df, spec['exclude_cols'])
+        self.X = df[self.feature_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+        self.y = spec['target'](df, success_threshold)
+        self.splits = make_splits(df, self.y, cv, n_splits, classification=spec['metric'] == 'accuracy')
+        self.data_hash = hash_training_data(df)
+        self.success_threshold = success_threshold
+        self.cache = JsonlCheckpoint(cache_path) if cache_path is not None else {}
+
+    def _key(self, params, fold, n_train):
+        settings = {
+            'version': EVALUATION_VERSION,
+            'data': self.data_hash,
+            'model': self.model,
+            'threshold': self.success_threshold,
+            'cv': self.cv,
+            'n_splits': self.n_splits,
+            'fold': fold,
+            'n_train': n_train,
+            'params': params,
+        }
+        return hashlib.sha256(json.dumps(settings, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+    def _store(self, key, result):
+        if isinstance(self.cache, dict):
+            self.cache[key] = result
+        else:
+            self.cache.add(key, result)
+
+    def evaluate(self, candidates, n_train=None):
+        """
+        Cross-validate each params dict in candidates (cached folds are reused)
+
+        Args:
+            candidates: List of params dicts for the model's estimator
+            n_train: Optional cap on training rows per fold (successive halving budget)
+
+        Returns:
+            DataFrame with one row per (candidate, fold)
+        """
+        candidates = [_plain(params) for params in candidates]
+        tasks = [(c, fold, self._key(params, fold, n_train), params)
+                 for c, params in enumerate(candidates) for fold in range(len(self.splits))]
+        pending = [task for task in tasks if task[2] not in self.cache]
+        if pending:
+            print(f"  Evaluating {len(pending)} folds ({len(tasks) - len(pending)} cached)...")
+            results = Parallel(n_jobs=self.n_jobs, return_as='generator')(
+                delayed(_evaluate_fold)(self.model, params, self.X, self.y, *self.splits[fold], n_train)
+                for _, fold, _, params in pending)
+            # Persist each fold as it completes so an interrupted run resumes here
+            for (_, _, key, _), result in zip(pending, results):
+                self._store(key, result)
+
+        rows = []
+        for c, fold, key, params in tasks:
+            rows.append({'candidate': c, 'fold': fold, 'params': json.dumps(params), **self.cache.get(key)})
+        return pd.DataFrame(rows)
+
+    def summarize(self, folds):
+        """Per-candidate mean/std score and timings, best first"""
+        table = folds.groupby(['candidate', 'params']).agg(
+            mean_score=('score', 'mean'),
+            std_score=('score', 'std'),
+            fit_s=('fit_time', 'mean'),
+            predict_ms=('predict_time', lambda t: t.mean() * 1000),
+            n_train=('n_train', 'mean'),
+            folds=('fold', 'count'),
+        ).reset_index()
+        table = table.sort_values('mean_score', ascending=not self.higher_is_better, ignore_index=True)
+        table.insert(0, 'rank', range(1, len(table) + 1))
+        return table
+
+    def cross_validate(self, params=None):
+        """Per-fold results of one configuration (the model's defaults if params is None)"""
+        return self.evaluate([params or {}])
+
+    def random_search(self, n_candidates=20, space=None, random_state=42):
+        """
+        Randomized search: cross-validate n_candidates sampled configurations
+
+        Returns:
+            Summary table (see summarize), best first
+        """
+        space = space or MODEL_SPECS[self.model]['space']
+        candidates = list(ParameterSampler(space, n_candidates, random_state=random_state))
+        return self.summarize(self.evaluate(candidates))
+
+    def halving_search(self, n_candidates=27, space=None, factor=3, min_train=100, random_state=42):
+        """
+        Successive halving: score all candidates on small training samples, then
+        keep the best 1/factor and multiply the sample size by factor each round
+        until the survivors are scored on full folds
+
+        Returns:
+            Summary table of the final round, best first, with a 'round' column
+        """
+        space = space or MODEL_SPECS[self.model]['space']
+        candidates = [_plain(p) for p in ParameterSampler(space, n_candidates, random_state=random_state)]
+        max_train = min(len(train) for train, _ in self.splits)
+        n_rounds = _halving_rounds(n_candidates, factor)
+        n_train = max(min_train, max_train // factor ** (n_rounds - 1))
+
+        for round_ in range(n_rounds):
+            budget = None if round_ == n_rounds - 1 or n_train >= max_train else n_train
+            print(f"Round {round_ + 1}/{n_rounds}: {len(candidates)} candidates, "
+                  f"{budget or 'all'} training rows per fold")
+            table = self.summarize(self.evaluate(candidates, n_train=budget))
+            table['round'] = round_ + 1
+            keep = max(1, math.ceil(len(candidates) / factor))
+            candidates = [json.loads(p) for p in table['params'].head(keep)]
+            n_train *= factor
+        return table
+
+
+def _halving_rounds(n_candidates, factor):
+    """
+    Rounds needed to cut n_candidates to one, keeping 1/factor per round:
+    ceil(log_factor(n_candidates)) in integers (float logs overshoot exact powers)
+    """
+    if factor < 2:
+        raise ValueError("factor must be at least 2")
+    rounds = 0
+    while factor ** rounds < n_candidates:
+        rounds += 1
+    return max(1, rounds)
+
+
+def format_results(table, metric):
+    """Printable results table"""
+    lines = [f"{'Rank':>4}  {metric:>10} {'± std':>8} {'fit s':>7} {'pred ms':>8} {'rows':>6}  Params",
+             "-" * 100]
+    for row in table.itertuples():
+        lines.append(f"{row.rank:>4}  {row.mean_score:>10.4f} {row.std_score:>8.4f} {row.fit_s:>7.2f} "
+                     f"{row.predict_ms:>8.2f} {row.n_train:>6.0f}  {row.params}")
+    return "\n".join(lines)
@@ -1,10 +1,75 @@
+import hashlib
+import os
+import re
+from pathlib import Path
 import pandas as pd
 import numpy as np
-from sklearn.preprocessing import StandardScaler
 
-def engineer_features(data):
+# Position tiers (for scouting analysis)
+SKILL_POSITIONS = ['WR', 'RB', 'TE', 'QB']
+LINE_POSITIONS = ['OT', 'OG', 'C', 'DT', 'DE']
+SECONDARY_POSITIONS = ['CB', 'S', 'FS', 'SS']
+
+# Position code -> tier lookup table (anything else is 'OTHER')
+POSITION_TIERS = {
+    **{pos: 'SKILL' for pos in SKILL_POSITIONS},
+    **{pos: 'LINE' for pos in LINE_POSITIONS},
+    **{pos: 'SECONDARY' for pos in SECONDARY_POSITIONS},
+}
+
+# Defensive positions: any code containing D, CB or S (DE, DT, CB, S, FS, ...)
+DEFENSIVE_POSITION_RE = re.compile('D|CB|S', re.IGNORECASE)
+
+# Raw input columns; any that are missing (e.g. draft_pick for an undrafted
+# prospect) are treated as unknown and filled with the training medians
+INPUT_COLUMNS = ['draft_pick', 'age', 'ht', 'wt', 'college', 'college/yrs', 'meets', 'pos']
+
+
+def _normalize(series, bounds):
+    """Scale series to 0-1 using previously learned (min, max) bounds"""
+    lo, hi = bounds
+    return (series - lo) / (hi - lo)
+
+
+def _position_tier(position):
+    """Map an upper-cased position code to its scouting tier"""
+    return POSITION_TIERS.get(position, 'OTHER')
+
+
+def _is_defensive(position):
+    """1 if an upper-cased position code is a defensive position, else 0"""
+    return int(isinstance(position, str) and DEFENSIVE_POSITION_RE.search(position) is not None)
+
+
+def _clean_position(position):
+    """Upper-cased, stripped position code (NaN stays NaN)"""
+    return position.upper().strip() if isinstance(position, str) else np.nan
+
+
+def _map_distinct(series, func):
     """
-    Engineer meaningful features from NFL draft data for scouting analysis.
+    Apply func to every value of series, calling it once per distinct value.
+    
+    Position-like columns hold a handful of codes across any number of rows,
+    so the Python-level work stays constant and rows are mapped by their codes.
+    
+    Returns:
+        Categorical Series of func's results, aligned with series
+    """
+    codes, uniques = pd.factorize(series, use_na_sentinel=False)
+    mapped = pd.Categorical([func(value) for value in uniques])
+    return pd.Series(mapped.take(codes), index=series.index, name=series.name)
+
+
+class FeaturePipeline:
+    """
+    Learned feature engineering for NFL draft data.
+    
+    fit(df) learns every dataset-level statistic the features depend on
+    (min/max normalization bounds, college frequencies, position average
+    picks, median fill values). transform(rows) then applies them in O(rows),
+    so a single new prospect is scored with the statistics the models were
+    trained on rather than those of a one-row frame.
     
     Input columns expected:
     - Draft Pick: int
@@ -17,123 +82,256 @@ def engineer_features(data):
     - College: str
     - College/Yrs: int
     - Meets: int
-    
-    Returns DataFrame with original + engineered features
     """
     
-    engineered_data = data.copy()
-    
-    # ============= DRAFT METRICS =============
-    
-    # 1. Draft Pick Value (earlier pick = higher value)
-    # Normalize to 0-1 scale (lower pick # = higher value)
-    engineered_data['draft_value_score'] = 1 - (engineered_data['draft_pick'] / engineered_data['draft_pick'].max())
-    
-    # 2. Round (approximate from draft pick)
-    # Roughly: Round 1 = picks 1-32, Round 2 = 33-64, etc.
-    engineered_data['draft_round'] = pd.cut(engineered_data['draft_pick'], 
-                                            bins=[0, 32, 64, 96, 128, 192, 224, 256],
-                                            labels=[1, 2, 3, 4, 5, 6, 7])
-    engineered_data['draft_round'] = pd.to_numeric(engineered_data['draft_round'], errors='coerce')
-    
-    # 3. Early Pick Indicator (first 2 rounds = high priority)
-    engineered_data['is_early_pick'] = (engineered_data['draft_pick'] <= 64).astype(int)
-    
-    # ============= AGE & EXPERIENCE METRICS =============
-    
-    # 4. Age normalized (college players typically 20-25)
-    engineered_data['age_normalized'] = (engineered_data['age'] - engineered_data['age'].min()) / (engineered_data['age'].max() - engineered_data['age'].min())
-    
-    # 5. College years/experience
-    engineered_data['college_years_numeric'] = pd.to_numeric(engineered_data['college/yrs'], errors='coerce')
-    engineered_data['college_years_normalized'] = (engineered_data['college_years_numeric'] - engineered_data['college_years_numeric'].min()) / (engineered_data['college_years_numeric'].max() - engineered_data['college_years_numeric'].min())
-    
-    # 6. Age-to-experience ratio (younger with more years = good development)
-    engineered_data['age_experience_ratio'] = engineered_data['age'] / engineered_data['college_years_numeric'].replace(0, 1)
-    
-    # ============= PHYSICAL ATTRIBUTES =============
-    
-    # Note: Height and Weight in CSV appear corrupted from scraping
-    # These features will be NA if data can't be parsed
-    engineered_data['height_numeric'] = pd.to_numeric(engineered_data['ht'], errors='coerce')
-    engineered_data['weight_numeric'] = pd.to_numeric(engineered_data['wt'], errors='coerce')
-    
-    # BMI calculation (only where we have valid height/weight)
-    # BMI = weight (lbs) / (height (inches) ^ 2) * 703
-    engineered_data['bmi'] = (engineered_data['weight_numeric'] / 
-                              (engineered_data['height_numeric'] ** 2)) * 703
-    engineered_data['bmi'] = engineered_data['bmi'].replace([np.inf, -np.inf], np.nan)
-    
-    # ============= POSITION-BASED FEATURES =============
-    
-    # 7. Position categories
-    engineered_data['position'] = engineered_data['pos'].str.upper().str.strip()
-    
-    # Position tiers (for scouting analysis)
-    skill_positions = ['WR', 'RB', 'TE', 'QB']
-    line_positions = ['OT', 'OG', 'C', 'DT', 'DE']
-    secondary_positions = ['CB', 'S', 'FS', 'SS']
-    
-    engineered_data['position_tier'] = engineered_data['position'].apply(
-        lambda x: 'SKILL' if x in skill_positions else 
-                 'LINE' if x in line_positions else 
-                 'SECONDARY' if x in secondary_positions else 'OTHER'
-    )
-    
-    # QB flag (quarterbacks are unique in scouting)
-    engineered_data['is_qb'] = (engineered_data['position'] == 'QB').astype(int)
-    
-    # Defensive position flag
-    engineered_data['is_defensive'] = engineered_data['position'].str.contains('D|CB|S', regex=True, case=False, na=False).astype(int)
-    
-    # ============= COLLEGE STRENGTH METRICS =============
-    
-    # 8. Number of "Meets" (likely combine meets/benchmarks)
-    engineered_data['meets_numeric'] = pd.to_numeric(engineered_data['meets'], errors='coerce')
-    
-    # Normalize meets score
-    engineered_data['meets_normalized'] = (engineered_data['meets_numeric'] - engineered_data['meets_numeric'].min()) / \
-                                          (engineered_data['meets_numeric'].max() - engineered_data['meets_numeric'].min())
-    
-    # 9. College school strength (frequency analysis - most players from strong programs)
-    college_counts = engineered_data['college'].value_counts()
-    engineered_data['college_frequency'] = engineered_data['college'].map(college_counts)
-    engineered_data['college_frequency_normalized'] = (engineered_data['college_frequency'] - engineered_data['college_frequency'].min()) / \
-                                                       (engineered_data['college_frequency'].max() - engineered_data['college_frequency'].min())
-    
-    # ============= COMPOSITE SCOUTING SCORES =============
-    
-    # 10. Overall Scout Grade (0-100 scale)
-    # Combine: draft pick value (40%), age fitness (20%), college strength (20%), athletic profile (20%)
-    engineered_data['scout_grade'] = (
-        engineered_data['draft_value_score'] * 40 +
-        (1 - engineered_data['age_normalized']) * 20 +  # Younger is better
-        engineered_data['college_frequency_normalized'] * 20 +
-        engineered_data['meets_normalized'] * 20
-    )
-    
-    # 11. Draft Predictability Score (how predictable their draft position was)
-    # Position-specific average draft picks
-    position_avg_pick = engineered_data.groupby('position')['draft_pick'].transform('mean')
-    engineered_data['position_avg_pick'] = position_avg_pick
-    engineered_data['pick_vs_position_avg'] = engineered_data['draft_pick'] - engineered_data['position_avg_pick']
-    engineered_data['draft_predictability'] = (engineered_data['pick_vs_position_avg'].abs() / engineered_data['position_avg_pick']).replace([np.inf, -np.inf], 0)
-    
-    # ============= ENCODE CATEGORICAL VARIABLES =============
-    
-    # One-hot encode position tier
-    position_dummies = pd.get_dummies(engineered_data['position_tier'], prefix='pos_tier')
-    engineered_data = pd.concat([engineered_data, position_dummies], axis=1)
+    def __init__(self):
+        self.draft_pick_max = None
+        self.age_bounds = None
+        self.college_years_bounds = None
+        self.meets_bounds = None
+        self.college_counts = None
+        self.college_frequency_bounds = None
+        self.position_avg_pick = None
+        self.tier_columns = None
+        self.fill_values = None
+        self.data_hash = None  # Fingerprint of the training table, set when saved next to models
+        self.fitted = False
+    
+    def fit(self, data):
+        """
+        Learn dataset statistics from training data.
+        
+        Args:
+            data: DataFrame of historical draft data
+        
+        Returns:
+            self
+        """
+        data = self._with_input_columns(data)
+        position = _map_distinct(data['pos'], _clean_position)
+        
+        # College school strength (frequency analysis - most players from strong programs)
+        self.college_counts = data['college'].value_counts()
+        
+        # Min/max of every normalized input in a single stats pass
+        stats = pd.DataFrame({
+            'draft_pick': data['draft_pick'],
+            'age': data['age'],
+            'college_years': pd.to_numeric(data['college/yrs'], errors='coerce'),
+            'meets': pd.to_numeric(data['meets'], errors='coerce'),
+            'college_frequency': data['college'].map(self.college_counts).astype(float),
+        }).agg(['min', 'max'])
+        bounds = {col: (float(stats.at['min', col]), float(stats.at['max', col])) for col in stats.columns}
+        self.draft_pick_max = bounds['draft_pick'][1]
+        self.age_bounds = bounds['age']
+        self.college_years_bounds = bounds['college_years']
+        self.meets_bounds = bounds['meets']
+        self.college_frequency_bounds = bounds['college_frequency']
+        
+        # Position-specific average draft picks
+        self.position_avg_pick = data['draft_pick'].groupby(position, observed=True).mean()
+        self.position_avg_pick.index = self.position_avg_pick.index.astype(str)
+        tiers = {_position_tier(pos) for pos in position.cat.categories}
+        if position.isna().any():
+            tiers.add(_position_tier(np.nan))
+        self.tier_columns = sorted(f"pos_tier_{tier}" for tier in tiers)
+        
+        # Median fill values, taken from the engineered (pre-fill) training frame
+        self.fitted = True
+        engineered_data = self._transform_unfilled(data)
+        numeric_cols = engineered_data.select_dtypes(include=[np.number]).columns
+        self.fill_values = engineered_data[numeric_cols].median().to_dict()
+        return self
+    
+    def transform(self, data, inplace=False):
+        """
+        Engineer features for data using the statistics learned in fit().
+        
+        Args:
+            data: DataFrame (any number of rows, e.g. one new prospect)
+            inplace: Add the engineered columns to data itself instead of to a
+                     shallow copy of it (the input columns are never copied either way)
+        
+        Returns:
+            DataFrame with original + engineered features (data itself if inplace)
+        """
+        if not self.fitted:
+            raise ValueError("FeaturePipeline must be fit first")
+        
+        engineered_data = self._transform_unfilled(self._with_input_columns(data, inplace), inplace)
+        
+        # ============= CLEANUP & VALIDATION =============
+        
+        # Fill NaN values in numeric features with the training medians
+        numeric_cols = engineered_data.select_dtypes(include=[np.number]).columns
+        fill_values = {col: value for col, value in self.fill_values.items() if col in numeric_cols}
+        if inplace:
+            engineered_data.fillna(fill_values, inplace=True)
+            return engineered_data
+        return engineered_data.fillna(fill_values)
+    
+    @property
+    def feature_columns(self):
+        """Numeric and boolean columns transform() outputs (the columns a model may fit on)"""
+        if not self.fitted:
+            raise ValueError("FeaturePipeline must be fit first")
+        return list(self.fill_values) + list(self.tier_columns)
+    
+    def fit_transform(self, data, inplace=False):
+        """fit(data) then transform(data, inplace)"""
+        return self.fit(data).transform(data, inplace=inplace)
+    
+    def save(self, path):
+        """Persist the learned statistics (tagged with FEATURE_PIPELINE_VERSION)"""
+        if not self.fitted:
+            raise ValueError("FeaturePipeline must be fit first")
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        import joblib
+        joblib.dump({'pipeline_version': FEATURE_PIPELINE_VERSION, 'state': self.__dict__}, path)
+        return path
+    
+    @classmethod
+    def load(cls, path):
+        """Load a pipeline saved with save(), without refitting"""
+        import joblib
+        artifact = joblib.load(Path(path))
+        if artifact.get('pipeline_version') != FEATURE_PIPELINE_VERSION:
+            raise ValueError(f"Feature pipeline {path} is version {artifact.get('pipeline_version')}, "
+                             f"expected {FEATURE_PIPELINE_VERSION}")
+        pipeline = cls()
+        pipeline.__dict__.update(artifact['state'])
+        return pipeline
+    
+    @staticmethod
+    def _with_input_columns(data, inplace=False):
+        """data, with any missing INPUT_COLUMNS added as NaN"""
+        missing = [col for col in INPUT_COLUMNS if col not in data.columns]
+        if not missing:
+            return data
+        if not inplace:
+            data = data.copy(deep=False)
+        for col in missing:
+            data[col] = np.nan
+        return data
+    
+    def _transform_unfilled(self, data, inplace=False):
+        """All engineered features from the learned statistics, before NaN filling"""
+        # New columns go onto data itself or onto a shallow copy sharing its
+        # column buffers; every step below assigns whole columns, so the
+        # caller's frame is never written through the copy
+        engineered_data = data if inplace else data.copy(deep=False)
+        
+        # ============= DRAFT METRICS =============
+        
+        # 1. Draft Pick Value (earlier pick = higher value)
+        # Normalize to 0-1 scale (lower pick # = higher value)
+        engineered_data['draft_value_score'] = 1 - (engineered_data['draft_pick'] / self.draft_pick_max)
+        
+        # 2. Round (approximate from draft pick)
+        # Roughly: Round 1 = picks 1-32, Round 2 = 33-64, etc.
+        engineered_data['draft_round'] = pd.cut(engineered_data['draft_pick'], 
+                                                bins=[0, 32, 64, 96, 128, 192, 224, 256],
+                                                labels=[1, 2, 3, 4, 5, 6, 7])
+        engineered_data['draft_round'] = pd.to_numeric(engineered_data['draft_round'], errors='coerce')
+        
+        # 3. Early Pick Indicator (first 2 rounds = high priority)
+        engineered_data['is_early_pick'] = (engineered_data['draft_pick'] <= 64).astype(int)
+        
+        # ============= AGE & EXPERIENCE METRICS =============
+        
+        # 4. Age normalized (college players typically 20-25)
+        engineered_data['age_normalized'] = _normalize(engineered_data['age'], self.age_bounds)
+        
+        # 5. College years/experience
+        engineered_data['college_years_numeric'] = pd.to_numeric(engineered_data['college/yrs'], errors='coerce')
+        engineered_data['college_years_normalized'] = _normalize(engineered_data['college_years_numeric'],
+                                                                 self.college_years_bounds)
+        
+        # 6. Age-to-experience ratio (younger with more years = good development)
+        engineered_data['age_experience_ratio'] = engineered_data['age'] / engineered_data['college_years_numeric'].replace(0, 1)
+        
+        # ============= PHYSICAL ATTRIBUTES =============
+        
+        # Note: Height and Weight in CSV appear corrupted from scraping
+        # These features will be NA if data can't be parsed
+        engineered_data['height_numeric'] = pd.to_numeric(engineered_data['ht'], errors='coerce')
+        engineered_data['weight_numeric'] = pd.to_numeric(engineered_data['wt'], errors='coerce')
+        
+        # BMI calculation (only where we have valid height/weight)
+        # BMI = weight (lbs) / (height (inches) ^ 2) * 703
+        engineered_data['bmi'] = (engineered_data['weight_numeric'] / 
+                                  (engineered_data['height_numeric'] ** 2)) * 703
+        engineered_data['bmi'] = engineered_data['bmi'].replace([np.inf, -np.inf], np.nan)
+        
+        # ============= POSITION-BASED FEATURES =============
+        
+        # 7. Position categories (categorical: string work is per distinct code)
+        engineered_data['position'] = _map_distinct(engineered_data['pos'], _clean_position)
+        
+        # Position tiers (for scouting analysis)
+        engineered_data['position_tier'] = _map_distinct(engineered_data['position'], _position_tier)
+        
+        # QB flag (quarterbacks are unique in scouting)
+        engineered_data['is_qb'] = (engineered_data['position'] == 'QB').astype(int)
+        
+        # Defensive position flag
+        engineered_data['is_defensive'] = _map_distinct(engineered_data['position'], _is_defensive).astype(int)
+        
+        # ============= COLLEGE STRENGTH METRICS =============
+        
+        # 8. Number of "Meets" (likely combine meets/benchmarks)
+        engineered_data['meets_numeric'] = pd.to_numeric(engineered_data['meets'], errors='coerce')
+        
+        # Normalize meets score
+        engineered_data['meets_normalized'] = _normalize(engineered_data['meets_numeric'], self.meets_bounds)
+        
+        # 9. College school strength, from training-set frequencies
+        # (cast: mapping a categorical 'college' would otherwise yield a categorical)
+        engineered_data['college_frequency'] = engineered_data['college'].map(self.college_counts).astype(float)
+        engineered_data['college_frequency_normalized'] = _normalize(engineered_data['college_frequency'],
+                                                                     self.college_frequency_bounds)
+        
+        # ============= COMPOSITE SCOUTING SCORES =============
+        
+        # 10. Overall Scout Grade (0-100 scale)
+        # Combine: draft pick value (40%), age fitness (20%), college strength (20%), athletic profile (20%)
+        engineered_data['scout_grade'] = (
+            engineered_data['draft_value_score'] * 40 +
+            (1 - engineered_data['age_normalized']) * 20 +  # Younger is better
+            engineered_data['college_frequency_normalized'] * 20 +
+            engineered_data['meets_normalized'] * 20
+        )
+        
+        # 11. Draft Predictability Score (how predictable their draft position was)
+        # Position-specific average draft picks, learned in fit()
+        engineered_data['position_avg_pick'] = engineered_data['position'].map(self.position_avg_pick).astype(float)
+        engineered_data['pick_vs_position_avg'] = engineered_data['draft_pick'] - engineered_data['position_avg_pick']
+        engineered_data['draft_predictability'] = (engineered_data['pick_vs_position_avg'].abs() / engineered_data['position_avg_pick']).replace([np.inf, -np.inf], 0)
+        
+        # ============= ENCODE CATEGORICAL VARIABLES =============
+        
+        # One-hot encode position tier (always the tiers seen in training),
+        # added column by column rather than concatenated into a new frame
+        for col in self.tier_columns:
+            engineered_data[col] = engineered_data['position_tier'] == col[len('pos_tier_'):]
+        
+        return engineered_data
+
+
+def engineer_features(data, inplace=False):
+    """
+    Engineer meaningful features from NFL draft data for scouting analysis.
     
-    # ============= CLEANUP & VALIDATION =============
+    Fits a FeaturePipeline on data and transforms the same rows. To score new
+    prospects with historical statistics, keep a fitted FeaturePipeline and
+    call its transform() on the new rows instead.
     
-    # Fill NaN values in numeric features with median
-    numeric_cols = engineered_data.select_dtypes(include=[np.number]).columns
-    for col in numeric_cols:
-        if engineered_data[col].isna().any():
-            engineered_data[col] = engineered_data[col].fillna(engineered_data[col].median())
+    With inplace=True the engineered columns are added to data itself.
     
-    return engineered_data
+    Returns DataFrame with original + engineered features
+    """
+    return FeaturePipeline().fit_transform(data, inplace=inplace)
 
 
 def get_feature_descriptions():
@@ -161,23 +359,213 @@ def get_feature_descriptions():
     return features
 
 
-def scale_features(data, feature_cols=None):
+def scale_features(data, feature_cols=None, inplace=False):
     """
     Scale numeric features to 0-1 range for ML models.
     
     Args:
         data: DataFrame with engineered features
         feature_cols: List of columns to scale (if None, scales all numeric)
+        inplace: Replace the columns in data itself instead of in a shallow copy
     
     Returns:
-        Scaled DataFrame
+        Scaled DataFrame (data itself if inplace)
     """
-    data_scaled = data.copy()
+    data_scaled = data if inplace else data.copy(deep=False)
     
     if feature_cols is None:
         feature_cols = data_scaled.select_dtypes(include=[np.number]).columns.tolist()
     
+    from sklearn.preprocessing import StandardScaler
     scaler = StandardScaler()
     data_scaled[feature_cols] = scaler.fit_transform(data_scaled[feature_cols])
     
     return data_scaled
+
+
+# Identifier and raw input columns never used as model features
+MATRIX_EXCLUDE_COLS = ['name', 'team', 'college', 'pos', 'position', 'position_tier', 'ht', 'wt', 'age', 'meets']
+
+# Draft target columns, stored first in a FeatureMatrix so that each model's
+# features (everything after the targets it must not see) are one column block
+MATRIX_TARGET_COLS = ['draft_pick', 'draft_round']
+
+
+class FeatureMatrix:
+    """
+    One float32 feature matrix shared by every model trained on a frame.
+    
+    Each numeric/boolean column of an engineered DataFrame (minus identifiers)
+    is written straight into a single Fortran-ordered float32 array, NaNs are
+    filled with the column medians and the columns are standardized in place.
+    Models then take their features as column slices of it - views, not copies -
+    so training the predictor, classifier and comparator holds the features in
+    memory once instead of as a filled, float64-scaled copy per model.
+    """
+    
+    def __init__(self, df):
+        """
+        Args:
+            df: DataFrame with engineered features
+        """
+        leading = [col for col in MATRIX_TARGET_COLS if col in df.columns]
+        self.columns = leading + [col for col in df.columns
+                                  if col not in MATRIX_EXCLUDE_COLS and col not in leading
+                                  and pd.api.types.is_numeric_dtype(df[col])]
+        self.index = df.index
+        self._positions = {col: j for j, col in enumerate(self.columns)}
+        
+        self.values = np.empty((len(df), len(self.columns)), dtype=np.float32, order='F')
+        self.medians = np.zeros(len(self.columns))
+        self.mean = np.zeros(len(self.columns))
+        self.var = np.zeros(len(self.columns))
+        for j, col in enumerate(self.columns):
+            column = self.values[:, j]
+            column[:] = df[col].to_numpy(dtype=np.float32, na_value=np.nan)
+            missing = np.isnan(column)
+            if missing.all():
+                column[:] = 0
+            elif missing.any():
+                self.medians[j] = np.median(column[~missing])
+                column[missing] = self.medians[j]
+            else:
+                self.medians[j] = np.median(column)
+            # Statistics accumulate in float64, one column at a time
+            self.mean[j] = column.mean(dtype=np.float64)
+            self.var[j] = column.var(dtype=np.float64)
+            column -= np.float32(self.mean[j])
+            column /= np.float32(self._scale(self.var[j]))
+    
+    def __len__(self):
+        return len(self.index)
+    
+    @staticmethod
+    def _scale(var):
+        """Standard deviation used to scale a column (1 for constant columns, as StandardScaler does)"""
+        return np.sqrt(var) if var > 0 else 1.0
+    
+    def view(self, columns):
+        """
+        Rows x columns block of the standardized matrix
+        
+        A view when columns are stored contiguously in this order (as every
+        model's feature set is), otherwise a copy.
+        """
+        positions = [self._positions[col] for col in columns]
+        start = positions[0] if positions else 0
+        if positions == list(range(start, start + len(positions))):
+            return self.values[:, start:start + len(positions)]
+        return self.values[:, positions]
+    
+    def model_inputs(self, df, exclude_cols):
+        """
+        Everything a model fits from: its feature columns, their standardized
+        values and the fill values/scaler to apply to rows it later scores.
+        
+        Args:
+            df: The DataFrame this matrix was built from
+            exclude_cols: The model's target and identifier columns
+            
+        Returns:
+            Tuple of (feature columns, float32 view, fill values Series, fitted StandardScaler)
+        """
+        if not self.index.equals(df.index):
+            raise ValueError("FeatureMatrix was built from a different DataFrame")
+        from sklearn.preprocessing import StandardScaler
+        
+        columns = [col for col in self.columns if col not in exclude_cols]
+        positions = [self._positions[col] for col in columns]
+        
+        # The shared statistics of these columns, in the form fit() would leave them
+        scaler = StandardScaler()
+        scaler.n_features_in_ = len(columns)
+        scaler.feature_names_in_ = np.asarray(columns, dtype=object)
+        scaler.n_samples_seen_ = len(self)
+        scaler.mean_ = self.mean[positions]
+        scaler.var_ = self.var[positions]
+        scaler.scale_ = np.array([self._scale(var) for var in scaler.var_])
+        
+        fill_values = pd.Series(self.medians[positions], index=columns)
+        return columns, self.view(columns), fill_values, scaler
+
+
+# Bump whenever engineer_features changes its output so stale caches are ignored
+FEATURE_PIPELINE_VERSION = 3
+
+# Default location for cached engineered feature matrices
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent / 'cache'
+
+
+def _file_digest(path, block_size=1 << 20):
+    """SHA-256 of a file's contents, read in blocks"""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def feature_cache_path(csv_file, cache_dir=DEFAULT_CACHE_DIR):
+    """
+    Content-addressed cache location for the engineered features of csv_file.
+    
+    The key combines the input file's hash with FEATURE_PIPELINE_VERSION, so
+    editing the CSV or the pipeline produces a new key.
+    """
+    key = f"{_file_digest(csv_file)}-v{FEATURE_PIPELINE_VERSION}"
+    return Path(cache_dir) / f"features-{key}.parquet"
+
+
+def _as_categoricals(df, columns):
+    """Cast the given columns (where present) to 'category' in place"""
+    for col in columns:
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype('category')
+    return df
+
+
+def load_engineered_features(csv_file, cache_dir=DEFAULT_CACHE_DIR, use_cache=True):
+    """
+    Load a draft CSV and return its engineered features, using an on-disk cache.
+    
+    On a cache hit the Parquet file is read directly, skipping CSV parsing and
+    feature engineering. On a miss the features are computed and written to
+    the cache. Caching is skipped (with a warning) if pyarrow is unavailable.
+    
+    Args:
+        csv_file: Path to a raw draft CSV (as accepted by load_draft_data)
+        cache_dir: Directory holding cached feature files
+        use_cache: If False, always recompute and don't touch the cache
+    
+    Returns:
+        DataFrame with original + engineered features
+    """
+    from .data_loader import load_draft_data, DRAFT_CATEGORICAL_COLS
+    
+    if not use_cache:
+        return engineer_features(load_draft_data(csv_file))
+    
+    cache_file = feature_cache_path(csv_file, cache_dir)
+    if cache_file.exists():
+        try:
+            return _as_categoricals(pd.read_parquet(cache_file), DRAFT_CATEGORICAL_COLS)
+        except Exception as e:
+            print(f"Warning: Ignoring unreadable feature cache {cache_file}: {e}")
+    
+    # Parquet doesn't round-trip every categorical (e.g. integer categories), so
+    # normalize them on both paths to make cache hits and misses identical
+    engineered_data = _as_categoricals(engineer_features(load_draft_data(csv_file)),
+                                       DRAFT_CATEGORICAL_COLS)
+    
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temp name then rename so readers never see a partial file
+        tmp_file = cache_file.with_suffix('.parquet.tmp')
+        engineered_data.to_parquet(tmp_file, index=True)
+        os.replace(tmp_file, cache_file)
+    except ImportError:
+        print("Warning: pyarrow not installed - engineered features will not be cached")
+    except Exception as e:
+        print(f"Warning: Could not write feature cache {cache_file}: {e}")
+    
+    return engineered_data
@@ -5,66 +5,301 @@ NFL Draft Prediction & Comparison Models
 Includes draft position prediction, player success classification, and similarity analysis
 """
 
+import hashlib
+import multiprocessing
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
 import pandas as pd
 import numpy as np
-from sklearn.ensemble import RandomForestRegressor, RandomForestClassifier, GradientBoostingRegressor
-from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import StandardScaler
-from sklearn.metrics import mean_squared_error, r2_score, accuracy_score, classification_report
-from scipy.spatial.distance import euclidean, cosine
+from .feature_engineering import INPUT_COLUMNS, FeatureMatrix, FeaturePipeline
+from .player_index import PlayerIndex
+from .neighbors import GroupedNeighborIndex, NeighborTable
 import warnings
 warnings.filterwarnings('ignore')
 
+# Bump when the layout of saved model artifacts changes
+ARTIFACT_VERSION = 1
+
+# Default location for persisted model artifacts
+DEFAULT_ARTIFACT_DIR = Path(__file__).parent.parent / 'artifacts'
+
+# Same-position neighbors precomputed per player for O(K) comp lookups
+NEIGHBOR_TABLE_K = 20
+
+# Directory (under the artifact directory) holding the precomputed neighbor table
+NEIGHBOR_TABLE_DIR = 'player_neighbors'
+
+# Feature pipeline fit on the models' training table, for scoring raw prospects
+PIPELINE_FILE = 'feature_pipeline.joblib'
+
+# Below this many rows, starting worker processes costs more than training
+# the three models one after another
+PARALLEL_TRAINING_MIN_ROWS = 20000
+
+
+def hash_training_data(df):
+    """Stable SHA-256 fingerprint of a training DataFrame (values, index and columns)"""
+    h = hashlib.sha256()
+    h.update('\x1f'.join(map(str, df.columns)).encode('utf-8'))
+    h.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+def _save_artifact(obj, path, state):
+    """Write a versioned artifact dict for obj to path"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    artifact = {
+        'artifact_version': ARTIFACT_VERSION,
+        'model_type': type(obj).__name__,
+        **state,
+    }
+    import joblib
+    joblib.dump(artifact, path)
+    return path
+
+
+def _load_artifact(cls, path):
+    """Read an artifact written by _save_artifact and validate its type/version"""
+    import joblib
+    artifact = joblib.load(Path(path))
+    if artifact.get('artifact_version') != ARTIFACT_VERSION:
+        raise ValueError(f"Unsupported artifact version {artifact.get('artifact_version')} "
+                         f"(expected {ARTIFACT_VERSION}): {path}")
+    if artifact.get('model_type') != cls.__name__:
+        raise ValueError(f"Artifact {path} holds a {artifact.get('model_type')}, not a {cls.__name__}")
+    return artifact
+
+
+def _extend_hash(data_hash, new_df):
+    """Fingerprint of a model's training data after it has also been fitted on new_df"""
+    return hashlib.sha256(f"{data_hash}+{hash_training_data(new_df)}".encode('utf-8')).hexdigest()
+
+
+def _feature_columns(df, exclude_cols):
+    """Numeric columns of df a model fits on (all but its target and identifier columns)"""
+    return [c for c in df.columns if c not in exclude_cols and pd.api.types.is_numeric_dtype(df[c])]
+
+
+def _to_frame(player_data):
+    """Coerce a single player (Series or dict) or a batch into a DataFrame"""
+    if isinstance(player_data, pd.Series):
+        return player_data.to_frame().T
+    if isinstance(player_data, dict):
+        return pd.DataFrame([player_data])
+    return player_data
+
+
+def _iter_chunks(df, chunk_size=None):
+    """Yield consecutive row slices of df (the whole frame if chunk_size is None; nothing if df is empty)"""
+    if len(df) == 0:
+        return
+    if not chunk_size or chunk_size >= len(df):
+        yield df
+        return
+    for start in range(0, len(df), chunk_size):
+        yield df.iloc[start:start + chunk_size]
+
+
+# Early stopping: hold out this fraction of the fitted rows and stop adding
+# estimators once the hold-out score fails to improve this many times in a row
+VALIDATION_FRACTION = 0.1
+N_ITER_NO_CHANGE = 10
+
+def _gbr_engine(early_stopping):
+    """Exact gradient boosting (single-threaded)"""
+    from sklearn.ensemble import GradientBoostingRegressor
+    return GradientBoostingRegressor(n_estimators=100, learning_rate=0.1, max_depth=5, random_state=42,
+                                     n_iter_no_change=N_ITER_NO_CHANGE if early_stopping else None,
+                                     validation_fraction=VALIDATION_FRACTION)
+
+
+def _hist_engine(early_stopping):
+    """Histogram-binned gradient boosting (multi-threaded, missing values routed per split)"""
+    from sklearn.ensemble import HistGradientBoostingRegressor
+    return HistGradientBoostingRegressor(max_iter=100, learning_rate=0.1, max_depth=5, random_state=42,
+                                         early_stopping=early_stopping, n_iter_no_change=N_ITER_NO_CHANGE,
+                                         validation_fraction=VALIDATION_FRACTION)
+
+
+# Regressor backends for DraftPositionPredictor:
+# name -> (estimator factory taking early_stopping, handles NaN natively)
+# (scikit-learn is imported by the factories, not when this module loads)
+PREDICTOR_ENGINES = {
+    'gbr': (_gbr_engine, False),
+    'hist': (_hist_engine, True),
+}
+DEFAULT_PREDICTOR_ENGINE = 'gbr'
+
+# Trees added per round when partial_update grows the success classifier's forest
+FOREST_UPDATE_STEP = 10
+
+# Hold-out rows kept for permutation importance when an engine has no feature_importances_
+IMPORTANCE_HOLDOUT_ROWS = 1000
+
 
 class DraftPositionPredictor:
     """Predict a player's draft position based on college stats and attributes"""
     
-    def __init__(self):
+    # Target and identifier columns never used as features
+    EXCLUDE_COLS = ['draft_pick', 'name', 'team', 'college', 'pos', 'position',
+                    'position_tier', 'ht', 'wt', 'age', 'meets']
+    
+    def __init__(self, engine=DEFAULT_PREDICTOR_ENGINE, early_stopping=False):
+        """
+        Args:
+            engine: Name of a PREDICTOR_ENGINES backend, or an unfitted scikit-learn
+                    regressor (cloned before fitting; missing values are filled for it)
+            early_stopping: Stop boosting once a validation fraction of the training
+                            rows stops improving (named engines only)
+        """
+        if isinstance(engine, str) and engine not in PREDICTOR_ENGINES:
+            raise ValueError(f"Unknown engine '{engine}' (choose from {', '.join(PREDICTOR_ENGINES)})")
+        self.engine = engine
+        self.early_stopping = early_stopping
         self.model = None
+        from sklearn.preprocessing import StandardScaler
         self.scaler = StandardScaler()
         self.feature_cols = None
+        self.fill_values = None
+        self.importances = None
+        self._holdout = None
+        self.metrics = None
+        self.data_hash = None
         self.trained = False
+    
+    @property
+    def handles_nan(self):
+        """Whether the engine consumes missing values as-is instead of filled ones"""
+        return isinstance(self.engine, str) and PREDICTOR_ENGINES[self.engine][1]
+    
+    def _make_estimator(self):
+        if isinstance(self.engine, str):
+            return PREDICTOR_ENGINES[self.engine][0](self.early_stopping)
+        from sklearn.base import clone
+        return clone(self.engine)
+    
+    def _n_iterations(self):
+        """Boosting iterations fitted so far"""
+        return getattr(self.model, 'n_estimators_', None) or self.model.n_iter_
         
-    def train(self, df):
+    def train(self, df, features=None):
         """
         Train model to predict draft pick number
         
         Args:
             df: DataFrame with engineered features including 'draft_pick'
+            features: Optional FeatureMatrix built from df; the model then fits a
+                      view of its shared (median-filled, standardized) values.
+                      Ignored by engines that handle NaN: they are scored on
+                      unfilled rows, so they are fit on unfilled ones too
         """
-        print("Training Draft Position Predictor...")
-        
-        # Select features for prediction (exclude target and identifiers)
-        exclude_cols = ['draft_pick', 'name', 'team', 'college', 'pos', 'position', 
-                       'position_tier', 'ht', 'wt', 'age', 'meets']
-        self.feature_cols = [c for c in df.columns if c not in exclude_cols]
+        from sklearn.metrics import mean_squared_error, r2_score
+        from sklearn.model_selection import train_test_split
         
-        X = df[self.feature_cols].fillna(df[self.feature_cols].median())
+        print("Training Draft Position Predictor...")
+        self.data_hash = hash_training_data(df)
         y = df['draft_pick']
         
-        # Scale features
-        X_scaled = self.scaler.fit_transform(X)
+        if features is not None and not self.handles_nan:
+            self.feature_cols, X_scaled, self.fill_values, self.scaler = features.model_inputs(
+                df, self.EXCLUDE_COLS)
+        else:
+            # Select features for prediction (exclude target and identifiers)
+            self.feature_cols = _feature_columns(df, self.EXCLUDE_COLS)
+            
+            X = df[self.feature_cols]
+            self.fill_values = X.median()
+            if not self.handles_nan:
+                X = X.fillna(self.fill_values)
+            
+            # Scale features (NaNs pass through for engines that handle them)
+            X_scaled = self.scaler.fit_transform(X)
         
         # Split data (80/20)
         X_train, X_test, y_train, y_test = train_test_split(X_scaled, y, test_size=0.2, random_state=42)
         
-        # Train Gradient Boosting model (better for regression)
-        self.model = GradientBoostingRegressor(n_estimators=100, learning_rate=0.1, 
-                                               max_depth=5, random_state=42)
+        # Train the gradient boosting engine (better for regression)
+        self.model = self._make_estimator()
         self.model.fit(X_train, y_train)
         
         # Evaluate
         y_pred = self.model.predict(X_test)
         rmse = np.sqrt(mean_squared_error(y_test, y_pred))
         r2 = r2_score(y_test, y_pred)
+        self.metrics = {'rmse': float(rmse), 'r2': float(r2)}
+        
+        # Engines without impurity importances are ranked by permutation importance
+        # on (a sample of) the hold-out, computed the first time they are asked for
+        if hasattr(self.model, 'feature_importances_'):
+            self.importances = self.model.feature_importances_
+            self._holdout = None
+        else:
+            self.importances = None
+            self._holdout = (X_test[:IMPORTANCE_HOLDOUT_ROWS], np.asarray(y_test)[:IMPORTANCE_HOLDOUT_ROWS])
         
         print(f"  Train/Test split: {len(X_train)}/{len(X_test)}")
+        if self.early_stopping:
+            print(f"  Boosting iterations: {self._n_iterations()} (early stopping)")
         print(f"  RMSE: {rmse:.2f} picks")
         print(f"  R² Score: {r2:.3f}")
         
         self.trained = True
         return self
     
+    def partial_update(self, new_df, n_estimators=None):
+        """
+        Fold a new draft class into a trained model without refitting on history.
+        
+        Warm-starts the booster and fits up to n_estimators extra iterations to
+        the residuals of new_df only, reusing the fitted scaler and fill values,
+        so the cost tracks the size of new_df. With early_stopping, iterations
+        stop once a validation fraction of new_df stops improving.
+        
+        Args:
+            new_df: DataFrame with engineered features (same columns as training)
+            n_estimators: Maximum iterations to add (default: a quarter of the current count)
+            
+        Returns:
+            self
+        """
+        if not self.trained:
+            raise ValueError("Model must be trained first")
+        from sklearn.ensemble import HistGradientBoostingRegressor
+        from sklearn.metrics import mean_squared_error
+        
+        params = self.model.get_params()
+        # HistGradientBoostingRegressor re-fits its feature bins on every call to fit,
+        # so warm-started iterations would score the existing trees on mismatched bins
+        if 'warm_start' not in params or isinstance(self.model, HistGradientBoostingRegressor):
+            raise ValueError(f"{type(self.model).__name__} does not support incremental updates; retrain instead")
+        size_param = 'n_estimators' if 'n_estimators' in params else 'max_iter'
+        
+        print(f"Updating Draft Position Predictor with {len(new_df)} new players...")
+        X = new_df[self.feature_cols]
+        if not self.handles_nan:
+            X = X.fillna(self.fill_values if self.fill_values is not None else 0)
+        X_scaled = self.scaler.transform(X)
+        y = new_df['draft_pick']
+        
+        before = self._n_iterations()
+        rmse_before = np.sqrt(mean_squared_error(y, self.model.predict(X_scaled)))
+        self.model.set_params(warm_start=True, **{size_param: before + (n_estimators or max(10, before // 4))})
+        self.model.fit(X_scaled, y)
+        self.model.set_params(warm_start=False)
+        rmse_after = np.sqrt(mean_squared_error(y, self.model.predict(X_scaled)))
+        
+        if hasattr(self.model, 'feature_importances_'):
+            self.importances = self.model.feature_importances_
+        else:
+            self.importances = None
+        self.data_hash = _extend_hash(self.data_hash, new_df)
+        
+        print(f"  Boosting iterations: {before} -> {self._n_iterations()}")
+        print(f"  RMSE on new class: {rmse_before:.2f} -> {rmse_after:.2f} picks")
+        return self
+    
     def predict(self, player_data):
         """
         Predict draft position for a player
@@ -78,23 +313,48 @@ class DraftPositionPredictor:
         if not self.trained:
             raise ValueError("Model must be trained first")
         
-        if isinstance(player_data, pd.Series):
-            player_data = player_data.to_frame().T
-        elif isinstance(player_data, dict):
-            player_data = pd.DataFrame([player_data])
+        return int(self.predict_batch(_to_frame(player_data))[0])
+    
+    def predict_batch(self, df, chunk_size=None):
+        """
+        Predict draft positions for many players in one vectorized call
         
-        X = player_data[self.feature_cols].fillna(0)
-        X_scaled = self.scaler.transform(X)
-        prediction = self.model.predict(X_scaled)[0]
+        Args:
+            df: DataFrame of players with engineered features
+            chunk_size: Optional number of rows scored per chunk to bound memory
+            
+        Returns:
+            Array of predicted draft pick numbers (one per row of df)
+        """
+        if not self.trained:
+            raise ValueError("Model must be trained first")
+        
+        preds = []
+        for chunk in _iter_chunks(df, chunk_size):
+            X = chunk[self.feature_cols]
+            if not self.handles_nan:
+                X = X.fillna(0)
+            X_scaled = self.scaler.transform(X)
+            preds.append(self.model.predict(X_scaled))
         
-        return max(1, int(prediction))  # Ensure positive pick number
+        if not preds:
+            return np.empty(0, dtype=int)
+        # Ensure positive pick numbers
+        return np.maximum(1, np.concatenate(preds).astype(int))
     
     def feature_importance(self, top_n=10):
         """Get most important features for draft prediction"""
         if not self.trained:
             return None
         
-        importances = self.model.feature_importances_
+        if self.importances is None and hasattr(self.model, 'feature_importances_'):
+            self.importances = self.model.feature_importances_
+        elif self.importances is None:
+            from sklearn.inspection import permutation_importance
+            X_holdout, y_holdout = self._holdout
+            self.importances = permutation_importance(self.model, X_holdout, y_holdout, n_repeats=5,
+                                                      random_state=42).importances_mean
+        importances = self.importances
         indices = np.argsort(importances)[-top_n:][::-1]
         
         result = {}
@@ -102,53 +362,120 @@ class DraftPositionPredictor:
             result[self.feature_cols[idx]] = float(importances[idx])
         
         return result
+    
+    def save(self, path):
+        """
+        Persist the trained model, fitted scaler and feature list
+        
+        Args:
+            path: Destination file (e.g. 'artifacts/draft_predictor.joblib')
+            
+        Returns:
+            Path the artifact was written to
+        """
+        if not self.trained:
+            raise ValueError("Model must be trained first")
+        return _save_artifact(self, path, {
+            'engine': self.engine,
+            'early_stopping': self.early_stopping,
+            'model': self.model,
+            'scaler': self.scaler,
+            'feature_cols': self.feature_cols,
+            'fill_values': self.fill_values,
+            'importances': self.importances,
+            'holdout': self._holdout,
+            'metrics': self.metrics,
+            'data_hash': self.data_hash,
+        })
+    
+    @classmethod
+    def load(cls, path):
+        """Load a predictor saved with save() without retraining"""
+        artifact = _load_artifact(cls, path)
+        predictor = cls(engine=artifact.get('engine', DEFAULT_PREDICTOR_ENGINE),
+                        early_stopping=artifact.get('early_stopping', False))
+        predictor.model = artifact['model']
+        predictor.scaler = artifact['scaler']
+        predictor.feature_cols = artifact['feature_cols']
+        predictor.fill_values = artifact.get('fill_values')
+        predictor.importances = artifact.get('importances')
+        predictor._holdout = artifact.get('holdout')
+        predictor.metrics = artifact.get('metrics')
+        predictor.data_hash = artifact['data_hash']
+        predictor.trained = True
+        return predictor
 
 
 class PlayerSuccessClassifier:
     """Predict if a player will have a successful NFL career"""
     
-    def __init__(self, success_threshold=5):
+    # Target and identifier columns never used as features
+    EXCLUDE_COLS = ['draft_pick', 'draft_round', 'success', 'name', 'team', 'college',
+                    'pos', 'position', 'position_tier', 'ht', 'wt', 'age', 'meets']
+    
+    def __init__(self, success_threshold=5, n_jobs=None):
         """
         Args:
             success_threshold: Players drafted in rounds <= threshold are "successful"
                              (Round 1-5 typically means more NFL success)
+            n_jobs: Cores used to fit the forest (-1 = all). Scoring always uses
+                    one: a pool per single-row prediction costs more than it saves
         """
         self.model = None
+        from sklearn.preprocessing import StandardScaler
         self.scaler = StandardScaler()
         self.feature_cols = None
         self.success_threshold = success_threshold
+        self.n_jobs = n_jobs
+        self.fill_values = None
+        self.data_hash = None
         self.trained = False
         
-    def train(self, df):
+    def train(self, df, features=None):
         """
         Train model to classify successful vs unsuccessful players
         Using draft round as proxy for success (early picks = more successful)
         
         Args:
             df: DataFrame with engineered features
+            features: Optional FeatureMatrix built from df; the model then fits a
+                      view of its shared (median-filled, standardized) values
         """
+        from sklearn.ensemble import RandomForestClassifier
+        from sklearn.metrics import accuracy_score
+        from sklearn.model_selection import train_test_split
+        
         print(f"\nTraining Player Success Classifier (success = round <= {self.success_threshold})...")
+        self.data_hash = hash_training_data(df)
         
         # Define success: early draft picks have higher NFL success rate
-        df['success'] = (df['draft_round'] <= self.success_threshold).astype(int)
-        
-        # Select features
-        exclude_cols = ['draft_pick', 'draft_round', 'success', 'name', 'team', 'college', 
-                       'pos', 'position', 'position_tier', 'ht', 'wt', 'age', 'meets']
-        self.feature_cols = [c for c in df.columns if c not in exclude_cols]
+        # (kept off df so the caller's frame - and its hash - is left untouched)
+        success = (df['draft_round'] <= self.success_threshold).astype(int)
         
-        X = df[self.feature_cols].fillna(df[self.feature_cols].median())
-        y = df['success']
+        y = success
         
-        # Scale features
-        X_scaled = self.scaler.fit_transform(X)
+        if features is not None:
+            self.feature_cols, X_scaled, self.fill_values, self.scaler = features.model_inputs(
+                df, self.EXCLUDE_COLS)
+        else:
+            # Select features
+            self.feature_cols = _feature_columns(df, self.EXCLUDE_COLS)
+            
+            self.fill_values = df[self.feature_cols].median()
+            X = df[self.feature_cols].fillna(self.fill_values)
+            
+            # Scale features
+            X_scaled = self.scaler.fit_transform(X)
         
         # Split data
         X_train, X_test, y_train, y_test = train_test_split(X_scaled, y, test_size=0.2, random_state=42)
         
         # Train Random Forest classifier
-        self.model = RandomForestClassifier(n_estimators=100, max_depth=10, random_state=42)
+        self.model = RandomForestClassifier(n_estimators=100, max_depth=10, random_state=42,
+                                            n_jobs=self.n_jobs)
         self.model.fit(X_train, y_train)
+        # Saved and scored single-threaded
+        self.model.set_params(n_jobs=None)
         
         # Evaluate
         y_pred = self.model.predict(X_test)
@@ -161,6 +488,61 @@ class PlayerSuccessClassifier:
         self.trained = True
         return self
     
+    def partial_update(self, new_df, n_estimators=None):
+        """
+        Grow the forest with trees fitted on a new draft class only (warm start).
+        
+        Trees are added FOREST_UPDATE_STEP at a time and scored by log loss on a
+        validation fraction of new_df; growth stops after N_ITER_NO_CHANGE rounds
+        without improvement and the forest is trimmed back to its best size, so
+        no trees that fail to help are kept.
+        
+        Args:
+            new_df: DataFrame with engineered features (same columns as training)
+            n_estimators: Maximum trees to add (default: a quarter of the current count)
+            
+        Returns:
+            self
+        """
+        if not self.trained:
+            raise ValueError("Model must be trained first")
+        from sklearn.metrics import log_loss
+        from sklearn.model_selection import train_test_split
+        
+        y = (new_df['draft_round'] <= self.success_threshold).astype(int)
+        if y.nunique() < 2:
+            raise ValueError("new_df must contain both successful and unsuccessful players")
+        
+        print(f"\nUpdating Player Success Classifier with {len(new_df)} new players...")
+        X = new_df[self.feature_cols].fillna(self.fill_values if self.fill_values is not None else 0)
+        X_scaled = self.scaler.transform(X)
+        X_fit, X_val, y_fit, y_val = train_test_split(X_scaled, y, test_size=VALIDATION_FRACTION * 2,
+                                                      random_state=42)
+        
+        before = len(self.model.estimators_)
+        budget = n_estimators or max(FOREST_UPDATE_STEP, before // 4)
+        best_loss = log_loss(y_val, self.model.predict_proba(X_val), labels=self.model.classes_)
+        best_size = before
+        rounds_without_gain = 0
+        self.model.set_params(warm_start=True, n_jobs=self.n_jobs)
+        while len(self.model.estimators_) < before + budget and rounds_without_gain < N_ITER_NO_CHANGE:
+            size = min(len(self.model.estimators_) + FOREST_UPDATE_STEP, before + budget)
+            self.model.set_params(n_estimators=size)
+            self.model.fit(X_fit, y_fit)
+            loss = log_loss(y_val, self.model.predict_proba(X_val), labels=self.model.classes_)
+            if loss < best_loss:
+                best_loss, best_size, rounds_without_gain = loss, size, 0
+            else:
+                rounds_without_gain += 1
+        # Drop the trees added after the best validation score
+        self.model.estimators_ = self.model.estimators_[:best_size]
+        self.model.set_params(n_estimators=best_size, warm_start=False, n_jobs=None)
+        
+        self.data_hash = _extend_hash(self.data_hash, new_df)
+        print(f"  Trees: {before} -> {best_size}")
+        print(f"  Validation log loss on new class: {best_loss:.4f}")
+        return self
+    
     def predict_proba(self, player_data):
         """
         Predict success probability for a player
@@ -174,43 +556,255 @@ class PlayerSuccessClassifier:
         if not self.trained:
             raise ValueError("Model must be trained first")
         
-        if isinstance(player_data, pd.Series):
-            player_data = player_data.to_frame().T
-        elif isinstance(player_data, dict):
-            player_data = pd.DataFrame([player_data])
+        return float(self.predict_proba_batch(_to_frame(player_data))[0])
+    
+    def predict_proba_batch(self, df, chunk_size=None):
+        """
+        Predict success probabilities for many players in one vectorized call
         
-        X = player_data[self.feature_cols].fillna(0)
-        X_scaled = self.scaler.transform(X)
-        proba = self.model.predict_proba(X_scaled)[0][1]
+        Args:
+            df: DataFrame of players with engineered features
+            chunk_size: Optional number of rows scored per chunk to bound memory
+            
+        Returns:
+            Array of success probabilities (0-1, one per row of df)
+        """
+        if not self.trained:
+            raise ValueError("Model must be trained first")
         
-        return float(proba)
+        probas = []
+        for chunk in _iter_chunks(df, chunk_size):
+            X = chunk[self.feature_cols].fillna(0)
+            X_scaled = self.scaler.transform(X)
+            probas.append(self.model.predict_proba(X_scaled)[:, 1])
+        
+        if not probas:
+            return np.empty(0, dtype=float)
+        return np.concatenate(probas)
+    
+    def save(self, path):
+        """
+        Persist the trained model, fitted scaler, feature list and threshold
+        
+        Args:
+            path: Destination file (e.g. 'artifacts/success_classifier.joblib')
+            
+        Returns:
+            Path the artifact was written to
+        """
+        if not self.trained:
+            raise ValueError("Model must be trained first")
+        return _save_artifact(self, path, {
+            'model': self.model,
+            'scaler': self.scaler,
+            'feature_cols': self.feature_cols,
+            'success_threshold': self.success_threshold,
+            'fill_values': self.fill_values,
+            'data_hash': self.data_hash,
+        })
+    
+    @classmethod
+    def load(cls, path):
+        """Load a classifier saved with save() without retraining"""
+        artifact = _load_artifact(cls, path)
+        classifier = cls(success_threshold=artifact['success_threshold'])
+        classifier.model = artifact['model']
+        # Artifacts saved before scoring went single-threaded may carry n_jobs=-1
+        classifier.model.set_params(n_jobs=None)
+        classifier.scaler = artifact['scaler']
+        classifier.feature_cols = artifact['feature_cols']
+        classifier.fill_values = artifact.get('fill_values')
+        classifier.data_hash = artifact['data_hash']
+        classifier.trained = True
+        return classifier
 
 
 class PlayerComparison:
     """Find and compare similar players in the draft"""
     
-    def __init__(self, df):
+    # Target and identifier columns never compared on
+    EXCLUDE_COLS = ['draft_pick', 'draft_round', 'name', 'team', 'college',
+                    'pos', 'position', 'position_tier', 'ht', 'wt', 'age', 'meets']
+    
+    def __init__(self, df, index=None, neighbors=None, features=None):
         """
         Args:
             df: DataFrame with engineered features for all players
+            index: Optional PlayerIndex over df['name'] to share with other components
+            neighbors: Optional NEIGHBOR_BACKENDS name ('kd', 'ball', 'lsh', ...) to
+                       build a neighbor index with; None scans all rows per query
+            features: Optional FeatureMatrix built from df to compare players on
+                      (a view of its values) instead of scaling a private copy
         """
-        self.df = df.copy()
+        # Shallow copy: shares df's column buffers (copy-on-write) rather than duplicating them
+        self.df = df.copy(deep=False)
         self.feature_cols = None
-        self._prepare_features()
+        self.scaler = None
+        self.neighbors = None
+        self.neighbor_table = None
+        self.data_hash = hash_training_data(df)
+        self.index = index if index is not None else PlayerIndex(self.df['name'])
+        self._prepare_features(features)
+        if neighbors is not None:
+            self.build_neighbor_index(neighbors)
     
-    def _prepare_features(self):
+    def _prepare_features(self, features=None):
         """Prepare and scale features for comparison"""
-        exclude_cols = ['draft_pick', 'draft_round', 'name', 'team', 'college', 
-                       'pos', 'position', 'position_tier', 'ht', 'wt', 'age', 'meets']
-        self.feature_cols = [c for c in self.df.columns if c not in exclude_cols and 
-                            pd.api.types.is_numeric_dtype(self.df[c])]
+        if features is not None:
+            self.feature_cols, self._matrix, _, self.scaler = features.model_inputs(self.df, self.EXCLUDE_COLS)
+        else:
+            self.feature_cols = _feature_columns(self.df, self.EXCLUDE_COLS)
+            
+            # Scale features for fair comparison, in place in one float32 matrix
+            # so a query is one batched distance computation
+            from sklearn.preprocessing import StandardScaler
+            matrix = self.df[self.feature_cols].to_numpy(dtype=np.float32, na_value=0)
+            self.scaler = StandardScaler(copy=False)
+            self._matrix = np.ascontiguousarray(self.scaler.fit_transform(matrix))
+        self._build_position_masks()
+    
+    @property
+    def df_scaled(self):
+        """df with the feature columns replaced by their scaled values (built on access)"""
+        df_scaled = self.df.copy(deep=False)
+        df_scaled[self.feature_cols] = self._matrix
+        return df_scaled
+    
+    def _build_position_masks(self):
+        """Precompute boolean masks for position-only comparisons"""
+        positions = self.df['pos'].to_numpy()
+        self._position_masks = {pos: positions == pos for pos in pd.unique(positions)}
+    
+    def build_neighbor_index(self, backend='kd', **params):
+        """
+        Build a neighbor index (overall and per position) to answer similarity queries
         
-        # Scale features for fair comparison
-        scaler = StandardScaler()
-        self.df_scaled = self.df.copy()
-        self.df_scaled[self.feature_cols] = scaler.fit_transform(self.df[self.feature_cols].fillna(0))
+        Args:
+            backend: NEIGHBOR_BACKENDS name: 'brute', 'kd' or 'ball' (exact) or 'lsh' (approximate)
+            **params: Backend parameters (e.g. n_tables=12 for 'lsh')
+            
+        Returns:
+            The GroupedNeighborIndex (also kept as self.neighbors)
+        """
+        self.neighbors = GroupedNeighborIndex(backend, **params).build(self._matrix, self.df['pos'].to_numpy())
+        return self.neighbors
     
-    def find_similar_players(self, player_name_or_idx, n_similar=5, position_only=False):
+    def precompute_neighbors(self, k=NEIGHBOR_TABLE_K, chunk_size=1024, path=None):
+        """
+        Precompute every player's k nearest same-position players
+        
+        Position-only lookups for up to k players are then read from the table.
+        
+        Args:
+            k: Neighbors stored per player
+            chunk_size: Players per distance block (bounds memory)
+            path: Optional directory to save the table to; it is then used memory-mapped
+            
+        Returns:
+            The NeighborTable (also kept as self.neighbor_table)
+        """
+        table = NeighborTable.compute(self._matrix, self.df['pos'].to_numpy(), k=k,
+                                      chunk_size=chunk_size, data_hash=self.data_hash)
+        if path is not None:
+            table = NeighborTable.load(table.save(path))
+        self.neighbor_table = table
+        return table
+    
+    def load_neighbor_table(self, path):
+        """
+        Use a table saved by precompute_neighbors(path=...) if it matches this data
+        
+        Returns:
+            True if the table was loaded
+        """
+        try:
+            table = NeighborTable.load(path)
+        except (OSError, ValueError, KeyError):
+            return False
+        if table.data_hash != self.data_hash or len(table) != len(self._matrix):
+            return False
+        self.neighbor_table = table
+        return True
+    
+    def save(self, path):
+        """
+        Persist the player table, fitted scaler and scaled feature matrix
+        
+        Args:
+            path: Destination file (e.g. 'artifacts/player_comparison.joblib')
+            
+        Returns:
+            Path the artifact was written to
+        """
+        return _save_artifact(self, path, {
+            'df': self.df,
+            'scaler': self.scaler,
+            'feature_cols': self.feature_cols,
+            'matrix': self._matrix,
+            'neighbors': self.neighbors,
+            'data_hash': self.data_hash,
+        })
+    
+    @classmethod
+    def load(cls, path):
+        """Load a comparator saved with save() without rescaling the data"""
+        artifact = _load_artifact(cls, path)
+        comparator = cls.__new__(cls)
+        comparator.df = artifact['df']
+        comparator.scaler = artifact['scaler']
+        comparator.feature_cols = artifact['feature_cols']
+        comparator.data_hash = artifact['data_hash']
+        comparator._matrix = artifact['matrix']
+        comparator.neighbors = artifact.get('neighbors')
+        comparator.neighbor_table = None
+        comparator.index = PlayerIndex(comparator.df['name'])
+        comparator._build_position_masks()
+        return comparator
+    
+    def _nearest(self, row_pos, n_similar, mask=None, position=None):
+        """
+        Top-k nearest rows to the row at positional index row_pos
+        
+        Args:
+            row_pos: Positional (0-based) index of the query row
+            n_similar: Number of neighbors to return
+            mask: Optional boolean array restricting the candidate rows
+            position: With a neighbor table or index, search only this position's
+                      rows (used instead of mask)
+            
+        Returns:
+            Tuple of (positional indices, distances) sorted by distance
+        """
+        if self.neighbor_table is not None and position is not None and n_similar <= self.neighbor_table.k:
+            return self.neighbor_table.lookup(row_pos, n_similar)
+        
+        if self.neighbors is not None and (mask is None or position is not None):
+            # One extra neighbor because the query row is its own nearest match
+            rows, dists = self.neighbors.query(self._matrix[row_pos], n_similar + 1, group=position)
+            keep = rows != row_pos
+            return rows[keep][:n_similar], dists[keep][:n_similar]
+        
+        if mask is None:
+            candidates = np.arange(len(self._matrix))
+        else:
+            candidates = np.flatnonzero(mask)
+        candidates = candidates[candidates != row_pos]
+        if n_similar <= 0 or len(candidates) == 0:
+            return candidates[:0], np.empty(0, dtype=np.float32)
+        
+        diffs = self._matrix[candidates] - self._matrix[row_pos]
+        dists = np.sqrt(np.einsum('ij,ij->i', diffs, diffs))
+        
+        # Partial selection of the k smallest, then sort just those k
+        k = min(n_similar, len(dists))
+        if k < len(dists):
+            top = np.argpartition(dists, k - 1)[:k]
+        else:
+            top = np.arange(len(dists))
+        top = top[np.argsort(dists[top], kind='stable')]
+        return candidates[top], dists[top]
+    
+    def find_similar_players(self, player_name_or_idx, n_similar=5, position_only=False, verbose=True):
         """
         Find players most similar to a given player
         
@@ -218,47 +812,39 @@ class PlayerComparison:
             player_name_or_idx: Player name (str) or index (int)
             n_similar: Number of similar players to return
             position_only: If True, only compare within same position
+            verbose: Print the comparison table
             
         Returns:
             DataFrame of similar players with similarity scores
         """
         # Find player index
         if isinstance(player_name_or_idx, str):
-            matches = self.df[self.df['name'].str.contains(player_name_or_idx, case=False, na=False)]
-            if matches.empty:
+            player_idx = self.index.find(player_name_or_idx)
+            if player_idx is None:
                 return pd.DataFrame()
-            player_idx = matches.index[0]
-            player_name = matches['name'].iloc[0]
+            player_name = self.df.loc[player_idx, 'name']
         else:
             player_idx = player_name_or_idx
             player_name = self.df.loc[player_idx, 'name']
         
-        player_data = self.df_scaled.loc[player_idx, self.feature_cols].values
         player_position = self.df.loc[player_idx, 'pos']
+        row_pos = self.df.index.get_loc(player_idx)
         
-        # Calculate distances to all other players
-        distances = []
-        for idx in self.df.index:
-            if idx == player_idx:
-                continue
-            
-            # Filter by position if requested
-            if position_only and self.df.loc[idx, 'pos'] != player_position:
-                continue
-            
-            other_data = self.df_scaled.loc[idx, self.feature_cols].values
-            dist = euclidean(player_data, other_data)
-            distances.append((idx, dist))
-        
-        # Sort by distance and get top N
-        distances.sort(key=lambda x: x[1])
-        similar_indices = [d[0] for d in distances[:n_similar]]
-        similar_distances = [d[1] for d in distances[:n_similar]]
+        # Calculate distances to all other players (optionally same position only)
+        mask = None
+        if position_only:
+            mask = self._position_masks.get(player_position, np.zeros(len(self._matrix), dtype=bool))
+        nearest, nearest_dists = self._nearest(row_pos, n_similar, mask,
+                                               position=player_position if position_only else None)
+        similar_indices = self.df.index[nearest]
+        similar_distances = nearest_dists.astype(np.float64)
         
         # Build result DataFrame
         result = self.df.loc[similar_indices].copy()
         result['similarity_score'] = 1 / (1 + np.array(similar_distances))  # Convert distance to similarity
         result = result.sort_values('similarity_score', ascending=False)
+        if not verbose:
+            return result
         
         print(f"\nPlayers similar to {player_name} ({player_position}):")
         print(f"{'Rank':<5} {'Name':<20} {'Pos':<5} {'Pick':<5} {'College':<20} {'Similarity':<10}")
@@ -280,9 +866,9 @@ class PlayerComparison:
         """
         players = []
         for name in player_names:
-            match = self.df[self.df['name'].str.contains(name, case=False, na=False)]
-            if not match.empty:
-                players.append(match.iloc[0])
+            player_idx = self.index.find(name)
+            if player_idx is not None:
+                players.append(self.df.loc[player_idx])
         
         if not players:
             return pd.DataFrame()
@@ -300,19 +886,211 @@ class PlayerComparison:
         return result
 
 
-def demonstrate_models(df):
-    """Demonstrate all models on sample data"""
+def _load_if_current(cls, path, data_hash):
+    """Load an artifact if it exists and was built from data matching data_hash"""
+    path = Path(path)
+    if not path.exists():
+        return None
+    try:
+        model = cls.load(path)
+    except Exception as e:
+        print(f"Warning: Ignoring unreadable artifact {path}: {e}")
+        return None
+    return model if model.data_hash == data_hash else None
+
+
+def _pipeline_frame(df, pipeline):
+    """
+    df without the numeric columns pipeline does not output (e.g. extra columns
+    of a pre-engineered CSV), so the models only fit features that scoring can
+    rebuild from raw prospect rows
+    """
+    produced = set(pipeline.feature_columns)
+    extra = [col for col in df.columns if col not in produced and pd.api.types.is_numeric_dtype(df[col])]
+    return df.drop(columns=extra) if extra else df
+
+
+def _save_pipeline(pipeline, path, data_hash):
+    """Save pipeline to path tagged with data_hash, unless a fit on the same data is already saved there"""
+    if path.exists():
+        try:
+            if FeaturePipeline.load(path).data_hash == data_hash:
+                return
+        except Exception as e:
+            print(f"Warning: Replacing unreadable artifact {path}: {e}")
+    pipeline.data_hash = data_hash
+    pipeline.save(path)
+
+
+def _model_specs(artifact_dir, success_threshold, engine=DEFAULT_PREDICTOR_ENGINE):
+    """
+    (kind, class, artifact path, status message, progress start %) for each model,
+    in training order; each model's progress share runs up to the next one's start
+    """
+    suffix = '' if engine == DEFAULT_PREDICTOR_ENGINE else f'_{engine}'
+    return [
+        ('predictor', DraftPositionPredictor, artifact_dir / f'draft_predictor{suffix}.joblib',
+         "Loading Draft Position Predictor...", 0),
+        ('classifier', PlayerSuccessClassifier, artifact_dir / f'success_classifier_r{success_threshold}.joblib',
+         "Loading Player Success Classifier...", 50),
+        ('comparator', PlayerComparison, artifact_dir / 'player_comparison.joblib',
+         "Building player comparator...", 85),
+    ]
+
+
+def _training_context():
+    """
+    Process start method for parallel training. Never plain fork: callers such
+    as the UI have live threads. forkserver (POSIX) imports this module once and
+    forks workers from that clean process; elsewhere workers are spawned.
+    """
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        ctx = multiprocessing.get_context('forkserver')
+        ctx.set_forkserver_preload([__name__])
+        return ctx
+    return multiprocessing.get_context('spawn')
+
+
+def _train_model(kind, df, success_threshold, engine=DEFAULT_PREDICTOR_ENGINE, features=None, n_jobs=None):
+    """
+    Train one model (runs in a worker process when training in parallel, where
+    n_jobs stays None so the workers don't oversubscribe the cores)
+    """
+    if kind == 'predictor':
+        return DraftPositionPredictor(engine=engine).train(df, features)
+    if kind == 'classifier':
+        return PlayerSuccessClassifier(success_threshold=success_threshold, n_jobs=n_jobs).train(df, features)
+    return PlayerComparison(df, features=features)
+
+
+# Seconds between cancellation checks while waiting on training workers
+CANCEL_POLL_INTERVAL = 0.2
+
+
+def load_or_train_models(df, artifact_dir=DEFAULT_ARTIFACT_DIR, success_threshold=5, progress=None,
+                         parallel=None, engine=DEFAULT_PREDICTOR_ENGINE, cancel_check=None, neighbor_table=False):
+    """
+    Load persisted models trained on df, training and saving any that are missing or stale,
+    along with the FeaturePipeline fit on df that scoring transforms raw prospects with
+    
+    Args:
+        df: DataFrame with engineered features. Numeric columns the FeaturePipeline
+            does not output are left out of every model (and the comparator's table)
+        artifact_dir: Directory holding the model artifacts
+        success_threshold: Round threshold for PlayerSuccessClassifier
+        progress: Optional callback(status_message, percent) for UI progress
+        parallel: Train stale models concurrently in a process pool. None (default)
+                  does so on multi-core machines for tables of at least
+                  PARALLEL_TRAINING_MIN_ROWS rows, when more than one model is stale
+        engine: PREDICTOR_ENGINES backend for the draft position predictor
+        cancel_check: Optional callable that raises to abandon training (e.g.
+                      TaskContext.check). It is called between models and
+                      before each artifact is written, so an abandoned run
+                      never saves a model.
+        neighbor_table: Also load (or precompute and save under artifact_dir)
+                        the comparator's top-K same-position neighbor table, for
+                        callers that serve many position-only comp lookups
+        
+    Returns:
+        Tuple of (DraftPositionPredictor, PlayerSuccessClassifier, PlayerComparison)
+    """
+    if progress is None:
+        progress = lambda status, percent: None
+    if cancel_check is None:
+        cancel_check = lambda: None
+    artifact_dir = Path(artifact_dir)
+    # Fit (cheap) before hashing: the models only see the columns it outputs
+    pipeline = FeaturePipeline().fit(df[[col for col in INPUT_COLUMNS if col in df.columns]])
+    df = _pipeline_frame(df, pipeline)
+    data_hash = hash_training_data(df)
+    specs = _model_specs(artifact_dir, success_threshold, engine)
+    starts = [spec[4] for spec in specs] + [95]
+    shares = {spec[0]: starts[i + 1] - starts[i] for i, spec in enumerate(specs)}
+    
+    if parallel is None:
+        parallel = (os.cpu_count() or 1) > 1 and len(df) >= PARALLEL_TRAINING_MIN_ROWS
+    
+    models = {}
+    if parallel:
+        # Reuse what is current, then train the rest side by side
+        stale = []
+        for kind, cls, path, _, _ in specs:
+            models[kind] = _load_if_current(cls, path, data_hash)
+            if models[kind] is None:
+                stale.append((kind, path))
+        parallel = len(stale) > 1
+    
+    if parallel:
+        done = sum(shares[kind] for kind in models if models[kind] is not None)
+        progress(f"Training {len(stale)} models in parallel...", done)
+        paths = dict(stale)
+        # Workers train on the same float32 matrix as the sequential path, so an
+        # artifact does not depend on which path (i.e. which machine) built it
+        features = FeatureMatrix(df)
+        pool = ProcessPoolExecutor(max_workers=len(stale), mp_context=_training_context())
+        cancelled = False
+        try:
+            futures = {pool.submit(_train_model, kind, df, success_threshold, engine, features): kind
+                       for kind, _ in stale}
+            while futures:
+                finished, _ = wait(futures, timeout=CANCEL_POLL_INTERVAL, return_when=FIRST_COMPLETED)
+                try:
+                    cancel_check()
+                except BaseException:
+                    cancelled = True
+                    raise
+                for future in finished:
+                    kind = futures.pop(future)
+                    # Workers only train; artifacts are written here, after the cancel check
+                    models[kind] = future.result()
+                    models[kind].save(paths[kind])
+                    done += shares[kind]
+                    progress(f"Trained {type(models[kind]).__name__}", done)
+        finally:
+            # An abandoned run does not wait for workers still training
+            pool.shutdown(wait=not cancelled, cancel_futures=cancelled)
+    else:
+        # Models trained here share one float32 feature matrix, built on first need
+        features = None
+        for kind, cls, path, status, percent in specs:
+            cancel_check()
+            progress(status, percent)
+            if kind not in models:
+                models[kind] = _load_if_current(cls, path, data_hash)
+            if models[kind] is None:
+                if features is None:
+                    features = FeatureMatrix(df)
+                # Alone on the machine here, so the forest may use every core
+                models[kind] = _train_model(kind, df, success_threshold, engine, features, n_jobs=-1)
+                cancel_check()
+                models[kind].save(path)
+    cancel_check()
+    # Scoring raw prospects needs the feature statistics of this same table
+    _save_pipeline(pipeline, artifact_dir / PIPELINE_FILE, data_hash)
+    if neighbor_table:
+        cancel_check()
+        # Same-position comps are served from a memory-mapped top-K table
+        neighbors_path = artifact_dir / NEIGHBOR_TABLE_DIR
+        if not models['comparator'].load_neighbor_table(neighbors_path):
+            models['comparator'].precompute_neighbors(path=neighbors_path)
+    progress("Models ready", 95)
+    
+    return models['predictor'], models['classifier'], models['comparator']
+
+
+def demonstrate_models(df, artifact_dir=DEFAULT_ARTIFACT_DIR):
+    """
+    Demonstrate all models on sample data
+    
+    Returns:
+        Tuple of (predictor, classifier, comparator) so callers can reuse them
+    """
     print("\n" + "="*80)
     print("SCOUTSENSE: NFL DRAFT PREDICTION & COMPARISON DEMO")
     print("="*80)
     
-    # Train Draft Position Predictor
-    predictor = DraftPositionPredictor()
-    predictor.train(df)
-    
-    # Train Success Classifier
-    classifier = PlayerSuccessClassifier(success_threshold=5)
-    classifier.train(df)
+    # Load (or train) Draft Position Predictor, Success Classifier and Comparator
+    predictor, classifier, comparator = load_or_train_models(df, artifact_dir, neighbor_table=True)
     
     # Feature importance
     print("\n[FEATURE IMPORTANCE] Top factors for draft position:")
@@ -320,9 +1098,6 @@ def demonstrate_models(df):
     for i, (feat, imp) in enumerate(importances.items(), 1):
         print(f"  {i}. {feat}: {imp:.4f}")
     
-    # Player Comparison
-    comparator = PlayerComparison(df)
-    
     # Demo: Find similar QBs to Matthew Stafford
     print("\n[PLAYER SIMILARITY] Finding QBs similar to Matthew Stafford...")
     stafford_similar = comparator.find_similar_players("Matthew Stafford", n_similar=5, position_only=True)
@@ -330,10 +1105,12 @@ def demonstrate_models(df):
     # Demo: Predict on sample player
     print("\n[DRAFT PREDICTION] Predicting draft position for sample QBs...")
     qbs = df[df['pos'] == 'QB'].head(3)
-    for _, qb in qbs.iterrows():
-        pred_pick = predictor.predict(qb)
-        success_prob = classifier.predict_proba(qb)
+    pred_picks = predictor.predict_batch(qbs)
+    success_probs = classifier.predict_proba_batch(qbs)
+    for (_, qb), pred_pick, success_prob in zip(qbs.iterrows(), pred_picks, success_probs):
         print(f"  {qb['name']:<20} Actual: Pick {int(qb['draft_pick']):3}, "
               f"Predicted: Pick {pred_pick:3}, Success Prob: {success_prob:.1%}")
     
     print("\n" + "="*80)
+    
+    return predictor, classifier, comparator
@@ -0,0 +1,347 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Nearest-Neighbor Indexes
+Exact (brute force, KD-tree, Ball-tree) and approximate (random-projection LSH)
+Euclidean k-NN backends for player similarity, with build()/save()/load(),
+and a precomputed, memory-mapped top-K neighbor table
+"""
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+def _top_k(candidates, matrix, vector, k):
+    """Exact k nearest of the candidate rows to vector, sorted by distance"""
+    if len(candidates) == 0 or k <= 0:
+        return candidates[:0], np.empty(0, dtype=np.float32)
+    diffs = matrix[candidates] - vector
+    dists = np.sqrt(np.einsum('ij,ij->i', diffs, diffs))
+    k = min(k, len(dists))
+    top = np.argpartition(dists, k - 1)[:k] if k < len(dists) else np.arange(len(dists))
+    top = top[np.argsort(dists[top], kind='stable')]
+    return candidates[top], dists[top]
+
+
+class BruteForceIndex:
+    """Exact search by scanning every row (vectorized); O(n·d) per query"""
+
+    name = 'brute'
+
+    def build(self, matrix):
+        self._matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+        return self
+
+    def __len__(self):
+        return len(self._matrix)
+
+    def query(self, vector, k):
+        """
+        Returns:
+            Tuple of (row positions, distances) of the k nearest rows, closest first
+        """
+        return _top_k(np.arange(len(self._matrix)), self._matrix, np.asarray(vector, dtype=np.float32), k)
+
+
+class TreeIndex:
+    """Exact search with a scikit-learn KD-tree or Ball-tree; sub-linear at low dimension"""
+
+    def __init__(self, kind='kd', leaf_size=40):
+        """
+        Args:
+            kind: 'kd' (axis-aligned splits) or 'ball' (hypersphere splits, better at higher d)
+            leaf_size: Rows per leaf before the tree falls back to scanning
+        """
+        if kind not in ('kd', 'ball'):
+            raise ValueError(f"Unknown tree kind '{kind}' (choose 'kd' or 'ball')")
+        self.name = kind
+        self.kind = kind
+        self.leaf_size = leaf_size
+        self._tree = None
+
+    def build(self, matrix):
+        from sklearn.neighbors import BallTree, KDTree
+        tree_cls = KDTree if self.kind == 'kd' else BallTree
+        self._tree = tree_cls(np.asarray(matrix, dtype=np.float64), leaf_size=self.leaf_size)
+        self._n_rows = len(matrix)
+        return self
+
+    def __len__(self):
+        return self._n_rows
+
+    def query(self, vector, k):
+        k = min(k, self._n_rows)
+        if k <= 0:
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.float32)
+        dists, rows = self._tree.query(np.asarray(vector, dtype=np.float64).reshape(1, -1), k=k)
+        return rows[0], dists[0].astype(np.float32)
+
+
+class LSHIndex:
+    """
+    Approximate search with random-projection (p-stable) LSH for Euclidean distance.
+
+    Each of n_tables hashes a row to floor((row·a + b) / bucket_width) over
+    n_projections random Gaussian directions; rows sharing a bucket with the
+    query in any table are candidates, which are then ranked exactly. More
+    tables raise recall, more projections per table shrink buckets (faster,
+    lower recall). Queries with fewer than k candidates fall back to a scan,
+    so a query always returns k rows.
+    """
+
+    name = 'lsh'
+
+    def __init__(self, n_tables=16, n_projections=6, bucket_width=None, random_state=42):
+        """
+        Args:
+            n_tables: Independent hash tables
+            n_projections: Random projections concatenated into each table's key
+            bucket_width: Projection bucket width; None estimates it from the
+                          data's nearest-neighbor distances at build time
+            random_state: Seed for the projections
+        """
+        self.n_tables = n_tables
+        self.n_projections = n_projections
+        self.bucket_width = bucket_width
+        self.random_state = random_state
+
+    def _keys(self, matrix):
+        """(n_tables, n_rows) int64 bucket keys"""
+        codes = np.floor((np.einsum('nd,tdp->tnp', matrix, self._projections) + self._offsets[:, None, :])
+                         / self.bucket_width_).astype(np.int64)
+        # Fold each row's codes into one key (wrapping int64 arithmetic is fine for hashing)
+        return codes @ self._mixers
+
+    def _estimate_bucket_width(self, matrix, rng, sample=200):
+        """A few times the typical nearest-neighbor distance, from a sample of rows"""
+        rows = rng.choice(len(matrix), min(sample, len(matrix)), replace=False)
+        nearest = []
+        for row in rows:
+            _, dists = _top_k(np.arange(len(matrix)), matrix, matrix[row], 2)
+            if len(dists) > 1:
+                nearest.append(dists[1])
+        return 4.0 * float(np.median(nearest)) if nearest and np.median(nearest) > 0 else 1.0
+
+    def build(self, matrix):
+        self._matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+        rng = np.random.RandomState(self.random_state)
+        n_features = self._matrix.shape[1]
+        self._projections = rng.normal(size=(self.n_tables, n_features, self.n_projections)).astype(np.float32)
+        self.bucket_width_ = self.bucket_width or self._estimate_bucket_width(self._matrix, rng)
+        self._offsets = rng.uniform(0, self.bucket_width_, size=(self.n_tables, self.n_projections)).astype(np.float32)
+        self._mixers = rng.randint(1, 2 ** 62, size=self.n_projections, dtype=np.int64)
+
+        keys = self._keys(self._matrix)
+        self._order = np.argsort(keys, axis=1, kind='stable')
+        self._sorted_keys = np.take_along_axis(keys, self._order, axis=1)
+        return self
+
+    def __len__(self):
+        return len(self._matrix)
+
+    def candidates(self, vector):
+        """Row positions sharing a bucket with vector in at least one table"""
+        keys = self._keys(np.asarray(vector, dtype=np.float32).reshape(1, -1))[:, 0]
+        found = []
+        for table, key in enumerate(keys):
+            lo = np.searchsorted(self._sorted_keys[table], key, side='left')
+            hi = np.searchsorted(self._sorted_keys[table], key, side='right')
+            found.append(self._order[table, lo:hi])
+        return np.unique(np.concatenate(found)) if found else np.empty(0, dtype=np.intp)
+
+    def query(self, vector, k):
+        vector = np.asarray(vector, dtype=np.float32)
+        candidates = self.candidates(vector)
+        if len(candidates) < min(k, len(self._matrix)):
+            candidates = np.arange(len(self._matrix))
+        return _top_k(candidates, self._matrix, vector, k)
+
+
+# Backend name -> factory taking the backend's keyword parameters
+NEIGHBOR_BACKENDS = {
+    'brute': lambda **params: BruteForceIndex(**params),
+    'kd': lambda **params: TreeIndex('kd', **params),
+    'ball': lambda **params: TreeIndex('ball', **params),
+    'lsh': lambda **params: LSHIndex(**params),
+}
+
+
+class GroupedNeighborIndex:
+    """
+    One neighbor index over all rows plus one per group (e.g. position), so
+    "similar players at the same position" queries search only that group.
+    Results are row positions in the full matrix.
+    """
+
+    def __init__(self, backend='kd', **params):
+        """
+        Args:
+            backend: Key of NEIGHBOR_BACKENDS
+            **params: Passed to the backend (e.g. n_tables=12 for 'lsh')
+        """
+        if backend not in NEIGHBOR_BACKENDS:
+            raise ValueError(f"Unknown neighbor backend '{backend}' (choose from {', '.join(NEIGHBOR_BACKENDS)})")
+        self.backend = backend
+        self.params = params
+        self._all = None
+        self._groups = {}
+
+    def build(self, matrix, groups=None):
+        """
+        Args:
+            matrix: (n_rows, n_features) scaled feature matrix
+            groups: Optional length-n_rows array of group labels
+        """
+        self._all = NEIGHBOR_BACKENDS[self.backend](**self.params).build(matrix)
+        self._groups = {}
+        if groups is not None:
+            groups = np.asarray(groups)
+            for group in np.unique(groups[~pd.isna(groups)]):
+                rows = np.flatnonzero(groups == group)
+                self._groups[group] = (rows, NEIGHBOR_BACKENDS[self.backend](**self.params).build(matrix[rows]))
+        return self
+
+    def query(self, vector, k, group=None):
+        """
+        k nearest rows to vector, optionally only within group
+
+        Returns:
+            Tuple of (row positions, distances), closest first (empty for an unknown group)
+        """
+        if group is None:
+            return self._all.query(vector, k)
+        if group not in self._groups:
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.float32)
+        rows, index = self._groups[group]
+        local, dists = index.query(vector, k)
+        return rows[local], dists
+
+    def save(self, path):
+        """Persist the built index (all groups) to path"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        import joblib
+        joblib.dump(self, path)
+        return path
+
+    @classmethod
+    def load(cls, path):
+        """Load an index saved with save()"""
+        import joblib
+        index = joblib.load(Path(path))
+        if not isinstance(index, cls):
+            raise ValueError(f"{path} does not hold a {cls.__name__}")
+        return index
+
+
+
+class NeighborTable:
+    """
+    Precomputed top-K same-group neighbors of every row.
+
+    Computed group by group (a player is only compared with players at the
+    same position), a chunk of query rows at a time so memory stays at
+    chunk_size x group size distances. Saved as plain .npy files that load
+    memory-mapped, so a lookup reads K entries from disk instead of scanning.
+    Rows with fewer than K group-mates are padded with -1 / inf.
+    """
+
+    ROWS_FILE = 'neighbor_rows.npy'
+    DISTS_FILE = 'neighbor_dists.npy'
+    META_FILE = 'meta.json'
+
+    def __init__(self, rows, dists, data_hash=None):
+        """
+        Args:
+            rows: (n_rows, K) int32 neighbor row positions, closest first
+            dists: (n_rows, K) float32 distances
+            data_hash: Fingerprint of the data the table was computed from
+        """
+        self.rows = rows
+        self.dists = dists
+        self.data_hash = data_hash
+
+    @property
+    def k(self):
+        return self.rows.shape[1]
+
+    def __len__(self):
+        return len(self.rows)
+
+    @classmethod
+    def compute(cls, matrix, groups, k=20, chunk_size=1024, data_hash=None):
+        """
+        Args:
+            matrix: (n_rows, n_features) scaled feature matrix
+            groups: Length-n_rows group labels (e.g. positions)
+            k: Neighbors kept per row
+            chunk_size: Query rows per distance block
+            data_hash: Stored with the table to detect staleness
+        """
+        matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+        groups = np.asarray(groups)
+        rows = np.full((len(matrix), k), -1, dtype=np.int32)
+        dists = np.full((len(matrix), k), np.inf, dtype=np.float32)
+
+        valid = ~pd.isna(groups)
+        for group in np.unique(groups[valid]):
+            members = np.flatnonzero(groups == group)
+            n_keep = min(k, len(members) - 1)
+            if n_keep <= 0:
+                continue
+            block = matrix[members]
+            # Cast once per group, not per chunk: the products below run in float64
+            block64 = block.astype(np.float64)
+            sq_norms = np.einsum('ij,ij->i', block, block).astype(np.float64)
+            for start in range(0, len(members), chunk_size):
+                queries = block[start:start + chunk_size]
+                # Squared distances via one matrix product per chunk; the query
+                # row itself is excluded by pushing its distance to infinity
+                d2 = sq_norms[start:start + len(queries), None] + sq_norms[None, :] \
+                    - 2.0 * (block64[start:start + len(queries)] @ block64.T)
+                d2[np.arange(len(queries)), np.arange(start, start + len(queries))] = np.inf
+                top = np.argpartition(d2, n_keep - 1, axis=1)[:, :n_keep]
+                for i, local in enumerate(top):
+                    # Exact re-rank of the shortlist, matching the brute-force scan
+                    diffs = block[local] - queries[i]
+                    local_dists = np.sqrt(np.einsum('ij,ij->i', diffs, diffs))
+                    order = np.argsort(local_dists, kind='stable')
+                    rows[members[start + i], :n_keep] = members[local[order]]
+                    dists[members[start + i], :n_keep] = local_dists[order]
+        return cls(rows, dists, data_hash)
+
+    def lookup(self, row, k):
+        """
+        Up to k precomputed neighbors of row
+
+        Returns:
+            Tuple of (row positions, distances), closest first
+        """
+        neighbors = np.asarray(self.rows[row, :k])
+        keep = neighbors >= 0
+        return neighbors[keep].astype(np.intp), np.asarray(self.dists[row, :k])[keep]
+
+    def save(self, directory):
+        """Write the table as .npy files (plus metadata) into directory"""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        np.save(directory / self.ROWS_FILE, np.ascontiguousarray(self.rows))
+        np.save(directory / self.DISTS_FILE, np.ascontiguousarray(self.dists))
+        meta = {'k': int(self.k), 'n_rows': int(len(self)), 'data_hash': self.data_hash}
+        (directory / self.META_FILE).write_text(json.dumps(meta), encoding='utf-8')
+        return directory
+
+    @classmethod
+    def load(cls, directory, mmap=True):
+        """Load a table saved with save(), memory-mapped (read-only) unless mmap=False"""
+        directory = Path(directory)
+        meta = json.loads((directory / cls.META_FILE).read_text(encoding='utf-8'))
+        mode = 'r' if mmap else None
+        rows = np.load(directory / cls.ROWS_FILE, mmap_mode=mode)
+        dists = np.load(directory / cls.DISTS_FILE, mmap_mode=mode)
+        if rows.shape != dists.shape or len(rows) != meta['n_rows']:
+            raise ValueError(f"Inconsistent neighbor table in {directory}")
+        return cls(rows, dists, meta.get('data_hash'))
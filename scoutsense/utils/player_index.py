@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Player Name Index
+Exact, prefix and fuzzy player-name lookup built once at load time
+"""
+
+import re
+import unicodedata
+from bisect import bisect_left
+from collections import Counter, defaultdict
+
+import pandas as pd
+
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9 ]+")
+_SPACE_RE = re.compile(r"\s+")
+
+
+def normalize_name(name):
+    """
+    Canonical form of a player name for lookups: accents stripped, lower-case,
+    punctuation removed, whitespace collapsed ("D'Andre  Swift" -> "dandre swift")
+    """
+    if not isinstance(name, str):
+        return ''
+    name = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode('ascii')
+    name = _NON_ALNUM_RE.sub('', name.lower())
+    return _SPACE_RE.sub(' ', name).strip()
+
+
+def _trigrams(text):
+    """Set of character trigrams of a normalized name (padded so short names still match)"""
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class PlayerIndex:
+    """
+    Name index over a player table, shared by the models and the UI.
+
+    - exact: hash of normalized name -> rows, O(1)
+    - prefix: sorted normalized full names and name tokens, O(log n + k) via bisect,
+      so "matthew sta" and "stafford" both find "Matthew Stafford"
+    - fuzzy: trigram postings ranked by Jaccard similarity, for typos
+
+    Results are DataFrame index labels; ties within a tier keep table order,
+    matching the first-row behaviour of the old str.contains scans.
+    """
+
+    def __init__(self, names):
+        """
+        Args:
+            names: Series of player names (its index labels are what lookups return)
+        """
+        names = pd.Series(names)
+        self._names = names
+        self.labels = names.index
+        self._normalized = [normalize_name(name) for name in names]
+
+        self._exact = defaultdict(list)
+        tokens = []
+        for pos, key in enumerate(self._normalized):
+            if not key:
+                continue
+            self._exact[key].append(pos)
+            tokens.extend((token, pos) for token in key.split(' '))
+
+        self._full_sorted = sorted((key, pos) for pos, key in enumerate(self._normalized) if key)
+        self._full_keys = [key for key, _ in self._full_sorted]
+        self._token_sorted = sorted(tokens)
+        self._token_keys = [token for token, _ in self._token_sorted]
+
+        self._postings = defaultdict(list)
+        self._gram_counts = []
+        for pos, key in enumerate(self._normalized):
+            grams = _trigrams(key) if key else set()
+            self._gram_counts.append(len(grams))
+            for gram in grams:
+                self._postings[gram].append(pos)
+
+    def __len__(self):
+        return len(self._normalized)
+
+    def exact(self, name):
+        """Index labels of players whose normalized name equals name"""
+        return [self.labels[pos] for pos in self._exact.get(normalize_name(name), [])]
+
+    def _prefix_positions(self, keys, pairs, prefix):
+        """Row positions of sorted (key, pos) pairs whose key starts with prefix"""
+        start = bisect_left(keys, prefix)
+        found = []
+        for key, pos in pairs[start:]:
+            if not key.startswith(prefix):
+                break
+            found.append(pos)
+        return found
+
+    def prefix(self, text, limit=None):
+        """
+        Index labels of players whose full name or any name token starts with text
+        (full-name matches first, each group in table order)
+        """
+        query = normalize_name(text)
+        if not query:
+            return []
+        full = sorted(set(self._prefix_positions(self._full_keys, self._full_sorted, query)))
+        tokens = sorted(set(self._prefix_positions(self._token_keys, self._token_sorted, query)) - set(full))
+        positions = full + tokens
+        if limit is not None:
+            positions = positions[:limit]
+        return [self.labels[pos] for pos in positions]
+
+    def fuzzy(self, text, limit=10, min_score=0.3):
+        """
+        Index labels of the names most similar to text by trigram Jaccard score
+
+        Returns:
+            List of (label, score) pairs, best first
+        """
+        query = normalize_name(text)
+        if not query:
+            return []
+        grams = _trigrams(query)
+        shared = Counter()
+        for gram in grams:
+            shared.update(self._postings.get(gram, ()))
+        scored = []
+        for pos, n_shared in shared.items():
+            score = n_shared / (len(grams) + self._gram_counts[pos] - n_shared)
+            if score >= min_score:
+                scored.append((-score, pos))
+        scored.sort()
+        return [(self.labels[pos], -neg_score) for neg_score, pos in scored[:limit]]
+
+    def search(self, text, limit=10):
+        """
+        Ranked lookup for a typed query: exact matches, then prefix matches,
+        then fuzzy matches, without duplicates
+        """
+        results = []
+        seen = set()
+        candidates = self.exact(text) + self.prefix(text, limit=limit)
+        if len(candidates) < limit:
+            candidates += [label for label, _ in self.fuzzy(text, limit=limit)]
+        for label in candidates:
+            if label not in seen:
+                seen.add(label)
+                results.append(label)
+                if len(results) >= limit:
+                    break
+        return results
+
+    def find(self, text):
+        """
+        The player text names (index label): the first exact match, else the only
+        player whose full name or a name token starts with text. None if nothing
+        matches or the prefix is ambiguous; fuzzy matches are only ever offered as
+        search() suggestions, never picked
+        """
+        exact = self.exact(text)
+        if exact:
+            return exact[0]
+        matches = self.prefix(text, limit=2)
+        return matches[0] if len(matches) == 1 else None
+
+    def names(self, labels):
+        """Original display names for a list of index labels"""
+        return self._names.loc[list(labels)].tolist()
@@ -0,0 +1,221 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Batch Scoring
+Streams a prospect file (CSV or Parquet) in chunks through the persisted
+FeaturePipeline, DraftPositionPredictor and PlayerSuccessClassifier and
+writes the predictions out chunk by chunk, timing every stage
+"""
+
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .data_loader import iter_draft_chunks
+from .feature_engineering import FeaturePipeline
+from .models import (DEFAULT_ARTIFACT_DIR, DEFAULT_PREDICTOR_ENGINE, NEIGHBOR_TABLE_DIR, PIPELINE_FILE,
+                     DraftPositionPredictor, PlayerComparison, PlayerSuccessClassifier, _model_specs)
+
+# Input columns copied to the output so each prediction can be traced to its prospect
+OUTPUT_ID_COLS = ['name', 'team', 'pos', 'college']
+
+# Scoring stages, in pipeline order
+SCORING_STAGES = ('read', 'features', 'predictor', 'classifier', 'write')
+
+
+def load_feature_pipeline(artifact_dir=DEFAULT_ARTIFACT_DIR, models=()):
+    """
+    Load the FeaturePipeline saved by load_or_train_models, checking it was fit
+    on the same training data as models
+
+    Args:
+        artifact_dir: Directory holding the model artifacts
+        models: Loaded models whose data_hash the pipeline must match
+
+    Returns:
+        Fitted FeaturePipeline
+
+    Raises:
+        FileNotFoundError: If no pipeline is saved in artifact_dir
+        ValueError: If the pipeline was fit on different data than any of models
+    """
+    path = Path(artifact_dir) / PIPELINE_FILE
+    if not path.exists():
+        raise FileNotFoundError(f"No feature pipeline at {path} "
+                                f"(train the models first, e.g. python -m scoutsense.scripts.demo)")
+    pipeline = FeaturePipeline.load(path)
+    stale = [type(model).__name__ for model in models if model.data_hash != pipeline.data_hash]
+    if stale:
+        raise ValueError(f"Feature pipeline {path} was not fit on the training data of "
+                         f"{', '.join(stale)} (retrain the models to refit it)")
+    return pipeline
+
+
+def load_scoring_models(artifact_dir=DEFAULT_ARTIFACT_DIR, success_threshold=5, engine=DEFAULT_PREDICTOR_ENGINE):
+    """
+    Load the persisted predictor and classifier without retraining
+
+    Returns:
+        Tuple of (DraftPositionPredictor, PlayerSuccessClassifier)
+    """
+    specs = {kind: path for kind, _, path, _, _ in _model_specs(Path(artifact_dir), success_threshold, engine)}
+    missing = [str(specs[kind]) for kind in ('predictor', 'classifier') if not specs[kind].exists()]
+    if missing:
+        raise FileNotFoundError(f"No trained model artifacts at {', '.join(missing)} "
+                                f"(train them first, e.g. python -m scoutsense.scripts.demo)")
+    return DraftPositionPredictor.load(specs['predictor']), PlayerSuccessClassifier.load(specs['classifier'])
+
+
+def load_comparator(artifact_dir=DEFAULT_ARTIFACT_DIR):
+    """
+    Load the persisted PlayerComparison, with its precomputed neighbor table if one was saved
+
+    Returns:
+        PlayerComparison
+    """
+    artifact_dir = Path(artifact_dir)
+    path = artifact_dir / 'player_comparison.joblib'
+    if not path.exists():
+        raise FileNotFoundError(f"No trained model artifact at {path} "
+                                f"(train it first, e.g. python -m scoutsense.scripts.demo)")
+    comparator = PlayerComparison.load(path)
+    comparator.load_neighbor_table(artifact_dir / NEIGHBOR_TABLE_DIR)
+    return comparator
+
+
+def _with_model_columns(features, models, fill_missing=False):
+    """
+    features, checked to hold every column the models were trained on
+
+    Args:
+        features: Pipeline output
+        models: Models about to score features
+        fill_missing: Instead of failing, add each missing column set to its
+                      training median (0 where there is none) and log which were filled
+
+    Raises:
+        ValueError: Listing the missing columns, unless fill_missing
+    """
+    missing = []
+    for model in models:
+        missing += [col for col in model.feature_cols if col not in features.columns and col not in missing]
+    if not missing:
+        return features
+    if not fill_missing:
+        raise ValueError(f"Features missing columns the models were trained on: {', '.join(missing)}")
+    fills = {}
+    for col in missing:
+        model = next(model for model in models if col in model.feature_cols)
+        fill = model.fill_values.get(col) if model.fill_values is not None else None
+        fills[col] = 0 if fill is None or pd.isna(fill) else fill
+    print(f"Warning: Filling missing feature columns with training values: "
+          f"{', '.join(f'{col}={value:g}' for col, value in fills.items())}")
+    return features.assign(**fills)
+
+
+class _ChunkWriter:
+    """Append DataFrame chunks to a CSV or Parquet file"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.parquet = self.path.suffix.lower() in ('.parquet', '.pq')
+        self._writer = None
+        self._first = True
+
+    def write(self, chunk):
+        if self.parquet:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if self._writer is None:
+                self._writer = pq.ParquetWriter(self.path, table.schema)
+            self._writer.write_table(table.cast(self._writer.schema))
+        else:
+            chunk.to_csv(self.path, mode='w' if self._first else 'a', header=self._first, index=False)
+        self._first = False
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+
+
+def score_file(input_path, output_path, artifact_dir=DEFAULT_ARTIFACT_DIR, chunk_size=50000,
+               success_threshold=5, engine=DEFAULT_PREDICTOR_ENGINE, fill_missing=False):
+    """
+    Score every prospect in input_path and write the predictions to output_path
+
+    Rows are read, engineered and scored chunk_size at a time, so memory stays
+    bounded by the chunk size rather than the file size.
+
+    Args:
+        input_path: Prospect file (.csv or .parquet) with the raw draft columns
+        output_path: Destination (.csv or .parquet); gets the OUTPUT_ID_COLS present
+                     in the input plus predicted_pick and success_probability
+        artifact_dir: Directory holding the persisted models and feature pipeline
+        chunk_size: Rows per chunk
+        success_threshold: Round threshold of the classifier artifact to use
+        engine: PREDICTOR_ENGINES backend of the predictor artifact to use
+        fill_missing: Fill model feature columns the pipeline does not produce
+                      instead of failing (see _with_model_columns)
+
+    Returns:
+        Tuple of (rows scored, {stage: seconds} for SCORING_STAGES)
+    """
+    predictor, classifier = load_scoring_models(artifact_dir, success_threshold, engine)
+    pipeline = load_feature_pipeline(artifact_dir, (predictor, classifier))
+
+    timings = dict.fromkeys(SCORING_STAGES, 0.0)
+    n_rows = 0
+    writer = _ChunkWriter(output_path)
+    chunks = iter_draft_chunks(input_path, chunk_size)
+    try:
+        while True:
+            start = time.perf_counter()
+            chunk = next(chunks, None)
+            timings['read'] += time.perf_counter() - start
+            if chunk is None:
+                break
+
+            start = time.perf_counter()
+            features = _with_model_columns(pipeline.transform(chunk, inplace=True), (predictor, classifier),
+                                           fill_missing)
+            timings['features'] += time.perf_counter() - start
+
+            start = time.perf_counter()
+            picks = predictor.predict_batch(features)
+            timings['predictor'] += time.perf_counter() - start
+
+            start = time.perf_counter()
+            probas = classifier.predict_proba_batch(features)
+            timings['classifier'] += time.perf_counter() - start
+
+            start = time.perf_counter()
+            output = pd.DataFrame({col: features[col].astype('string')
+                                   for col in OUTPUT_ID_COLS if col in features.columns})
+            output['predicted_pick'] = picks.astype(np.int64)
+            output['success_probability'] = probas.astype(np.float64)
+            writer.write(output)
+            timings['write'] += time.perf_counter() - start
+
+            n_rows += len(chunk)
+            print(f"  Scored {n_rows} rows...")
+    finally:
+        writer.close()
+
+    return n_rows, timings
+
+
+def format_timings(n_rows, timings):
+    """Per-stage timing table with overall throughput"""
+    total = sum(timings.values())
+    lines = [f"{'Stage':<12} {'Seconds':>9} {'Share':>7} {'Rows/sec':>12}", "-" * 43]
+    for stage, secs in timings.items():
+        share = secs / total if total > 0 else 0.0
+        rate = n_rows / secs if secs > 0 else float('inf')
+        lines.append(f"{stage:<12} {secs:>9.3f} {share:>7.1%} {rate:>12,.0f}")
+    lines.append("-" * 43)
+    rate = n_rows / total if total > 0 else float('inf')
+    lines.append(f"{'total':<12} {total:>9.3f} {1:>7.1%} {rate:>12,.0f}")
+    return "\n".join(lines)
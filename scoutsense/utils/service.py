@@ -0,0 +1,322 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Prediction Service
+Local HTTP server (stdlib ThreadingHTTPServer) that loads the persisted
+DraftPositionPredictor, PlayerSuccessClassifier and PlayerComparison once and
+serves predictions and player comps. Concurrent /predict requests are coalesced
+by a MicroBatcher so the ensembles score one frame per batch, not one row per request.
+
+Endpoints:
+    GET  /health                               -> {"status": "ok"}
+    GET  /stats                                -> request/batch counters
+    POST /predict   body: prospect or [prospects] -> [{"predicted_pick", "success_probability"}, ...]
+    GET  /similar?name=...&n=5&position_only=1 -> [{"name", "pos", ..., "similarity_score"}, ...]
+                                                  (n in 1..MAX_SIMILAR; [] if the player has no comps)
+"""
+
+import json
+import math
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+import pandas as pd
+
+from .data_loader import normalize_draft_columns
+from .models import DEFAULT_ARTIFACT_DIR, DEFAULT_PREDICTOR_ENGINE
+from .scoring import _with_model_columns, load_comparator, load_feature_pipeline, load_scoring_models
+
+# Coalescing defaults: a batch is scored once it holds this many rows or its
+# oldest request has waited this long, whichever comes first
+DEFAULT_MAX_BATCH_ROWS = 256
+DEFAULT_MAX_WAIT_MS = 5.0
+
+# Player columns returned by /similar
+SIMILAR_COLS = ['name', 'pos', 'college', 'draft_pick', 'draft_round', 'similarity_score']
+
+# Most comps returned by one /similar request
+MAX_SIMILAR = 100
+
+# Largest accepted request body
+MAX_BODY_BYTES = 10 * 1024 * 1024
+
+
+class MicroBatcher:
+    """
+    Coalesce concurrent scoring requests into batches scored by one call.
+
+    submit() enqueues a request's rows and returns a Future; a single worker
+    thread drains the queue until max_batch_rows rows are pending or the
+    oldest request has waited max_wait_ms, calls score_batch once on all of
+    them and hands every request back its own slice of the results.
+    """
+
+    def __init__(self, score_batch, max_batch_rows=DEFAULT_MAX_BATCH_ROWS, max_wait_ms=DEFAULT_MAX_WAIT_MS):
+        """
+        Args:
+            score_batch: Function taking a list of records and returning one result per record
+            max_batch_rows: Rows at which a batch is scored without waiting further
+            max_wait_ms: Longest a request waits for others to join its batch
+        """
+        self.score_batch = score_batch
+        self.max_batch_rows = max(1, int(max_batch_rows))
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+        self.requests = 0
+        self.batches = 0
+        self.rows = 0
+        self._queue = queue.Queue()
+        self._worker = threading.Thread(target=self._run, name='micro-batcher', daemon=True)
+        self._worker.start()
+
+    def submit(self, records):
+        """
+        Queue records for scoring
+
+        Args:
+            records: List of records (scored together with other pending requests)
+
+        Returns:
+            concurrent.futures.Future resolving to the list of results for records
+        """
+        future = Future()
+        self._queue.put((list(records), future))
+        return future
+
+    def close(self):
+        """Stop the worker once the requests already queued are scored"""
+        self._queue.put(None)
+        self._worker.join()
+
+    def _collect(self, first):
+        """Pending requests starting with first, up to the row limit or the wait deadline"""
+        batch = [first]
+        n_rows = len(first[0])
+        deadline = time.monotonic() + self.max_wait
+        while n_rows < self.max_batch_rows:
+            timeout = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                self._queue.put(None)  # Seen again by _run once this batch is done
+                break
+            batch.append(item)
+            n_rows += len(item[0])
+        return batch
+
+    def _run(self):
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch = self._collect(first)
+            records = [record for request, _ in batch for record in request]
+            self.requests += len(batch)
+            self.batches += 1
+            self.rows += len(records)
+            try:
+                results = self.score_batch(records)
+            except Exception:
+                # One malformed request must not fail the others: score them one by one
+                for request, future in batch:
+                    self._score_alone(request, future)
+                continue
+            start = 0
+            for request, future in batch:
+                future.set_result(list(results[start:start + len(request)]))
+                start += len(request)
+
+    def _score_alone(self, records, future):
+        try:
+            future.set_result(list(self.score_batch(records)))
+        except Exception as e:
+            future.set_exception(e)
+
+    def stats(self):
+        """Request, batch and row counters, with the mean rows per batch"""
+        return {
+            'requests': self.requests,
+            'batches': self.batches,
+            'rows': self.rows,
+            'mean_batch_rows': self.rows / self.batches if self.batches else 0.0,
+            'max_batch_rows': self.max_batch_rows,
+            'max_wait_ms': self.max_wait * 1000,
+        }
+
+
+def _json_value(value):
+    """value as a JSON-serializable Python scalar (NaN/NA -> None)"""
+    if isinstance(value, np.generic):
+        value = value.item()
+    if value is pd.NA or value is pd.NaT or (isinstance(value, float) and math.isnan(value)):
+        return None
+    return value
+
+
+class PredictionService:
+    """The persisted models, loaded once, behind thread-safe predict/similar calls"""
+
+    def __init__(self, artifact_dir=DEFAULT_ARTIFACT_DIR, success_threshold=5, engine=DEFAULT_PREDICTOR_ENGINE,
+                 fill_missing=False, max_batch_rows=DEFAULT_MAX_BATCH_ROWS, max_wait_ms=DEFAULT_MAX_WAIT_MS):
+        """
+        Args:
+            artifact_dir: Directory holding the persisted models and feature pipeline
+            success_threshold: Round threshold of the classifier artifact to use
+            engine: PREDICTOR_ENGINES backend of the predictor artifact to use
+            fill_missing: Fill model feature columns the pipeline does not produce
+                          instead of failing each request
+            max_batch_rows: MicroBatcher row limit (1 disables coalescing)
+            max_wait_ms: MicroBatcher wait deadline
+        """
+        self.predictor, self.classifier = load_scoring_models(artifact_dir, success_threshold, engine)
+        self.pipeline = load_feature_pipeline(artifact_dir, (self.predictor, self.classifier))
+        self.fill_missing = fill_missing
+        self.comparator = load_comparator(artifact_dir)
+        self.batcher = MicroBatcher(self._score_prospects, max_batch_rows, max_wait_ms)
+
+    def _score_prospects(self, records):
+        """Score a batch of raw prospect records in one vectorized pass"""
+        raw = normalize_draft_columns(pd.DataFrame.from_records(records))
+        features = _with_model_columns(self.pipeline.transform(raw, inplace=True), (self.predictor, self.classifier),
+                                       self.fill_missing)
+        picks = self.predictor.predict_batch(features)
+        probas = self.classifier.predict_proba_batch(features)
+        return [{'predicted_pick': int(pick), 'success_probability': float(proba)}
+                for pick, proba in zip(picks, probas)]
+
+    def predict(self, records, timeout=None):
+        """
+        Predicted pick and success probability for each prospect record
+
+        Args:
+            records: List of dicts of raw prospect columns (as in the draft CSV)
+            timeout: Seconds to wait for the batch holding these records
+
+        Returns:
+            List of {'predicted_pick', 'success_probability'} dicts, one per record
+        """
+        if not records:
+            return []
+        return self.batcher.submit(records).result(timeout)
+
+    def similar(self, name, n_similar=5, position_only=False):
+        """
+        Most similar historical players to name
+
+        Args:
+            name: Player name: an exact (normalized) name or a prefix only one player matches
+            n_similar: Number of comps to return (at least 1)
+            position_only: Only compare within the player's position
+
+        Returns:
+            List of dicts of SIMILAR_COLS (empty if the player has no comps), or None
+            if no player has that name or the prefix is ambiguous (never a fuzzy match)
+        """
+        if n_similar < 1:
+            raise ValueError(f"n_similar must be at least 1, got {n_similar}")
+        player_idx = self.comparator.index.find(name)
+        if player_idx is None:
+            return None
+        result = self.comparator.find_similar_players(player_idx, n_similar, position_only, verbose=False)
+        cols = [col for col in SIMILAR_COLS if col in result.columns]
+        return [{col: _json_value(value) for col, value in zip(cols, row)}
+                for row in result[cols].itertuples(index=False)]
+
+    def stats(self):
+        return self.batcher.stats()
+
+    def close(self):
+        self.batcher.close()
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """JSON endpoints over the server's PredictionService"""
+
+    protocol_version = 'HTTP/1.1'  # Keep-alive, so load generators can reuse connections
+
+    def log_message(self, format, *args):
+        pass  # One line per request would dominate the service's own time
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _error(self, status, message):
+        self._send_json(status, {'error': message})
+
+    def do_GET(self):
+        try:
+            self._get(urlparse(self.path))
+        except Exception as e:
+            self._error(500, f"Internal error: {e}")
+
+    def _get(self, url):
+        service = self.server.service
+        if url.path == '/health':
+            self._send_json(200, {'status': 'ok'})
+        elif url.path == '/stats':
+            self._send_json(200, service.stats())
+        elif url.path == '/similar':
+            params = parse_qs(url.query)
+            name = params.get('name', [''])[0]
+            if not name:
+                return self._error(400, "Missing 'name' query parameter")
+            try:
+                n_similar = int(params.get('n', ['5'])[0])
+            except ValueError:
+                return self._error(400, "'n' must be an integer")
+            if not 1 <= n_similar <= MAX_SIMILAR:
+                return self._error(400, f"'n' must be between 1 and {MAX_SIMILAR}")
+            position_only = params.get('position_only', ['0'])[0].lower() in ('1', 'true', 'yes')
+            players = service.similar(name, n_similar, position_only)
+            if players is None:
+                return self._error(404, f"Player not found: {name}")
+            self._send_json(200, players)
+        else:
+            self._error(404, f"Unknown endpoint: {url.path}")
+
+    def do_POST(self):
+        if urlparse(self.path).path != '/predict':
+            return self._error(404, f"Unknown endpoint: {self.path}")
+        length = int(self.headers.get('Content-Length') or 0)
+        if length > MAX_BODY_BYTES:
+            return self._error(413, f"Request body over {MAX_BODY_BYTES} bytes")
+        try:
+            payload = json.loads(self.rfile.read(length) or b'null')
+        except ValueError as e:
+            return self._error(400, f"Invalid JSON: {e}")
+        records = [payload] if isinstance(payload, dict) else payload
+        if not isinstance(records, list) or not all(isinstance(r, dict) for r in records):
+            return self._error(400, "Body must be a prospect object or a list of them")
+        try:
+            self._send_json(200, self.server.service.predict(records))
+        except Exception as e:
+            self._error(422, f"Could not score prospects: {e}")
+
+
+def make_server(service, host='127.0.0.1', port=8765):
+    """
+    HTTP server for service (serve with serve_forever(), stop with shutdown())
+
+    Args:
+        service: PredictionService
+        host: Interface to bind
+        port: Port to bind (0 picks a free one)
+
+    Returns:
+        ThreadingHTTPServer
+    """
+    server = ThreadingHTTPServer((host, port), _RequestHandler)
+    server.daemon_threads = True
+    server.service = service
+    return server
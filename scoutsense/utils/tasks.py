@@ -0,0 +1,192 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Background Task Executor
+Worker pool for running loading, scoring and search work off a UI thread
+"""
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class TaskCancelled(Exception):
+    """Raised inside a task (via TaskContext.check) once it has been superseded or cancelled"""
+
+
+class NotifyingQueue(queue.Queue):
+    """
+    Queue that calls notify() when a message arrives on an idle queue.
+
+    notify fires once per batch: after it has fired, further puts stay quiet
+    until the consumer calls drain(), so a burst of progress messages wakes
+    the consumer once instead of once per message.
+    """
+
+    def __init__(self, notify=None):
+        """
+        Args:
+            notify: Callable invoked from the producing thread (can be set later)
+        """
+        super().__init__()
+        self.notify = notify
+        self._notify_lock = threading.Lock()
+        self._armed = False
+
+    def put(self, item, block=True, timeout=None):
+        super().put(item, block, timeout)
+        with self._notify_lock:
+            if self._armed or self.notify is None:
+                return
+            self._armed = True
+        try:
+            self.notify()
+        except Exception:
+            # Consumer not reachable (e.g. shutting down); let the next put retry
+            with self._notify_lock:
+                self._armed = False
+
+    def drain(self, max_items=None):
+        """
+        Remove and return up to max_items queued messages, re-arming notification
+
+        Returns:
+            List of messages in arrival order
+        """
+        with self._notify_lock:
+            self._armed = False
+        items = []
+        while max_items is None or len(items) < max_items:
+            try:
+                items.append(self.get_nowait())
+            except queue.Empty:
+                break
+        return items
+
+
+class TaskContext:
+    """Handle passed to each task for cancellation checks and progress reporting"""
+
+    def __init__(self, key, result_queue):
+        self.key = key
+        self._queue = result_queue
+        self._cancelled = threading.Event()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def check(self):
+        """Raise TaskCancelled if this task should stop early"""
+        if self.cancelled:
+            raise TaskCancelled(self.key)
+
+    def progress(self, percent=None, status=None):
+        """Report progress through the result queue (ignored once cancelled)"""
+        if self.cancelled:
+            return
+        if status is not None:
+            self._queue.put(("status", status))
+        if percent is not None:
+            self._queue.put(("progress", percent))
+
+
+class TaskExecutor:
+    """
+    Keyed background task runner that delivers results through a queue.
+
+    Tasks are submitted under a key ("load", "predict", ...). Submitting a
+    key that is already running cancels the running task and queues the new
+    one behind it; submitting again before it starts replaces it, so bursts
+    of repeated requests coalesce into a single run of the latest one.
+
+    Results are never handled on the worker thread: each finished task puts
+    ("result", on_done, value) or ("task_error", on_error, exception) on the
+    result queue for the owner's main thread to dispatch. Results of
+    cancelled tasks are dropped; a task stopped by cancel() or shutdown()
+    instead puts ("task_cancelled", on_cancel, TaskCancelled) so its owner can
+    undo any "in progress" state. A task superseded by a newer submission
+    under its key gets no callback: the newer task's callbacks take over.
+    """
+
+    def __init__(self, result_queue, max_workers=2):
+        """
+        Args:
+            result_queue: queue.Queue read by the UI thread
+            max_workers: Number of worker threads
+        """
+        self._queue = result_queue
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scoutsense-task")
+        self._lock = threading.Lock()
+        self._running = {}  # key -> TaskContext
+        self._pending = {}  # key -> (fn, on_done, on_error, on_cancel)
+
+    def submit(self, key, fn, on_done=None, on_error=None, on_cancel=None):
+        """
+        Run fn(ctx) in the background under key.
+
+        Args:
+            key: Coalescing key; a newer submission supersedes an older one
+            fn: Callable taking a TaskContext and returning the result
+            on_done: Called on the main thread with the result
+            on_error: Called on the main thread with the exception
+            on_cancel: Called on the main thread with TaskCancelled if the task
+                       is stopped by cancel() or shutdown()
+        """
+        with self._lock:
+            running = self._running.get(key)
+            if running is not None:
+                running.cancel()
+                self._pending[key] = (fn, on_done, on_error, on_cancel)
+                return
+            self._start(key, fn, on_done, on_error, on_cancel)
+
+    def cancel(self, key):
+        """Cancel the running and any pending task for key"""
+        with self._lock:
+            self._pending.pop(key, None)
+            running = self._running.get(key)
+            if running is not None:
+                running.cancel()
+
+    def is_running(self, key):
+        with self._lock:
+            return key in self._running
+
+    def shutdown(self):
+        """Cancel everything and stop accepting work"""
+        with self._lock:
+            self._pending.clear()
+            for ctx in self._running.values():
+                ctx.cancel()
+        self._pool.shutdown(wait=False)
+
+    def _start(self, key, fn, on_done, on_error, on_cancel):
+        """Start a task (caller holds the lock)"""
+        ctx = TaskContext(key, self._queue)
+        self._running[key] = ctx
+        self._pool.submit(self._run, ctx, fn, on_done, on_error, on_cancel)
+
+    def _run(self, ctx, fn, on_done, on_error, on_cancel):
+        try:
+            result = fn(ctx)
+        except TaskCancelled:
+            pass
+        except Exception as e:
+            if not ctx.cancelled:
+                self._queue.put(("task_error", on_error, e))
+        else:
+            if not ctx.cancelled:
+                self._queue.put(("result", on_done, result))
+        finally:
+            with self._lock:
+                del self._running[ctx.key]
+                pending = self._pending.pop(ctx.key, None)
+                if pending is not None:
+                    self._start(ctx.key, *pending)
+            # Cancelled outright rather than superseded
+            if ctx.cancelled and pending is None and on_cancel is not None:
+                self._queue.put(("task_cancelled", on_cancel, TaskCancelled(ctx.key)))